@@ -7,25 +7,34 @@ import pandas as pd
 
 
 class ForexBacktestingStrategy(Strategy):
-    """Generic backtesting strategy that uses execute_buy and execute_sell signals."""
+    """Generic backtesting strategy that uses execute_buy and execute_sell signals.
+
+    Prefers the int8 ``has_buy`` / ``has_sell`` masks added by
+    ``BaseForexStrategy.execute`` and falls back to the NaN-sentinel
+    price columns when the masks are absent.
+    """
 
     def init(self):
         super().init()
 
+    def _signal(self, mask_col: str, price_col: str) -> bool:
+        """Return whether the current bar carries a signal."""
+        if hasattr(self.data, mask_col):
+            return bool(getattr(self.data, mask_col)[-1])
+        if hasattr(self.data, price_col):
+            return not pd.isna(getattr(self.data, price_col)[-1])
+        return False
+
     def next(self):
         super().next()
 
         # Check for buy signal
-        if hasattr(self.data, "execute_buy"):
-            buy_signal = self.data.execute_buy[-1]
-            if not pd.isna(buy_signal):
-                if not self.position or not self.position.is_long:
-                    self.buy()
+        if self._signal("has_buy", "execute_buy"):
+            if not self.position or not self.position.is_long:
+                self.buy()
 
         # Check for sell signal
-        if hasattr(self.data, "execute_sell"):
-            sell_signal = self.data.execute_sell[-1]
-            if not pd.isna(sell_signal):
-                if not self.position or not self.position.is_short:
-                    self.sell()
+        if self._signal("has_sell", "execute_sell"):
+            if not self.position or not self.position.is_short:
+                self.sell()
 
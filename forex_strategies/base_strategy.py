@@ -62,6 +62,9 @@ class BaseForexStrategy(ABC):
         clean_df["High"] = clean_df.high
         clean_df["Low"] = clean_df.low
 
+        # Compact signal representation for the backtester inner loop
+        self._quantize_signals(clean_df)
+
         # Ensure the index is suitable for Backtest statistics.
         # The `backtesting` library expects either a numeric index or a
         # `pd.DatetimeIndex` to compute drawdown durations correctly. Many of
@@ -95,6 +98,32 @@ class BaseForexStrategy(ABC):
 
         return stats, marker_fn
 
+    @staticmethod
+    def _quantize_signals(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add int8 signal masks and downcast signal prices to float32 in place.
+
+        Adds ``has_buy`` / ``has_sell`` (1 where a signal exists, else 0) so
+        the backtester can test a dense int8 flag instead of a NaN sentinel.
+        float32 is ample precision for FX entry prices.
+
+        Args:
+            df: DataFrame with 'execute_buy' / 'execute_sell' columns
+
+        Returns:
+            The same DataFrame with the mask columns added
+        """
+        for price_col, mask_col in (
+            ("execute_buy", "has_buy"),
+            ("execute_sell", "has_sell"),
+        ):
+            if price_col not in df.columns:
+                continue
+            prices = df[price_col].to_numpy(dtype=np.float64)
+            df[mask_col] = (~np.isnan(prices)).astype(np.int8)
+            df[price_col] = prices.astype(np.float32)
+        return df
+
     def _create_marker_function(self, df: pd.DataFrame):
         """Create a function that adds strategy markers to a plotly figure."""
         import plotly.graph_objects as go
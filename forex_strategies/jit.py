@@ -0,0 +1,27 @@
+"""
+Optional Numba JIT support for strategy kernels.
+
+Numba is an optional dependency. When it is not installed, ``njit`` falls
+back to a no-op decorator so the kernels run as plain Python/NumPy code.
+
+Kernels should be module-level functions declared with an explicit
+signature and ``cache=True`` (e.g. ``@njit("float64[:](float64[:])",
+cache=True)``) so they compile eagerly at import time and are reused from
+the on-disk cache, instead of paying JIT latency on the first call.
+"""
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit``."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
@@ -4,12 +4,183 @@ Pattern-based trading strategy.
 Detects chart patterns (Head & Shoulders, Triangles, Rectangles, etc.) and generates
 trading signals based on pattern completion.
 """
+import hashlib
 import pandas as pd
 import numpy as np
 import collections
-from scipy.signal import argrelextrema
 from statsmodels.nonparametric.kernel_regression import KernelReg
 from forex_strategies.base_strategy import BaseForexStrategy
+from forex_strategies.jit import njit
+
+
+@njit("Tuple((int64[:], int64[:]))(float64[:])", cache=True)
+def _local_extrema(a):
+    """
+    Single-pass scan for strict local maxima and minima.
+
+    Equivalent to ``argrelextrema(a, np.greater)`` and
+    ``argrelextrema(a, np.less)`` with ``order=1``; endpoints and plateaus
+    are never reported.
+
+    Returns:
+        Tuple of (max_positions, min_positions) as int64 arrays
+    """
+    n = len(a)
+    maxima = np.empty(n, np.int64)
+    minima = np.empty(n, np.int64)
+    n_max = 0
+    n_min = 0
+    for i in range(1, n - 1):
+        prev = a[i - 1]
+        cur = a[i]
+        nxt = a[i + 1]
+        if cur > prev and cur > nxt:
+            maxima[n_max] = i
+            n_max += 1
+        elif cur < prev and cur < nxt:
+            minima[n_min] = i
+            n_min += 1
+    return maxima[:n_max], minima[:n_min]
+
+
+# Order of the per-pattern buffers returned by _classify_patterns
+PATTERN_NAMES = ("HS", "IHS", "TTOP", "TBOT", "RTOP", "RBOT")
+
+
+@njit(
+    "UniTuple(int64[:], 6)(float64[:], int64[:], int64)",
+    cache=True,
+    error_model="numpy",
+)
+def _classify_patterns(vals, positions, max_bars):
+    """
+    Classify every 5-extrema window into one of the chart patterns.
+
+    Windows span ``vals[i - 5 : i]``. A window is skipped when both of its
+    end extrema have a known position (>= 0) and they lie more than
+    ``max_bars`` bars apart.
+
+    Returns:
+        One int64 array of window end indices ``i`` per pattern, in
+        ``PATTERN_NAMES`` order
+    """
+    n = len(vals)
+    hs = np.empty(n, np.int64)
+    ihs = np.empty(n, np.int64)
+    ttop = np.empty(n, np.int64)
+    tbot = np.empty(n, np.int64)
+    rtop = np.empty(n, np.int64)
+    rbot = np.empty(n, np.int64)
+    n_hs = 0
+    n_ihs = 0
+    n_ttop = 0
+    n_tbot = 0
+    n_rtop = 0
+    n_rbot = 0
+
+    for i in range(5, n):
+        # Pattern must play out within max_bars
+        start_pos = positions[i - 5]
+        end_pos = positions[i - 1]
+        if start_pos >= 0 and end_pos >= 0 and abs(end_pos - start_pos) > max_bars:
+            continue
+
+        e1 = vals[i - 5]
+        e2 = vals[i - 4]
+        e3 = vals[i - 3]
+        e4 = vals[i - 2]
+        e5 = vals[i - 1]
+
+        rtop_g1 = (e1 + e3 + e5) / 3.0
+        rtop_g2 = (e2 + e4) / 2.0
+        shoulder_tol = 0.03 * ((e1 + e5) / 2.0)
+
+        # Head and Shoulders (bearish)
+        if (
+            (e1 > e2)
+            and (e3 > e1)
+            and (e3 > e5)
+            and (abs(e1 - e5) <= shoulder_tol)
+            and (abs(e2 - e4) <= shoulder_tol)
+        ):
+            hs[n_hs] = i
+            n_hs += 1
+
+        # Inverse Head and Shoulders (bullish)
+        elif (
+            (e1 < e2)
+            and (e3 < e1)
+            and (e3 < e5)
+            and (abs(e1 - e5) <= shoulder_tol)
+            and (abs(e2 - e4) <= shoulder_tol)
+        ):
+            ihs[n_ihs] = i
+            n_ihs += 1
+
+        # Triangle Top (bearish)
+        elif (e1 > e2) and (e1 > e3) and (e3 > e5) and (e2 < e4):
+            ttop[n_ttop] = i
+            n_ttop += 1
+
+        # Triangle Bottom (bullish)
+        elif (e1 < e2) and (e1 < e3) and (e3 < e5) and (e2 > e4):
+            tbot[n_tbot] = i
+            n_tbot += 1
+
+        # Rectangle Top (bearish)
+        elif (
+            (e1 > e2)
+            and (abs(e1 - rtop_g1) / rtop_g1 < 0.0075)
+            and (abs(e3 - rtop_g1) / rtop_g1 < 0.0075)
+            and (abs(e5 - rtop_g1) / rtop_g1 < 0.0075)
+            and (abs(e2 - rtop_g2) / rtop_g2 < 0.0075)
+            and (abs(e4 - rtop_g2) / rtop_g2 < 0.0075)
+            and (min(e1, e3, e5) > max(e2, e4))
+        ):
+            rtop[n_rtop] = i
+            n_rtop += 1
+
+        # Rectangle Bottom (bullish)
+        elif (
+            (e1 < e2)
+            and (abs(e1 - rtop_g1) / rtop_g1 < 0.0075)
+            and (abs(e3 - rtop_g1) / rtop_g1 < 0.0075)
+            and (abs(e5 - rtop_g1) / rtop_g1 < 0.0075)
+            and (abs(e2 - rtop_g2) / rtop_g2 < 0.0075)
+            and (abs(e4 - rtop_g2) / rtop_g2 < 0.0075)
+            and (max(e1, e3, e5) > min(e2, e4))
+        ):
+            rbot[n_rbot] = i
+            n_rbot += 1
+
+    return (
+        hs[:n_hs],
+        ihs[:n_ihs],
+        ttop[:n_ttop],
+        tbot[:n_tbot],
+        rtop[:n_rtop],
+        rbot[:n_rbot],
+    )
+
+
+# Smoothed extrema depend only on the price data, and the kernel regression
+# behind them is by far the most expensive step, so they are memoized across
+# strategy instances (e.g. PatternStrategy and PatternTriangleStrategy run on
+# the same frame by StrategyTester).
+_EXTREMA_CACHE_SIZE = 4
+_extrema_cache: "collections.OrderedDict[tuple, pd.Series]" = collections.OrderedDict()
+
+
+def clear_extrema_cache():
+    """Drop all memoized extrema."""
+    _extrema_cache.clear()
+
+
+def _extrema_cache_key(df: pd.DataFrame, price_column: str) -> tuple:
+    """Key identifying the price series (values and index) used for extrema."""
+    hashed = pd.util.hash_pandas_object(df[price_column], index=True)
+    digest = hashlib.blake2b(hashed.to_numpy().tobytes(), digest_size=16).hexdigest()
+    return price_column, len(df), digest
 
 
 class PatternStrategy(BaseForexStrategy):
@@ -35,6 +206,20 @@ class PatternStrategy(BaseForexStrategy):
         self.min_distance = min_distance
 
     def _find_extrema(self, df: pd.DataFrame, price_column: str = "close"):
+        """Find local extrema, reusing memoized results for identical prices."""
+        key = _extrema_cache_key(df, price_column)
+        extrema = _extrema_cache.get(key)
+        if extrema is not None:
+            _extrema_cache.move_to_end(key)
+            return extrema
+
+        extrema = self._compute_extrema(df, price_column)
+        _extrema_cache[key] = extrema
+        if len(_extrema_cache) > _EXTREMA_CACHE_SIZE:
+            _extrema_cache.popitem(last=False)
+        return extrema
+
+    def _compute_extrema(self, df: pd.DataFrame, price_column: str = "close"):
         """Find local extrema using kernel regression smoothing."""
         # Ensure numeric series
         series = pd.to_numeric(df[price_column], errors="coerce").copy()
@@ -45,42 +230,35 @@ class PatternStrategy(BaseForexStrategy):
             pd.to_numeric(series), df.index, var_type="c", bw=[0.85]
         )
         f = kr.fit([df.index.values])
-        smooth_prices = pd.Series(data=f[0], index=df.index)
 
         # Find extrema in smoothed prices
-        smoothed_local_max = argrelextrema(smooth_prices.values, np.greater)[0]
-        smoothed_local_min = argrelextrema(smooth_prices.values, np.less)[0]
+        smoothed_local_max, smoothed_local_min = _local_extrema(
+            np.asarray(f[0], dtype=np.float64)
+        )
+
+        # Map back to original price extrema: the actual max/min of the raw
+        # prices in the 4-bar window [i - 2, i + 2) around each smoothed one
+        prices = pd.to_numeric(df[price_column]).to_numpy(dtype=np.float64)
+        offsets = np.arange(-2, 2)
+
+        def _window_positions(centers, pick):
+            centers = centers[(centers > 1) & (centers < len(df) - 1)]
+            windows = centers[:, None] + offsets
+            return windows[:, 0] + pick(prices[windows], axis=1)
+
+        positions = np.sort(
+            np.concatenate(
+                [
+                    _window_positions(smoothed_local_min, np.nanargmin),
+                    _window_positions(smoothed_local_max, np.nanargmax),
+                ]
+            ),
+            kind="stable",
+        )
 
-        # Map back to original price extrema
-        local_max_min = np.sort(
-            np.concatenate([smoothed_local_max, smoothed_local_min])
+        return pd.Series(
+            prices[positions], index=df.index[positions], name=price_column
         )
-        smooth_extrema = smooth_prices.loc[local_max_min]
-
-        # Get actual price extrema
-        price_local_max_dt = []
-        for i in smoothed_local_max:
-            if (i > 1) and (i < len(df) - 1):
-                price_local_max_dt.append(
-                    pd.to_numeric(df[price_column]).iloc[i - 2 : i + 2].idxmax()
-                )
-
-        price_local_min_dt = []
-        for i in smoothed_local_min:
-            if (i > 1) and (i < len(df) - 1):
-                price_local_min_dt.append(
-                    pd.to_numeric(df[price_column]).iloc[i - 2 : i + 2].idxmin()
-                )
-
-        # Combine and sort
-        max_min = pd.concat(
-            [
-                pd.to_numeric(df.loc[price_local_min_dt, price_column]),
-                pd.to_numeric(df.loc[price_local_max_dt, price_column]),
-            ]
-        ).sort_index()
-
-        return max_min
 
     def _find_patterns(self, extrema: pd.Series, df: pd.DataFrame = None):
         """Detect chart patterns from extrema.
@@ -91,92 +269,25 @@ class PatternStrategy(BaseForexStrategy):
         """
         patterns = collections.defaultdict(list)
 
+        # Positions of the extrema in the original DataFrame for the max_bars
+        # check; -1 disables the check for that extremum (as does omitting df,
+        # which avoids dtype promotion issues with datetime index subtraction)
+        if df is not None and df.index.is_unique:
+            positions = df.index.get_indexer(extrema.index).astype(np.int64)
+        else:
+            positions = np.full(len(extrema), -1, dtype=np.int64)
+
         # Need at least 5 extrema for pattern generation
-        for i in range(5, len(extrema)):
-            window = extrema.iloc[i - 5 : i]
-
-            # Pattern must play out within max_bars
-            if df is not None:
-                # Count actual bars between first and last extrema in the original DataFrame
-                start_idx = window.index[0]
-                end_idx = window.index[-1]
-                try:
-                    # Find the positions of these indices in the original DataFrame
-                    start_pos = df.index.get_loc(start_idx)
-                    end_pos = df.index.get_loc(end_idx)
-                    bar_count = abs(end_pos - start_pos)
-                    if bar_count > self.max_bars:
-                        continue
-                except (KeyError, TypeError):
-                    # If indices don't match, skip the check
-                    pass
-            else:
-                # If DataFrame not provided, skip the max_bars check
-                # This avoids dtype promotion issues with datetime index subtraction
-                pass
-
-            e1, e2, e3, e4, e5 = (
-                window.iloc[0],
-                window.iloc[1],
-                window.iloc[2],
-                window.iloc[3],
-                window.iloc[4],
-            )
-
-            rtop_g1 = np.mean([e1, e3, e5])
-            rtop_g2 = np.mean([e2, e4])
-
-            # Head and Shoulders (bearish)
-            if (
-                (e1 > e2)
-                and (e3 > e1)
-                and (e3 > e5)
-                and (abs(e1 - e5) <= 0.03 * np.mean([e1, e5]))
-                and (abs(e2 - e4) <= 0.03 * np.mean([e1, e5]))
-            ):
-                patterns["HS"].append((window.index[0], window.index[-1]))
-
-            # Inverse Head and Shoulders (bullish)
-            elif (
-                (e1 < e2)
-                and (e3 < e1)
-                and (e3 < e5)
-                and (abs(e1 - e5) <= 0.03 * np.mean([e1, e5]))
-                and (abs(e2 - e4) <= 0.03 * np.mean([e1, e5]))
-            ):
-                patterns["IHS"].append((window.index[0], window.index[-1]))
-
-            # Triangle Top (bearish)
-            elif (e1 > e2) and (e1 > e3) and (e3 > e5) and (e2 < e4):
-                patterns["TTOP"].append((window.index[0], window.index[-1]))
-
-            # Triangle Bottom (bullish)
-            elif (e1 < e2) and (e1 < e3) and (e3 < e5) and (e2 > e4):
-                patterns["TBOT"].append((window.index[0], window.index[-1]))
-
-            # Rectangle Top (bearish)
-            elif (
-                (e1 > e2)
-                and (abs(e1 - rtop_g1) / rtop_g1 < 0.0075)
-                and (abs(e3 - rtop_g1) / rtop_g1 < 0.0075)
-                and (abs(e5 - rtop_g1) / rtop_g1 < 0.0075)
-                and (abs(e2 - rtop_g2) / rtop_g2 < 0.0075)
-                and (abs(e4 - rtop_g2) / rtop_g2 < 0.0075)
-                and (min(e1, e3, e5) > max(e2, e4))
-            ):
-                patterns["RTOP"].append((window.index[0], window.index[-1]))
-
-            # Rectangle Bottom (bullish)
-            elif (
-                (e1 < e2)
-                and (abs(e1 - rtop_g1) / rtop_g1 < 0.0075)
-                and (abs(e3 - rtop_g1) / rtop_g1 < 0.0075)
-                and (abs(e5 - rtop_g1) / rtop_g1 < 0.0075)
-                and (abs(e2 - rtop_g2) / rtop_g2 < 0.0075)
-                and (abs(e4 - rtop_g2) / rtop_g2 < 0.0075)
-                and (max(e1, e3, e5) > min(e2, e4))
-            ):
-                patterns["RBOT"].append((window.index[0], window.index[-1]))
+        ends = _classify_patterns(
+            extrema.to_numpy(dtype=np.float64, copy=True),
+            positions,
+            self.max_bars,
+        )
+
+        labels = extrema.index
+        for name, end_positions in zip(PATTERN_NAMES, ends):
+            for i in end_positions:
+                patterns[name].append((labels[i - 5], labels[i - 1]))
 
         return patterns
 
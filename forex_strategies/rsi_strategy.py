@@ -23,6 +23,31 @@ import numpy as np
 import pandas as pd
 
 from forex_strategies.base_strategy import BaseForexStrategy
+from forex_strategies.jit import njit
+
+
+@njit("UniTuple(boolean[:], 2)(float64[:], float64, float64, int64)", cache=True)
+def _rsi_runs(rsi, oversold, overbought, hist):
+    """Flag bars preceded by ``hist`` consecutive oversold/overbought bars.
+
+    Tracks the current run length of ``rsi <= oversold`` and
+    ``rsi >= overbought`` in a single pass; bar ``i`` is flagged when the
+    run ending at ``i - 1`` is at least ``hist`` bars long. NaN RSI values
+    break both runs.
+    """
+    n = len(rsi)
+    long_sig = np.zeros(n, np.bool_)
+    short_sig = np.zeros(n, np.bool_)
+    below_run = 0
+    above_run = 0
+    for i in range(n):
+        if i > 0:
+            long_sig[i] = below_run >= hist
+            short_sig[i] = above_run >= hist
+        value = rsi[i]
+        below_run = below_run + 1 if value <= oversold else 0
+        above_run = above_run + 1 if value >= overbought else 0
+    return long_sig, short_sig
 
 
 class RSIStrategy(BaseForexStrategy):
@@ -66,7 +91,9 @@ class RSIStrategy(BaseForexStrategy):
         * ``close`` – close price.
         """
 
-        df = df.copy()
+        # Shallow copy: new columns are added without copying the existing
+        # OHLCV/indicator data or mutating the caller's frame.
+        df = df.copy(deep=False)
 
         required_cols: List[str] = ["RSI_14", "STDEV_30", "close"]
         missing = [col for col in required_cols if col not in df.columns]
@@ -75,40 +102,27 @@ class RSIStrategy(BaseForexStrategy):
                 f"Missing required indicators for RSIStrategy: {missing}"
             )
 
-        rsi = df["RSI_14"]
-        rsi_below = rsi <= self.rsi_oversold
-        rsi_above = rsi >= self.rsi_overbought
-
-        # Replicate the original loop logic using vectorised rolling
-        # windows. The legacy code did, for each index i:
+        # The legacy code did, for each index i:
         #
         #   rsi_long_signal[i]  = all(rsi_below[i-hist : i])
         #   rsi_short_signal[i] = all(rsi_above[i-hist : i])
         #
         # i.e. it examined the *preceding* ``hist`` bars (excluding the
-        # current bar). We can achieve the same effect by computing a
-        # rolling sum over ``hist`` bars and then shifting by one.
-        window = self.hist
-
-        below_int = rsi_below.astype(int)
-        above_int = rsi_above.astype(int)
+        # current bar). ``_rsi_runs`` reproduces this with running
+        # run-lengths over the raw RSI array.
+        rsi = df["RSI_14"].to_numpy(dtype=np.float64, copy=True)
+        long_sig, short_sig = _rsi_runs(
+            rsi, float(self.rsi_oversold), float(self.rsi_overbought), int(self.hist)
+        )
 
-        below_run = below_int.rolling(window=window, min_periods=window).sum()
-        above_run = above_int.rolling(window=window, min_periods=window).sum()
+        close = df["close"].to_numpy(dtype=np.float64)
+        buffer = self.stdev_multiplier * df["STDEV_30"].to_numpy(dtype=np.float64)
 
-        df["rsi_long_signal"] = below_run.shift(1) == window
-        df["rsi_short_signal"] = above_run.shift(1) == window
+        df["rsi_long_signal"] = long_sig
+        df["rsi_short_signal"] = short_sig
 
         # Execution prices: volatility-buffered entries around close.
-        df["execute_buy"] = np.where(
-            df["rsi_long_signal"],
-            df["close"] + self.stdev_multiplier * df["STDEV_30"],
-            np.nan,
-        )
-        df["execute_sell"] = np.where(
-            df["rsi_short_signal"],
-            df["close"] - self.stdev_multiplier * df["STDEV_30"],
-            np.nan,
-        )
+        df["execute_buy"] = np.where(long_sig, close + buffer, np.nan)
+        df["execute_sell"] = np.where(short_sig, close - buffer, np.nan)
 
         return df
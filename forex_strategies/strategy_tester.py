@@ -1,28 +1,101 @@
 """
 Strategy tester for comparing multiple forex strategies.
 """
+import os
 import pandas as pd
-from typing import List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from forex_strategies.base_strategy import BaseForexStrategy
 from forex_strategies.backtesting_strategy import ForexBacktestingStrategy
+from forex_strategies.pattern_strategy import PatternStrategy
+
+# Frame under test in a worker process, set once by the pool initializer so
+# it is pickled once per worker rather than once per task
+_worker_df: Optional[pd.DataFrame] = None
+
+
+def _init_worker(df: pd.DataFrame):
+    global _worker_df
+    _worker_df = df
+
+
+def _run_one(strategy: BaseForexStrategy, df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+    """
+    Backtest a single strategy and return its comparison metrics.
+
+    Module-level so it can be pickled into worker processes.
+
+    Args:
+        strategy: Strategy instance to test
+        df: DataFrame with OHLCV and technical indicators
+
+    Returns:
+        Dictionary of metrics, or None if the backtest produced no stats
+    """
+    stats, _ = strategy.execute(df, ForexBacktestingStrategy)
+    if stats is None:
+        return None
+    return {
+        "Strategy": strategy.__class__.__name__,
+        "Return [%]": stats["Return [%]"],
+        "Sharpe Ratio": stats.get("Sharpe Ratio", 0),
+        "Max. Drawdown [%]": stats["Max. Drawdown [%]"],
+        "# Trades": stats["# Trades"],
+        "Win Rate [%]": stats.get("Win Rate [%]", 0),
+        "Avg. Trade [%]": stats.get("Avg. Trade [%]", 0),
+    }
+
+
+def _run_group(
+    strategies: List[BaseForexStrategy],
+) -> List[Tuple[str, Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Backtest strategies one after another in a worker process.
+
+    Returns:
+        (strategy name, metrics or None, error message or None) per strategy
+    """
+    outcomes = []
+    for strategy in strategies:
+        name = strategy.__class__.__name__
+        try:
+            outcomes.append((name, _run_one(strategy, _worker_df), None))
+        except Exception as e:
+            outcomes.append((name, None, str(e)))
+    return outcomes
+
+
+def _uses_pattern_extrema(strategy: BaseForexStrategy) -> bool:
+    """Whether the strategy computes PatternStrategy's kernel-regression extrema."""
+    return isinstance(strategy, PatternStrategy) or isinstance(
+        getattr(strategy, "pattern_strategy", None), PatternStrategy
+    )
 
 
 class StrategyTester:
     """Test and compare multiple forex strategies."""
 
-    def __init__(self, strategies: List[BaseForexStrategy]):
+    def __init__(self, strategies: List[BaseForexStrategy], max_workers: Optional[int] = None):
         """
         Initialize tester with list of strategies.
 
         Args:
             strategies: List of strategy instances to test
+            max_workers: Maximum worker processes for test_all (default: CPU count).
+                Use 1 to run strategies sequentially in this process.
         """
         self.strategies = strategies
+        self.max_workers = max_workers
 
     def test_all(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Test all strategies and return comparison results.
 
+        Strategies are independent, so with more than one strategy they are
+        backtested in parallel worker processes. Strategies built on
+        PatternStrategy share one task, so the memoized extrema are computed
+        once instead of once per worker.
+
         Args:
             df: DataFrame with OHLCV and technical indicators
 
@@ -31,24 +104,40 @@ class StrategyTester:
         """
         results = []
 
-        for strategy in self.strategies:
-            try:
-                stats, _ = strategy.execute(df, ForexBacktestingStrategy)
-                if stats is not None:
-                    results.append(
-                        {
-                            "Strategy": strategy.__class__.__name__,
-                            "Return [%]": stats["Return [%]"],
-                            "Sharpe Ratio": stats.get("Sharpe Ratio", 0),
-                            "Max. Drawdown [%]": stats["Max. Drawdown [%]"],
-                            "# Trades": stats["# Trades"],
-                            "Win Rate [%]": stats.get("Win Rate [%]", 0),
-                            "Avg. Trade [%]": stats.get("Avg. Trade [%]", 0),
-                        }
-                    )
-            except Exception as e:
-                print(f"Error testing {strategy.__class__.__name__}: {e}")
-                continue
+        # Strategies sharing the extrema cache run together in one task
+        pattern_group = [s for s in self.strategies if _uses_pattern_extrema(s)]
+        groups = [[s] for s in self.strategies if not _uses_pattern_extrema(s)]
+        if pattern_group:
+            groups.insert(0, pattern_group)
+
+        workers = min(len(groups), self.max_workers or os.cpu_count() or 1)
+
+        if workers <= 1:
+            for strategy in self.strategies:
+                try:
+                    row = _run_one(strategy, df)
+                    if row is not None:
+                        results.append(row)
+                except Exception as e:
+                    print(f"Error testing {strategy.__class__.__name__}: {e}")
+                    continue
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(df,)
+            ) as executor:
+                futures = [(group, executor.submit(_run_group, group)) for group in groups]
+                for group, future in futures:
+                    try:
+                        outcomes = future.result()
+                    except Exception as e:
+                        for strategy in group:
+                            print(f"Error testing {strategy.__class__.__name__}: {e}")
+                        continue
+                    for name, row, error in outcomes:
+                        if error is not None:
+                            print(f"Error testing {name}: {error}")
+                        elif row is not None:
+                            results.append(row)
 
         if not results:
             print("No strategies completed successfully")
@@ -61,4 +150,3 @@ class StrategyTester:
     def test_single(self, strategy: BaseForexStrategy, df: pd.DataFrame):
         """Test a single strategy."""
         return strategy.execute(df, ForexBacktestingStrategy)
-
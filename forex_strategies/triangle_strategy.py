@@ -6,8 +6,21 @@ trading signals based on triangle breakouts.
 """
 import pandas as pd
 import numpy as np
-from scipy.stats import linregress
 from forex_strategies.base_strategy import BaseForexStrategy
+from forex_strategies.jit import njit
+
+
+@njit("UniTuple(float64, 2)(float64[:], float64[:])", cache=True)
+def _fast_slope_intercept(x, y):
+    """Least-squares slope and intercept of ``y`` against ``x``."""
+    xm = x.mean()
+    ym = y.mean()
+    dx = x - xm
+    denom = (dx * dx).sum()
+    if denom == 0.0:
+        return np.nan, np.nan
+    slope = (dx * (y - ym)).sum() / denom
+    return slope, ym - slope * xm
 
 
 class TriangleStrategy(BaseForexStrategy):
@@ -32,18 +45,14 @@ class TriangleStrategy(BaseForexStrategy):
         self.pivot_lookback = pivot_lookback
         self.pivot_lookforward = pivot_lookforward
 
-    def _pivotid(self, df: pd.DataFrame, l: int, n1: int, n2: int):
+    def _pivotid(self, low_arr: np.ndarray, high_arr: np.ndarray, l: int, n1: int, n2: int):
         """Identify pivot points (swing highs and lows)."""
-        if l - n1 < 0 or l + n2 >= len(df):
+        if l - n1 < 0 or l + n2 >= len(low_arr):
             return 0
 
-        pividlow = 1
-        pividhigh = 1
-        for i in range(l - n1, l + n2 + 1):
-            if df.iloc[l]["low"] > df.iloc[i]["low"]:
-                pividlow = 0
-            if df.iloc[l]["high"] < df.iloc[i]["high"]:
-                pividhigh = 0
+        window = slice(l - n1, l + n2 + 1)
+        pividlow = not (low_arr[l] > low_arr[window]).any()
+        pividhigh = not (high_arr[l] < high_arr[window]).any()
 
         if pividlow and pividhigh:
             return 3
@@ -54,27 +63,33 @@ class TriangleStrategy(BaseForexStrategy):
         else:
             return 0
 
-    def _check_if_triangle(self, candleid: int, backcandles: int, df: pd.DataFrame):
+    def _check_if_triangle(
+        self,
+        candleid: int,
+        backcandles: int,
+        pivot_arr: np.ndarray,
+        low_arr: np.ndarray,
+        high_arr: np.ndarray,
+    ):
         """Check if a triangle pattern exists at the given candle."""
-        maxim = np.array([])
-        minim = np.array([])
-        xxmin = np.array([])
-        xxmax = np.array([])
-
-        for i in range(candleid - backcandles, candleid + 1):
-            if df.iloc[i]["pivot"] == 1:  # Pivot low
-                minim = np.append(minim, float(df.iloc[i]["low"]))
-                xxmin = np.append(xxmin, i)
-            if df.iloc[i]["pivot"] == 2:  # Pivot high
-                maxim = np.append(maxim, float(df.iloc[i]["high"]))
-                xxmax = np.append(xxmax, i)
+        start = candleid - backcandles
+        window = slice(start, candleid + 1)
+        pivots = pivot_arr[window]
+        candles = np.arange(start, candleid + 1, dtype=np.float64)
+
+        is_low = pivots == 1  # Pivot low
+        is_high = pivots == 2  # Pivot high
+        minim = low_arr[window][is_low]
+        xxmin = candles[is_low]
+        maxim = high_arr[window][is_high]
+        xxmax = candles[is_high]
 
         if (xxmax.size < 5 and xxmin.size < 5) or xxmax.size == 0 or xxmin.size == 0:
             raise ValueError("No triangle found - insufficient pivot points")
 
         # Linear regression on pivot points
-        slmin, intercmin, rmin, pmin, semin = linregress(xxmin, minim)
-        slmax, intercmax, rmax, pmax, semax = linregress(xxmax, maxim)
+        slmin, intercmin = _fast_slope_intercept(xxmin, minim)
+        slmax, intercmax = _fast_slope_intercept(xxmax, maxim)
 
         # Triangle condition: converging trendlines
         # Support slope >= 0 (rising or flat), Resistance slope <= 0 (falling or flat)
@@ -85,47 +100,66 @@ class TriangleStrategy(BaseForexStrategy):
 
     def generate_signals(self, df: pd.DataFrame) -> pd.DataFrame:
         """Generate trading signals based on triangle breakouts."""
-        df = df.copy()
-
-        # Store original index
-        original_index = df.index.copy()
+        # Shallow copy: signal columns are added without copying the price
+        # data or mutating the caller's frame. All access below is positional,
+        # so the original index is kept as-is.
+        df = df.copy(deep=False)
 
-        # Reset index for easier integer-based access
-        df = df.reset_index(drop=True)
-
-        # Initialize signal columns
-        df["execute_buy"] = np.nan
-        df["execute_sell"] = np.nan
+        # Preload price columns once; pivots and the scan below only need
+        # positional access
+        close_arr = df["close"].to_numpy(dtype=np.float64)
+        high_arr = df["high"].to_numpy(dtype=np.float64)
+        low_arr = df["low"].to_numpy(dtype=np.float64)
 
         # Find pivot points
-        df["pivot"] = df.apply(
-            lambda x: self._pivotid(df, x.name, self.pivot_lookback, self.pivot_lookforward),
-            axis=1,
-        )
+        df["pivot"] = [
+            self._pivotid(low_arr, high_arr, i, self.pivot_lookback, self.pivot_lookforward)
+            for i in range(len(df))
+        ]
+
+        # Signal buffers, attached to the frame once after the scan
+        n = len(df)
+        buy_out = np.full(n, np.nan)
+        sell_out = np.full(n, np.nan)
+
+        # Running pivot counts (with a leading zero) so the number of pivot
+        # lows/highs in any window can be read in O(1)
+        pivot_arr = df["pivot"].to_numpy()
+        cum_low = np.concatenate(([0], np.cumsum(pivot_arr == 1)))
+        cum_high = np.concatenate(([0], np.cumsum(pivot_arr == 2)))
 
         # Detect triangles and generate signals
         candleid = self.backcandles
-        while candleid < len(df) - 1:
+        while candleid < n - 1:
+            # Skip windows that _check_if_triangle would reject for lack of
+            # pivots without scanning them
+            start = candleid - self.backcandles
+            n_low = cum_low[candleid + 1] - cum_low[start]
+            n_high = cum_high[candleid + 1] - cum_high[start]
+            if (n_low < 5 and n_high < 5) or n_low == 0 or n_high == 0:
+                candleid += 1
+                continue
+
             try:
                 slmin, intercmin, slmax, intercmax, xxmin, xxmax = self._check_if_triangle(
-                    candleid, self.backcandles, df
+                    candleid, self.backcandles, pivot_arr, low_arr, high_arr
                 )
 
                 # Calculate trendline values at current candle
                 upper_line = slmax * candleid + intercmax
                 lower_line = slmin * candleid + intercmin
 
-                current_close = df.iloc[candleid]["close"]
-                current_high = df.iloc[candleid]["high"]
-                current_low = df.iloc[candleid]["low"]
+                current_close = close_arr[candleid]
+                current_high = high_arr[candleid]
+                current_low = low_arr[candleid]
 
                 # Buy signal: Breakout above upper trendline (resistance)
                 if current_close > upper_line or current_high > upper_line:
-                    df.iloc[candleid, df.columns.get_loc("execute_buy")] = current_close
+                    buy_out[candleid] = current_close
 
                 # Sell signal: Breakdown below lower trendline (support)
                 if current_close < lower_line or current_low < lower_line:
-                    df.iloc[candleid, df.columns.get_loc("execute_sell")] = current_close
+                    sell_out[candleid] = current_close
 
                 # Move forward
                 candleid += int(self.backcandles * 0.5)
@@ -139,8 +173,8 @@ class TriangleStrategy(BaseForexStrategy):
                 candleid += 1
                 continue
 
-        # Restore original index
-        df.index = original_index
+        df["execute_buy"] = buy_out
+        df["execute_sell"] = sell_out
 
         return df
 
@@ -1,14 +1,24 @@
 """
 FastAPI main application.
 """
+import asyncio
 import logging
 import os
-from fastapi import FastAPI, HTTPException, Depends
+from collections import OrderedDict
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+from typing import AsyncIterator, Iterator, List, Optional, Any
 from datetime import datetime
+from decimal import Decimal
+from beanie import PydanticObjectId
 from bson import ObjectId
+from bson.errors import InvalidId
+import orjson
 
 from live_trading.engine.trading_engine import TradingEngine
 
@@ -18,37 +28,293 @@ from live_trading.models.transaction import Transaction
 from live_trading.models.position import Position
 from live_trading.models.order import Order
 from live_trading.models.trade import Trade
+from live_trading.models.market_data import MarketData
 from live_trading.config import config
 
-app = FastAPI(title="Live Trading System API", version="0.1.0")
+try:
+    from live_trading.logging import get_log_manager
+    HAS_LOG_MANAGER = True
+except ImportError:
+    HAS_LOG_MANAGER = False
+
+try:
+    from live_trading.daemon import get_daemon_manager
+    HAS_DAEMON_MANAGER = True
+except ImportError:
+    HAS_DAEMON_MANAGER = False
+
+
+def _orjson_default(value: Any) -> Any:
+    """Fallback encoder for types orjson does not handle natively"""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+# Naive datetimes stay naive (no offset), matching the isoformat() output of
+# jsonable_encoder and pydantic's model_dump_json on the other endpoints
+_ORJSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY
+    | orjson.OPT_NON_STR_KEYS
+)
+
+
+class ORJSONAppResponse(JSONResponse):
+    """
+    Default JSON response rendered with orjson.
+
+    Datetimes, floats and numpy values are encoded in C instead of going
+    through the stdlib json fallbacks.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=_ORJSON_OPTIONS,
+        )
+
+
+class PydanticResponse(JSONResponse):
+    """
+    JSON response for a single pydantic model, rendered by pydantic-core.
+
+    Skips FastAPI's response_model re-validation and jsonable_encoder pass for
+    models that are already trusted (e.g. built with model_construct).
+    """
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json().encode()
+
+
+def _create_broker():
+    """Instantiate the broker selected by config.BROKER_TYPE"""
+    # Import here to avoid circular imports
+    from live_trading.brokers import IBKRBroker, OANDABroker, PepperstoneBroker, CTraderBroker
+
+    # Log broker type for debugging
+    logger.info(f"Initializing broker: {config.BROKER_TYPE} (from env: {os.getenv('BROKER_TYPE', 'not set')})")
+
+    if config.BROKER_TYPE == "IBKR":
+        if IBKRBroker is None:
+            raise ImportError(
+                "IBKR broker requested but 'ibapi' module not found. "
+                "Please install IBKR API: pip install -e ./IBJts/source/pythonclient"
+            )
+        return IBKRBroker()
+    elif config.BROKER_TYPE == "OANDA":
+        if OANDABroker is None:
+            raise ImportError(
+                "OANDA broker requested but 'oandapyV20' module not found. "
+                "Please install OANDA API: pip install oandapyV20"
+            )
+        return OANDABroker()
+    elif config.BROKER_TYPE == "PEPPERSTONE":
+        if PepperstoneBroker is None:
+            raise ImportError(
+                "Pepperstone broker requested but 'MetaTrader5' module not found. "
+                "Please install MetaTrader5: pip install MetaTrader5"
+            )
+        return PepperstoneBroker()
+    elif config.BROKER_TYPE == "CTRADER":
+        if CTraderBroker is None:
+            raise ImportError(
+                "cTrader broker requested but 'ctrader-open-api' module not found. "
+                "Please install cTrader Open API: pip install ctrader-open-api"
+            )
+        return CTraderBroker()
+    raise ValueError(
+        f"Unsupported broker type: {config.BROKER_TYPE}. "
+        f"Supported types: IBKR, OANDA, PEPPERSTONE, CTRADER"
+    )
+
+
+# Logged when the broker cannot connect at startup
+_BROKER_CONNECT_WARNINGS = {
+    "IBKR": (
+        "Failed to connect to IBKR. Make sure TWS/Gateway is running and API is enabled. "
+        "The system will continue but trading operations will not work until IBKR is connected."
+    ),
+    "OANDA": (
+        "Failed to connect to OANDA. Make sure OANDA_API_KEY and OANDA_ACCOUNT_ID are set correctly. "
+        "The system will continue but trading operations will not work until OANDA is connected."
+    ),
+    "PEPPERSTONE": (
+        "Failed to connect to Pepperstone. Make sure MetaTrader5 terminal is installed and running, "
+        "and PEPPERSTONE_LOGIN, PEPPERSTONE_PASSWORD, and PEPPERSTONE_SERVER are set correctly. "
+        "The system will continue but trading operations will not work until Pepperstone is connected."
+    ),
+    "CTRADER": (
+        "Failed to connect to cTrader. Make sure CTRADER_CLIENT_ID, CTRADER_CLIENT_SECRET, "
+        "and CTRADER_ACCESS_TOKEN are set correctly. "
+        "The system will continue but trading operations will not work until cTrader is connected."
+    ),
+}
+
+
+async def _connect_broker(broker) -> None:
+    """Connect the broker, logging (not raising) on failure"""
+    connected = await broker.connect()
+    if not connected:
+        logger.warning(_BROKER_CONNECT_WARNINGS[config.BROKER_TYPE])
+    elif config.BROKER_TYPE == "CTRADER":
+        # Start connection health monitor
+        await broker.start_connection_monitor()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize the trading engine on startup and shut it down on exit"""
+    from live_trading.journal.journal_manager import JournalManager
+
+    broker = _create_broker()
+    engine = TradingEngine(broker, JournalManager())
+
+    # The broker connection and the database setup are independent, so run
+    # them concurrently: startup takes as long as the slower of the two
+    await asyncio.gather(_connect_broker(broker), engine.initialize())
+
+    # Recover from journal (crash recovery)
+    await engine.recover_from_journal()
+
+    app.state.engine = engine
+
+    # Start background task to periodically sync positions from broker
+    async def periodic_position_sync():
+        """Periodically sync positions from broker to database"""
+        while True:
+            try:
+                await asyncio.sleep(30)  # Sync every 30 seconds
+                active_operations = await TradingOperation.find(
+                    TradingOperation.status == "active"
+                ).project(OperationRef).to_list()
+                # Operations sync independently; run them concurrently so the
+                # cycle takes as long as the slowest broker round trip
+                results = await asyncio.gather(
+                    *(engine._sync_positions_from_broker(op) for op in active_operations),
+                    return_exceptions=True
+                )
+                for operation, result in zip(active_operations, results):
+                    if isinstance(result, Exception):
+                        logger.error(
+                            f"Error syncing positions for operation {operation.id}: {result}",
+                            exc_info=result
+                        )
+            except Exception as e:
+                logger.error(f"Error in periodic position sync: {e}", exc_info=True)
+
+    # Keep a reference so the task isn't garbage collected, and cancel it on
+    # shutdown so no broker call is left in flight
+    sync_task = asyncio.create_task(periodic_position_sync())
+
+    print(f"Trading engine started on {config.API_HOST}:{config.API_PORT}")
+
+    try:
+        yield
+    finally:
+        sync_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await sync_task
+        await engine.shutdown()
+
+
+app = FastAPI(
+    title="Live Trading System API",
+    version="0.1.0",
+    default_response_class=ORJSONAppResponse,
+    lifespan=lifespan,
+)
+
+class BrowserCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware that only engages for requests carrying an Origin header.
+
+    Server-to-server callers (CLI, daemon, scripts) never send Origin, so
+    they skip the header parsing and response-header rewriting entirely.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and not any(
+            name == b"origin" for name, _ in scope["headers"]
+        ):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
 
 # CORS middleware
 app.add_middleware(
-    CORSMiddleware,
+    BrowserCORSMiddleware,
     allow_origins=["*"],  # TODO: Configure properly for production
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Global trading engine (will be initialized in startup)
-trading_engine: Optional[TradingEngine] = None
+async def get_trading_engine(request: Request) -> TradingEngine:
+    """Dependency to get the trading engine created by the app lifespan"""
+    return request.app.state.engine
+
+
+_INVALID_OP_ID_DETAIL = "Invalid operation ID"
+
+
+@lru_cache(maxsize=4096)
+def _parse_object_id(value: str) -> ObjectId:
+    """Parse an ObjectId, memoizing recently seen IDs"""
+    return ObjectId(value)
+
+
+async def valid_op_id(operation_id: str) -> ObjectId:
+    """Dependency parsing the operation_id path parameter into an ObjectId"""
+    try:
+        return _parse_object_id(operation_id)
+    except (InvalidId, TypeError):
+        raise HTTPException(status_code=400, detail=_INVALID_OP_ID_DETAIL) from None
+
+
+# Concurrent reads of the same operation share one in-flight lookup. A
+# finished lookup is reused for this many seconds before being evicted.
+_OPERATION_FETCH_TTL = 0.2
+_operation_fetches: dict[ObjectId, asyncio.Task] = {}
+
+
+def _evict_operation_fetch(op_id: ObjectId, task: asyncio.Task) -> None:
+    if _operation_fetches.get(op_id) is task:
+        del _operation_fetches[op_id]
+
 
+async def fetch_operation(op_id: ObjectId) -> Optional[TradingOperation]:
+    """Get an operation, coalescing concurrent requests for the same ID"""
+    task = _operation_fetches.get(op_id)
+    if task is None:
+        task = asyncio.create_task(TradingOperation.get(op_id))
+        _operation_fetches[op_id] = task
 
-def get_trading_engine() -> TradingEngine:
-    """Dependency to get trading engine"""
-    if trading_engine is None:
-        raise HTTPException(status_code=500, detail="Trading engine not initialized")
-    return trading_engine
+        def on_done(done: asyncio.Task) -> None:
+            # Failed lookups are dropped right away so the next call retries
+            if done.cancelled() or done.exception() is not None:
+                _evict_operation_fetch(op_id, done)
+            else:
+                asyncio.get_running_loop().call_later(
+                    _OPERATION_FETCH_TTL, _evict_operation_fetch, op_id, done
+                )
+
+        task.add_done_callback(on_done)
+
+    # Shielded so a disconnecting client doesn't cancel the shared lookup
+    return await asyncio.shield(task)
 
 
 # Pydantic models for request/response
 class CreateOperationRequest(BaseModel):
     asset: str
-    bar_sizes: List[str]
+    bar_sizes: list[str]
     primary_bar_size: str
     strategy_name: str
-    strategy_config: Dict[str, Any] = {}
+    strategy_config: dict[str, Any] = Field(default_factory=dict)
     initial_capital: float = 10000.0
     stop_loss_type: Optional[str] = None
     stop_loss_value: Optional[float] = None
@@ -75,10 +341,244 @@ class OperationResponse(BaseModel):
     updated_at: datetime
 
 
+# OperationResponse fields copied verbatim from the TradingOperation document
+_OP_FIELDS = (
+    "asset",
+    "bar_sizes",
+    "primary_bar_size",
+    "strategy_name",
+    "status",
+    "broker_type",
+    "initial_capital",
+    "current_capital",
+    "total_pnl",
+    "total_pnl_pct",
+    "created_at",
+    "updated_at",
+)
+
+
+def _compile_op_to_response():
+    """
+    Generate the OperationResponse builder for the fixed _OP_FIELDS list.
+
+    The generated function reads each field as a plain attribute access,
+    avoiding the per-call dict comprehension, getattr calls and **kwargs
+    unpacking.
+    """
+    fields = ", ".join(f"{field}=op.{field}" for field in _OP_FIELDS)
+    source = (
+        "def _op_to_response(op):\n"
+        f"    return construct(id=str(op.id), {fields})\n"
+    )
+    namespace = {"construct": OperationResponse.model_construct}
+    exec(source, namespace)
+    builder = namespace["_op_to_response"]
+    builder.__doc__ = "Build an OperationResponse from an already-validated operation document"
+    return builder
+
+
+_op_to_response = _compile_op_to_response()
+
+
+# The list response models double as MongoDB projections (Beanie's
+# .project()), so only the returned fields are fetched. Raw documents carry
+# the key as "_id", Beanie documents expose it as the "id" attribute.
+_ID_ALIASES = AliasChoices("_id", "id")
+
+
+class OperationRef(BaseModel):
+    """Operation fields needed to sync its positions from the broker"""
+
+    id: PydanticObjectId = Field(validation_alias=_ID_ALIASES)
+    asset: str
+
+
+class OperationListItem(OperationResponse):
+    """OperationResponse projected straight from trading_operations documents"""
+
+    id: PydanticObjectId = Field(validation_alias=_ID_ALIASES)
+
+
+class PositionResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: PydanticObjectId = Field(validation_alias=_ID_ALIASES)
+    contract_symbol: str
+    quantity: float
+    entry_price: float
+    current_price: float
+    unrealized_pnl: float
+    unrealized_pnl_pct: float
+    stop_loss: Optional[float] = None
+    take_profit: Optional[float] = None
+    opened_at: datetime
+    closed_at: Optional[datetime] = None
+
+
+class TransactionResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: PydanticObjectId = Field(validation_alias=_ID_ALIASES)
+    transaction_type: str
+    transaction_role: str
+    position_type: str
+    price: float
+    quantity: float
+    commission: float
+    profit: float
+    profit_pct: float
+    executed_at: datetime
+
+
+class TradeResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: PydanticObjectId = Field(validation_alias=_ID_ALIASES)
+    position_type: str
+    entry_price: float
+    exit_price: float
+    quantity: float
+    pnl: float
+    pnl_pct: float
+    total_commission: float
+    entry_time: datetime
+    exit_time: datetime
+    duration_seconds: float
+
+
+class OrderResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: PydanticObjectId = Field(validation_alias=_ID_ALIASES)
+    broker_order_id: Optional[str] = None
+    order_type: str
+    action: str
+    quantity: float
+    price: Optional[float] = None
+    status: str
+    filled_quantity: float
+    avg_fill_price: Optional[float] = None
+    placed_at: datetime
+    filled_at: Optional[datetime] = None
+
+
+# List serializers, built once at import. Documents are validated from their
+# attributes and dumped to JSON in a single pydantic-core call per request.
+_positions_adapter = TypeAdapter(List[PositionResponse])
+_transactions_adapter = TypeAdapter(List[TransactionResponse])
+_trades_adapter = TypeAdapter(List[TradeResponse])
+_orders_adapter = TypeAdapter(List[OrderResponse])
+_operations_adapter = TypeAdapter(List[OperationListItem])
+
+
+def _json_list_response(adapter: TypeAdapter, documents: list) -> Response:
+    """Serialize a list of documents to a JSON response using a prebuilt adapter"""
+    items = adapter.validate_python(documents, from_attributes=True)
+    return Response(content=adapter.dump_json(items), media_type="application/json")
+
+
+# Number of documents serialized per chunk by the streaming export endpoints
+_EXPORT_BATCH_SIZE = 500
+
+
+async def _ndjson_stream(model: type, query) -> AsyncIterator[bytes]:
+    """
+    Serialize documents from a query cursor as NDJSON, one chunk per batch.
+
+    Documents are consumed as the cursor yields them, so memory stays
+    bounded by the batch size rather than the full result set.
+    """
+    batch = []
+    async for document in query:
+        batch.append(model.model_validate(document).model_dump_json())
+        if len(batch) >= _EXPORT_BATCH_SIZE:
+            yield ("\n".join(batch) + "\n").encode()
+            batch.clear()
+    if batch:
+        yield ("\n".join(batch) + "\n").encode()
+
+
+async def _json_array_response(query, to_row) -> Response:
+    """
+    Stream documents from a query cursor as a JSON array.
+
+    The first document is fetched before the response starts, so a failing
+    query still surfaces as a normal error response instead of a 200 with a
+    broken body.
+    """
+    documents = query.__aiter__()
+    try:
+        first = await documents.__anext__()
+    except StopAsyncIteration:
+        return ORJSONAppResponse([])
+    return StreamingResponse(
+        _json_array_stream(first, documents, to_row),
+        media_type="application/json",
+    )
+
+
+async def _json_array_stream(first, documents, to_row) -> AsyncIterator[bytes]:
+    """
+    Serialize ``first`` and the rest of ``documents`` as a JSON array, one
+    chunk per batch.
+
+    Each batch of rows is encoded with a single orjson call; the array
+    brackets and separators are written around the batches. If the cursor
+    fails mid-stream the error is re-raised, which aborts the connection
+    before the closing bracket so the client sees a failed transfer rather
+    than a short but valid array.
+    """
+    yield b"["
+    separator = b""
+    batch = [to_row(first)]
+    try:
+        async for document in documents:
+            batch.append(to_row(document))
+            if len(batch) >= _EXPORT_BATCH_SIZE:
+                # Strip the batch's own brackets, keeping the comma-joined rows
+                yield separator + orjson.dumps(batch, default=_orjson_default, option=_ORJSON_OPTIONS)[1:-1]
+                separator = b","
+                batch.clear()
+    except Exception as e:
+        logger.error(f"Error streaming JSON array, aborting response: {e}", exc_info=True)
+        raise
+    yield separator + orjson.dumps(batch, default=_orjson_default, option=_ORJSON_OPTIONS)[1:-1]
+    yield b"]"
+
+
+async def parse_create_operation(request: Request) -> CreateOperationRequest:
+    """
+    Dependency parsing the raw request body straight into CreateOperationRequest.
+
+    pydantic-core parses and validates the JSON bytes in one step, instead of
+    FastAPI's json.loads -> dict -> validate path.
+    """
+    try:
+        return CreateOperationRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        # Match FastAPI's own body error locations ("body", <field>, ...)
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
+
 # Operations endpoints
-@app.post("/api/operations", response_model=OperationResponse)
+@app.post(
+    "/api/operations",
+    response_model=OperationResponse,
+    # The body is read by parse_create_operation, so document it explicitly
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": CreateOperationRequest.model_json_schema()}
+            },
+        }
+    },
+)
 async def create_operation(
-    request: CreateOperationRequest,
+    request: CreateOperationRequest = Depends(parse_create_operation),
     engine: TradingEngine = Depends(get_trading_engine)
 ):
     """Create a new trading operation"""
@@ -99,21 +599,7 @@ async def create_operation(
             data_retention_bars=request.data_retention_bars
         )
 
-        return OperationResponse(
-            id=str(operation.id),
-            asset=operation.asset,
-            bar_sizes=operation.bar_sizes,
-            primary_bar_size=operation.primary_bar_size,
-            strategy_name=operation.strategy_name,
-            status=operation.status,
-            broker_type=operation.broker_type,
-            initial_capital=operation.initial_capital,
-            current_capital=operation.current_capital,
-            total_pnl=operation.total_pnl,
-            total_pnl_pct=operation.total_pnl_pct,
-            created_at=operation.created_at,
-            updated_at=operation.updated_at
-        )
+        return PydanticResponse(_op_to_response(operation))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -128,71 +614,60 @@ async def list_operations(
     if status:
         query["status"] = status
 
-    operations = await TradingOperation.find(query).sort(-TradingOperation.created_at).to_list()
-
-    return [
-        OperationResponse(
-            id=str(op.id),
-            asset=op.asset,
-            bar_sizes=op.bar_sizes,
-            primary_bar_size=op.primary_bar_size,
-            strategy_name=op.strategy_name,
-            status=op.status,
-            broker_type=op.broker_type,
-            initial_capital=op.initial_capital,
-            current_capital=op.current_capital,
-            total_pnl=op.total_pnl,
-            total_pnl_pct=op.total_pnl_pct,
-            created_at=op.created_at,
-            updated_at=op.updated_at
-        )
-        for op in operations
-    ]
+    # Only the response fields are fetched (strategy_config and the risk
+    # settings are left in MongoDB)
+    operations = await TradingOperation.find(query).sort(
+        -TradingOperation.created_at
+    ).project(OperationListItem).to_list()
+
+    # Dump the projected rows directly instead of letting FastAPI re-validate
+    # them via response_model
+    content = _operations_adapter.dump_json(operations)
+    return Response(content=content, media_type="application/json")
+
+
+@app.get("/api/operations/with-stats")
+async def list_operations_with_stats(
+    status: Optional[str] = None,
+    engine: TradingEngine = Depends(get_trading_engine)
+):
+    """
+    List trading operations together with their trade and position stats.
+
+    Equivalent to calling list_operations and then get_operation_stats for
+    each operation, but computed in a single aggregation.
+    """
+    query = {}
+    if status:
+        query["status"] = status
+
+    operations = await TradingOperation.find(query).aggregate(
+        _OPERATIONS_WITH_STATS_STAGES
+    ).to_list()
+
+    # Already plain JSON-ready dicts, so skip FastAPI's jsonable_encoder pass
+    return ORJSONAppResponse(content=operations)
 
 
 @app.get("/api/operations/{operation_id}", response_model=OperationResponse)
 async def get_operation(
-    operation_id: str,
+    op_id: ObjectId = Depends(valid_op_id),
     engine: TradingEngine = Depends(get_trading_engine)
 ):
     """Get operation details"""
-    try:
-        op_id = ObjectId(operation_id)
-    except:
-        raise HTTPException(status_code=400, detail="Invalid operation ID")
-
-    operation = await TradingOperation.get(op_id)
+    operation = await fetch_operation(op_id)
     if not operation:
         raise HTTPException(status_code=404, detail="Operation not found")
 
-    return OperationResponse(
-        id=str(operation.id),
-        asset=operation.asset,
-        bar_sizes=operation.bar_sizes,
-        primary_bar_size=operation.primary_bar_size,
-        strategy_name=operation.strategy_name,
-        status=operation.status,
-        broker_type=operation.broker_type,
-        initial_capital=operation.initial_capital,
-        current_capital=operation.current_capital,
-        total_pnl=operation.total_pnl,
-        total_pnl_pct=operation.total_pnl_pct,
-        created_at=operation.created_at,
-        updated_at=operation.updated_at
-    )
+    return PydanticResponse(_op_to_response(operation))
 
 
 @app.delete("/api/operations/{operation_id}")
 async def delete_operation(
-    operation_id: str,
+    op_id: ObjectId = Depends(valid_op_id),
     engine: TradingEngine = Depends(get_trading_engine)
 ):
     """Stop and close an operation"""
-    try:
-        op_id = ObjectId(operation_id)
-    except:
-        raise HTTPException(status_code=400, detail="Invalid operation ID")
-
     try:
         await engine.stop_operation(op_id)
         return {"message": "Operation stopped"}
@@ -202,15 +677,10 @@ async def delete_operation(
 
 @app.post("/api/operations/{operation_id}/pause")
 async def pause_operation(
-    operation_id: str,
+    op_id: ObjectId = Depends(valid_op_id),
     engine: TradingEngine = Depends(get_trading_engine)
 ):
     """Pause an operation"""
-    try:
-        op_id = ObjectId(operation_id)
-    except:
-        raise HTTPException(status_code=400, detail="Invalid operation ID")
-
     try:
         await engine.pause_operation(op_id)
         return {"message": "Operation paused"}
@@ -220,15 +690,10 @@ async def pause_operation(
 
 @app.post("/api/operations/{operation_id}/resume")
 async def resume_operation(
-    operation_id: str,
+    op_id: ObjectId = Depends(valid_op_id),
     engine: TradingEngine = Depends(get_trading_engine)
 ):
     """Resume a paused operation"""
-    try:
-        op_id = ObjectId(operation_id)
-    except:
-        raise HTTPException(status_code=400, detail="Invalid operation ID")
-
     try:
         await engine.resume_operation(op_id)
         return {"message": "Operation resumed"}
@@ -236,256 +701,297 @@ async def resume_operation(
         raise HTTPException(status_code=404, detail=str(e))
 
 
+# The per-operation list endpoints below filter on operation_id and sort on a
+# timestamp. Each relies on the matching (operation_id, <sort field> desc)
+# compound index declared in the model's Settings (created by init_beanie at
+# startup) so MongoDB walks the index instead of sorting in memory:
+#   positions: opened_at, transactions: executed_at, trades: exit_time,
+#   orders: placed_at, market_data: (bar_size, timestamp) when filtered by
+#   bar_size, timestamp otherwise
+
+
+# Page size bounds for the list endpoints. limit=0 would mean "no limit" to
+# MongoDB, so it is rejected along with negative skips; the chart loads up to
+# 100k bars of market data in one request.
+_MAX_PAGE_SIZE = 10000
+_MAX_MARKET_DATA_LIMIT = 100000
+
+
 # Positions endpoints
-@app.get("/api/operations/{operation_id}/positions")
-async def get_positions(operation_id: str):
+@app.get("/api/operations/{operation_id}/positions", response_model=List[PositionResponse])
+async def get_positions(
+    op_id: ObjectId = Depends(valid_op_id),
+    limit: int = Query(1000, ge=1, le=_MAX_PAGE_SIZE),
+    skip: int = Query(0, ge=0)
+):
     """Get positions for an operation"""
-    try:
-        op_id = ObjectId(operation_id)
-    except:
-        raise HTTPException(status_code=400, detail="Invalid operation ID")
-
     positions = await Position.find(
         Position.operation_id == op_id
-    ).sort(-Position.opened_at).to_list()
+    ).sort(-Position.opened_at).skip(skip).limit(limit).project(PositionResponse).to_list()
 
-    return [
-        {
-            "id": str(pos.id),
-            "contract_symbol": pos.contract_symbol,
-            "quantity": pos.quantity,
-            "entry_price": pos.entry_price,
-            "current_price": pos.current_price,
-            "unrealized_pnl": pos.unrealized_pnl,
-            "unrealized_pnl_pct": pos.unrealized_pnl_pct,
-            "stop_loss": pos.stop_loss,
-            "take_profit": pos.take_profit,
-            "opened_at": pos.opened_at,
-            "closed_at": pos.closed_at
-        }
-        for pos in positions
-    ]
+    return _json_list_response(_positions_adapter, positions)
 
 
 # Transactions endpoints
-@app.get("/api/operations/{operation_id}/transactions")
-async def get_transactions(operation_id: str):
+@app.get("/api/operations/{operation_id}/transactions", response_model=List[TransactionResponse])
+async def get_transactions(
+    op_id: ObjectId = Depends(valid_op_id),
+    limit: int = Query(1000, ge=1, le=_MAX_PAGE_SIZE),
+    skip: int = Query(0, ge=0)
+):
     """Get transactions for an operation"""
-    try:
-        op_id = ObjectId(operation_id)
-    except:
-        raise HTTPException(status_code=400, detail="Invalid operation ID")
-
     transactions = await Transaction.find(
         Transaction.operation_id == op_id
-    ).sort(-Transaction.executed_at).to_list()
+    ).sort(-Transaction.executed_at).skip(skip).limit(limit).project(TransactionResponse).to_list()
 
-    return [
-        {
-            "id": str(txn.id),
-            "transaction_type": txn.transaction_type,
-            "transaction_role": txn.transaction_role,
-            "position_type": txn.position_type,
-            "price": txn.price,
-            "quantity": txn.quantity,
-            "commission": txn.commission,
-            "profit": txn.profit,
-            "profit_pct": txn.profit_pct,
-            "executed_at": txn.executed_at
-        }
-        for txn in transactions
-    ]
+    return _json_list_response(_transactions_adapter, transactions)
 
 
 # Trades endpoints
-@app.get("/api/operations/{operation_id}/trades")
-async def get_trades(operation_id: str):
+@app.get("/api/operations/{operation_id}/trades", response_model=List[TradeResponse])
+async def get_trades(
+    op_id: ObjectId = Depends(valid_op_id),
+    limit: int = Query(1000, ge=1, le=_MAX_PAGE_SIZE),
+    skip: int = Query(0, ge=0)
+):
     """Get completed trades for an operation"""
-    try:
-        op_id = ObjectId(operation_id)
-    except:
-        raise HTTPException(status_code=400, detail="Invalid operation ID")
-
     trades = await Trade.find(
         Trade.operation_id == op_id
-    ).sort(-Trade.exit_time).to_list()
+    ).sort(-Trade.exit_time).skip(skip).limit(limit).project(TradeResponse).to_list()
 
-    return [
-        {
-            "id": str(trade.id),
-            "position_type": trade.position_type,
-            "entry_price": trade.entry_price,
-            "exit_price": trade.exit_price,
-            "quantity": trade.quantity,
-            "pnl": trade.pnl,
-            "pnl_pct": trade.pnl_pct,
-            "total_commission": trade.total_commission,
-            "entry_time": trade.entry_time,
-            "exit_time": trade.exit_time,
-            "duration_seconds": trade.duration_seconds
-        }
-        for trade in trades
-    ]
+    return _json_list_response(_trades_adapter, trades)
+
+
+@app.get("/api/operations/{operation_id}/trades/export")
+async def export_trades(op_id: ObjectId = Depends(valid_op_id)):
+    """Stream all completed trades for an operation as NDJSON (one trade per line)"""
+    query = Trade.find(
+        Trade.operation_id == op_id
+    ).sort(-Trade.exit_time).project(TradeResponse)
+    return StreamingResponse(
+        _ndjson_stream(TradeResponse, query),
+        media_type="application/x-ndjson"
+    )
 
 
 # Orders endpoints
-@app.get("/api/operations/{operation_id}/orders")
-async def get_orders(operation_id: str):
+@app.get("/api/operations/{operation_id}/orders", response_model=List[OrderResponse])
+async def get_orders(
+    op_id: ObjectId = Depends(valid_op_id),
+    limit: int = Query(1000, ge=1, le=_MAX_PAGE_SIZE),
+    skip: int = Query(0, ge=0)
+):
     """Get orders for an operation"""
-    try:
-        op_id = ObjectId(operation_id)
-    except:
-        raise HTTPException(status_code=400, detail="Invalid operation ID")
-
     orders = await Order.find(
         Order.operation_id == op_id
-    ).sort(-Order.placed_at).to_list()
+    ).sort(-Order.placed_at).skip(skip).limit(limit).project(OrderResponse).to_list()
 
-    return [
-        {
-            "id": str(order.id),
-            "broker_order_id": order.broker_order_id,
-            "order_type": order.order_type,
-            "action": order.action,
-            "quantity": order.quantity,
-            "price": order.price,
-            "status": order.status,
-            "filled_quantity": order.filled_quantity,
-            "avg_fill_price": order.avg_fill_price,
-            "placed_at": order.placed_at,
-            "filled_at": order.filled_at
-        }
-        for order in orders
-    ]
+    return _json_list_response(_orders_adapter, orders)
 
 
 # Market Data endpoints
-def sanitize_value(value):
-    """Sanitize a value to be JSON-compliant (replace inf, -inf, nan with None)"""
-    import math
-    if isinstance(value, (int, float)):
-        if math.isinf(value) or math.isnan(value):
-            return None
-    return value
-
-def sanitize_indicators(indicators: dict) -> dict:
-    """Sanitize indicators dictionary to remove inf, -inf, and nan values"""
-    if not indicators:
-        return {}
+_MARKET_DATA_ROW_FIELDS = {
+    "bar_size": 1, "timestamp": 1, "open": 1, "high": 1, "low": 1, "close": 1,
+    "volume": 1, "indicators": 1,
+}
+
+
+def _market_data_row(doc: dict) -> dict:
+    """
+    Build the JSON row for a raw market data document.
+
+    Non-finite prices and indicator values (inf, -inf, nan) need no
+    sanitizing pass here: orjson encodes them as null, and the ObjectId
+    through the default hook.
+    """
     return {
-        key: sanitize_value(value)
-        for key, value in indicators.items()
+        "id": doc["_id"],
+        "bar_size": doc["bar_size"],
+        "timestamp": doc["timestamp"],
+        "open": doc["open"],
+        "high": doc["high"],
+        "low": doc["low"],
+        "close": doc["close"],
+        "volume": doc.get("volume", 0.0),
+        "indicators": doc.get("indicators") or {}
     }
 
+
 @app.get("/api/operations/{operation_id}/market-data")
 async def get_market_data(
-    operation_id: str,
+    op_id: ObjectId = Depends(valid_op_id),
     bar_size: Optional[str] = None,
-    limit: int = 1000
+    limit: int = Query(1000, ge=1, le=_MAX_MARKET_DATA_LIMIT)
 ):
     """Get market data for an operation"""
-    try:
-        op_id = ObjectId(operation_id)
-    except:
-        raise HTTPException(status_code=400, detail="Invalid operation ID")
-
-    from live_trading.models.market_data import MarketData
-
     # Build query with filters
+    query = {"operation_id": op_id}
     if bar_size:
-        market_data = await MarketData.find(
-            MarketData.operation_id == op_id,
-            MarketData.bar_size == bar_size
-        ).sort(-MarketData.timestamp).limit(limit).to_list()
-    else:
-        market_data = await MarketData.find(
-            MarketData.operation_id == op_id
-        ).sort(-MarketData.timestamp).limit(limit).to_list()
+        query["bar_size"] = bar_size
+
+    # Read raw documents from the Motor cursor: the rows go straight from
+    # pymongo's BSON decoder to orjson without building MarketData models
+    cursor = MarketData.get_motor_collection().find(
+        query, projection=_MARKET_DATA_ROW_FIELDS
+    ).sort("timestamp", -1).limit(limit)
+
+    # Rows are encoded as the cursor yields them instead of materializing
+    # all bars first, so the first bytes go out before the query finishes
+    return await _json_array_response(cursor, _market_data_row)
+
+
+# The UI polls the bar count on every tab refresh; counts are reused for a few
+# seconds. Entries are (expiry, count), oldest evicted past the size limit.
+_MARKET_DATA_COUNT_TTL = 5.0
+_MARKET_DATA_COUNT_CACHE_SIZE = 256
+_market_data_counts: "OrderedDict[ObjectId, tuple[float, int]]" = OrderedDict()
 
-    return [
-        {
-            "id": str(md.id),
-            "bar_size": md.bar_size,
-            "timestamp": md.timestamp,
-            "open": sanitize_value(md.open),
-            "high": sanitize_value(md.high),
-            "low": sanitize_value(md.low),
-            "close": sanitize_value(md.close),
-            "volume": sanitize_value(md.volume),
-            "indicators": sanitize_indicators(md.indicators)
-        }
-        for md in market_data
-    ]
+
+def _invalidate_market_data_count(op_id: ObjectId) -> None:
+    """Drop the cached bar count after bars are deleted"""
+    _market_data_counts.pop(op_id, None)
 
 
 @app.get("/api/operations/{operation_id}/market-data/count")
-async def get_market_data_count(operation_id: str):
+async def get_market_data_count(op_id: ObjectId = Depends(valid_op_id)):
     """Get market data count for an operation (for tab display)"""
-    try:
-        op_id = ObjectId(operation_id)
-    except:
-        raise HTTPException(status_code=400, detail="Invalid operation ID")
-
-    from live_trading.models.market_data import MarketData
+    now = asyncio.get_running_loop().time()
+    cached = _market_data_counts.get(op_id)
+    if cached is not None and cached[0] > now:
+        return {"count": cached[1]}
 
+    # count_documents on operation_id, served by the operation_id index
     count = await MarketData.find(MarketData.operation_id == op_id).count()
+
+    _market_data_counts[op_id] = (now + _MARKET_DATA_COUNT_TTL, count)
+    _market_data_counts.move_to_end(op_id)
+    while len(_market_data_counts) > _MARKET_DATA_COUNT_CACHE_SIZE:
+        _market_data_counts.popitem(last=False)
+
     return {"count": count}
 
 
+# Market data bars sharing (bar_size, timestamp), highest volume first
+_DUPLICATE_BARS_PIPELINE = [
+    {"$sort": {"volume": -1}},
+    {
+        "$group": {
+            "_id": {"bar_size": "$bar_size", "timestamp": "$timestamp"},
+            "ids": {"$push": "$_id"},
+            "count": {"$sum": 1},
+        }
+    },
+    {"$match": {"count": {"$gt": 1}}},
+]
+
+
 @app.post("/api/operations/{operation_id}/market-data/cleanup-duplicates")
-async def cleanup_duplicate_market_data(operation_id: str, bar_size: Optional[str] = None):
+async def cleanup_duplicate_market_data(
+    operation_id: str,
+    op_id: ObjectId = Depends(valid_op_id),
+    bar_size: Optional[str] = None
+):
     """
     Clean up duplicate market data bars for an operation.
 
     This endpoint removes duplicate bars (same operation_id, bar_size, timestamp),
     keeping only the bar with the highest volume (historical data typically has actual volume).
     """
-    try:
-        op_id = ObjectId(operation_id)
-    except:
-        raise HTTPException(status_code=400, detail="Invalid operation ID")
-
-    from live_trading.models.market_data import MarketData
-    from collections import defaultdict
-
     # Build query
     query = {"operation_id": op_id}
     if bar_size:
         query["bar_size"] = bar_size
 
-    # Get all market data for this operation
-    all_bars = await MarketData.find(MarketData.operation_id == op_id).to_list()
-
-    # Group by (bar_size, timestamp)
-    grouped = defaultdict(list)
-    for bar in all_bars:
-        key = (bar.bar_size, bar.timestamp)
-        grouped[key].append(bar)
+    # Group bars by (bar_size, timestamp) inside MongoDB, backed by the
+    # (operation_id, bar_size, timestamp) index, and return only the groups
+    # that have duplicates
+    duplicate_groups, total_bars = await asyncio.gather(
+        MarketData.find(query).aggregate(
+            _DUPLICATE_BARS_PIPELINE, allowDiskUse=True
+        ).to_list(),
+        MarketData.find(query).count(),
+    )
 
-    # Find and clean up duplicates
+    # Each group's ids are sorted by volume (descending): keep the first one
+    # (historical data typically has actual volume, real-time often has 0)
+    # and delete the rest in a single delete_many
+    to_delete = [bar_id for group in duplicate_groups for bar_id in group["ids"][1:]]
     duplicates_removed = 0
-    for key, bars in grouped.items():
-        if len(bars) > 1:
-            # Sort by volume (descending) - keep the one with highest volume
-            # Historical data typically has actual volume, real-time often has 0
-            bars_sorted = sorted(bars, key=lambda b: b.volume or 0, reverse=True)
-
-            # Keep the first one (highest volume), delete the rest
-            for bar_to_delete in bars_sorted[1:]:
-                await bar_to_delete.delete()
-                duplicates_removed += 1
+    if to_delete:
+        result = await MarketData.find({"_id": {"$in": to_delete}}).delete()
+        duplicates_removed = result.deleted_count if result else 0
+        _invalidate_market_data_count(op_id)
 
     return {
         "operation_id": operation_id,
         "bar_size": bar_size,
         "duplicates_removed": duplicates_removed,
-        "total_bars_checked": len(all_bars)
+        "total_bars_checked": total_bars
     }
 
 
+def _number_compare(op: str, a: str, b: Any) -> dict:
+    """
+    $expr comparison that is false when either side is NaN.
+
+    MongoDB orders NaN below every number (and equal to itself), so a plain
+    {"$lt": ["$high", "$low"]} matches a NaN high; Python comparisons with
+    NaN are always false.
+    """
+    guards = [{"$ne": [field, float("nan")]} for field in (a, b) if isinstance(field, str)]
+    return {"$and": [*guards, {op: [a, b]}]}
+
+
+# Matches bars with inconsistent OHLC values, or a high-low range above 5% of
+# the low (suspicious for a single bar). Mirrors _invalid_ohlc_reasons,
+# including its NaN behaviour: comparisons against a NaN field never match.
+_INVALID_OHLC_EXPR = {
+    "$or": [
+        _number_compare("$lt", "$high", "$low"),
+        _number_compare("$lt", "$high", "$open"),
+        _number_compare("$lt", "$high", "$close"),
+        _number_compare("$gt", "$low", "$open"),
+        _number_compare("$gt", "$low", "$close"),
+        {
+            "$and": [
+                _number_compare("$gt", "$low", 0),
+                {"$ne": ["$high", float("nan")]},
+                {"$gt": [{"$multiply": [{"$divide": [{"$subtract": ["$high", "$low"]}, "$low"]}, 100]}, 5]},
+            ]
+        },
+    ]
+}
+
+_INVALID_BAR_FIELDS = {
+    "bar_size": 1, "timestamp": 1, "open": 1, "high": 1, "low": 1, "close": 1, "volume": 1
+}
+
+
+def _invalid_ohlc_reasons(o: float, h: float, l: float, c: float) -> List[str]:
+    """Describe why a bar's OHLC values are invalid"""
+    reasons = []
+
+    # Check OHLC consistency
+    if h < l:
+        reasons.append(f"high ({h}) < low ({l})")
+    if h < o or h < c:
+        reasons.append(f"high ({h}) is not highest")
+    if l > o or l > c:
+        reasons.append(f"low ({l}) is not lowest")
+
+    # Check for unreasonable range (>5% for a single bar is suspicious)
+    if l > 0:
+        range_pct = (h - l) / l * 100
+        if range_pct > 5:
+            reasons.append(f"range {range_pct:.2f}% too large")
+
+    return reasons
+
+
 @app.post("/api/operations/{operation_id}/market-data/cleanup-invalid")
 async def cleanup_invalid_market_data(
     operation_id: str,
+    op_id: ObjectId = Depends(valid_op_id),
     bar_size: Optional[str] = None,
     dry_run: bool = True
 ):
@@ -495,249 +1001,181 @@ async def cleanup_invalid_market_data(
     Args:
         dry_run: If True, only report invalid bars without deleting them
     """
-    try:
-        op_id = ObjectId(operation_id)
-    except:
-        raise HTTPException(status_code=400, detail="Invalid operation ID")
-
-    from live_trading.models.market_data import MarketData
-
-    # Get all market data for this operation
+    # Build query
     query = {"operation_id": op_id}
     if bar_size:
         query["bar_size"] = bar_size
 
-    all_bars = await MarketData.find(MarketData.operation_id == op_id).to_list()
-
-    invalid_bars = []
-    for bar in all_bars:
-        is_invalid = False
-        reasons = []
-
-        o, h, l, c = bar.open, bar.high, bar.low, bar.close
-
-        # Check OHLC consistency
-        if h < l:
-            is_invalid = True
-            reasons.append(f"high ({h}) < low ({l})")
-        if h < o or h < c:
-            is_invalid = True
-            reasons.append(f"high ({h}) is not highest")
-        if l > o or l > c:
-            is_invalid = True
-            reasons.append(f"low ({l}) is not lowest")
-
-        # Check for unreasonable range (>5% for a single bar is suspicious)
-        if l > 0:
-            range_pct = (h - l) / l * 100
-            if range_pct > 5:
-                is_invalid = True
-                reasons.append(f"range {range_pct:.2f}% too large")
-
-        # Check for zero volume on bars that should have it
-        # (this is informational, not necessarily invalid)
-
-        if is_invalid:
-            invalid_bars.append({
-                "id": str(bar.id),
-                "bar_size": bar.bar_size,
-                "timestamp": bar.timestamp.isoformat(),
-                "open": o,
-                "high": h,
-                "low": l,
-                "close": c,
-                "volume": bar.volume,
-                "reasons": reasons
-            })
+    # Only the invalid bars are returned from MongoDB
+    invalid_docs = await MarketData.find(
+        {**query, "$expr": _INVALID_OHLC_EXPR}
+    ).aggregate([{"$project": _INVALID_BAR_FIELDS}]).to_list()
+
+    # Only the first 100 bars are reported (response size), so only those
+    # are formatted
+    invalid_bars = [
+        {
+            "id": bar["_id"],
+            "bar_size": bar["bar_size"],
+            "timestamp": bar["timestamp"],
+            "open": bar["open"],
+            "high": bar["high"],
+            "low": bar["low"],
+            "close": bar["close"],
+            "volume": bar.get("volume"),
+            "reasons": _invalid_ohlc_reasons(bar["open"], bar["high"], bar["low"], bar["close"])
+        }
+        for bar in invalid_docs[:100]
+    ]
 
     # Delete if not dry run
     deleted_count = 0
-    if not dry_run and invalid_bars:
-        for invalid_info in invalid_bars:
-            bar = await MarketData.get(invalid_info["id"])
-            if bar:
-                await bar.delete()
-                deleted_count += 1
-
-    return {
+    if not dry_run and invalid_docs:
+        result = await MarketData.find(
+            {"_id": {"$in": [bar["_id"] for bar in invalid_docs]}}
+        ).delete()
+        deleted_count = result.deleted_count if result else 0
+        _invalidate_market_data_count(op_id)
+
+    # Encoded by orjson in one pass (ObjectId and datetime included),
+    # skipping FastAPI's jsonable_encoder walk over the bar list
+    return ORJSONAppResponse({
         "operation_id": operation_id,
         "bar_size": bar_size,
         "dry_run": dry_run,
-        "invalid_bars_found": len(invalid_bars),
+        "invalid_bars_found": len(invalid_docs),
         "deleted_count": deleted_count,
-        "invalid_bars": invalid_bars[:100]  # Limit to first 100 for response size
-    }
+        "invalid_bars": invalid_bars
+    })
 
 
 # Statistics endpoints
+
+# Aggregations computing stats inside MongoDB, so only a single summary
+# document is sent back instead of every trade/operation
+_TRADE_COUNTS_PIPELINE = [
+    {
+        "$group": {
+            "_id": None,
+            "total_trades": {"$sum": 1},
+            "winning_trades": {"$sum": {"$cond": [{"$gt": ["$pnl", 0]}, 1, 0]}},
+            "losing_trades": {"$sum": {"$cond": [{"$lt": ["$pnl", 0]}, 1, 0]}},
+        }
+    }
+]
+
+_OPERATION_TOTALS_PIPELINE = [
+    {
+        "$group": {
+            "_id": None,
+            "total_operations": {"$sum": 1},
+            "active_operations": {"$sum": {"$cond": [{"$eq": ["$status", "active"]}, 1, 0]}},
+            "total_pnl": {"$sum": "$total_pnl"},
+            "total_capital": {"$sum": "$current_capital"},
+            "initial_capital": {"$sum": "$initial_capital"},
+        }
+    },
+    {
+        "$addFields": {
+            "total_pnl_pct": {
+                "$cond": [
+                    {"$gt": ["$initial_capital", 0]},
+                    {"$multiply": [{"$divide": ["$total_pnl", "$initial_capital"]}, 100]},
+                    0,
+                ]
+            }
+        }
+    },
+]
+
+# Per-operation stats joined onto each operation document. The trade counts
+# reuse _TRADE_COUNTS_PIPELINE inside the $lookup; both lookups go through
+# the operation_id indexes on the joined collections.
+_OPERATION_STATS_STAGES = [
+    {
+        "$lookup": {
+            "from": "trades",
+            "localField": "_id",
+            "foreignField": "operation_id",
+            "pipeline": _TRADE_COUNTS_PIPELINE,
+            "as": "trade_counts",
+        }
+    },
+    {
+        "$lookup": {
+            "from": "positions",
+            "localField": "_id",
+            "foreignField": "operation_id",
+            "pipeline": [{"$match": {"closed_at": None}}, {"$count": "count"}],
+            "as": "open_positions",
+        }
+    },
+    {
+        "$project": {
+            "_id": 0,
+            "id": {"$toString": "$_id"},
+            **{field: 1 for field in _OP_FIELDS},
+            # Older operations predate broker_type (OperationResponse default)
+            "broker_type": {"$ifNull": ["$broker_type", "IBKR"]},
+            "total_trades": {"$ifNull": [{"$first": "$trade_counts.total_trades"}, 0]},
+            "winning_trades": {"$ifNull": [{"$first": "$trade_counts.winning_trades"}, 0]},
+            "losing_trades": {"$ifNull": [{"$first": "$trade_counts.losing_trades"}, 0]},
+            "open_positions": {"$ifNull": [{"$first": "$open_positions.count"}, 0]},
+        }
+    },
+]
+
+_OPERATIONS_WITH_STATS_STAGES = [{"$sort": {"created_at": -1}}, *_OPERATION_STATS_STAGES]
+
+
 @app.get("/api/operations/{operation_id}/stats")
-async def get_operation_stats(operation_id: str):
+async def get_operation_stats(op_id: ObjectId = Depends(valid_op_id)):
     """Get operation statistics"""
-    try:
-        op_id = ObjectId(operation_id)
-    except:
-        raise HTTPException(status_code=400, detail="Invalid operation ID")
-
-    operation = await TradingOperation.get(op_id)
-    if not operation:
+    # One round trip: the trade counts and open positions are joined onto
+    # the operation document inside MongoDB
+    stats = await TradingOperation.find({"_id": op_id}).aggregate(
+        _OPERATION_STATS_STAGES
+    ).to_list()
+    if not stats:
         raise HTTPException(status_code=404, detail="Operation not found")
 
-    # Get additional stats
-    trades = await Trade.find(Trade.operation_id == op_id).to_list()
-    positions = await Position.find(
-        Position.operation_id == op_id,
-        Position.closed_at == None
-    ).to_list()
+    stats = stats[0]
 
     return {
-        "operation_id": str(operation.id),
-        "broker_type": operation.broker_type,
-        "total_trades": len(trades),
-        "winning_trades": len([t for t in trades if t.pnl > 0]),
-        "losing_trades": len([t for t in trades if t.pnl < 0]),
-        "total_pnl": operation.total_pnl,
-        "total_pnl_pct": operation.total_pnl_pct,
-        "open_positions": len(positions),
-        "current_capital": operation.current_capital
+        "operation_id": stats["id"],
+        "broker_type": stats["broker_type"],
+        "total_trades": stats["total_trades"],
+        "winning_trades": stats["winning_trades"],
+        "losing_trades": stats["losing_trades"],
+        "total_pnl": stats["total_pnl"],
+        "total_pnl_pct": stats["total_pnl_pct"],
+        "open_positions": stats["open_positions"],
+        "current_capital": stats["current_capital"]
     }
 
 
 @app.get("/api/stats/overall")
 async def get_overall_stats(engine: TradingEngine = Depends(get_trading_engine)):
     """Get overall statistics across all operations"""
-    operations = await TradingOperation.find_all().to_list()
-    all_trades = await Trade.find_all().to_list()
-
-    total_pnl = sum(op.total_pnl for op in operations)
-    total_capital = sum(op.current_capital for op in operations)
-    initial_capital = sum(op.initial_capital for op in operations)
+    # The trade total is unfiltered, so it comes from collection metadata
+    # instead of a count_documents scan
+    totals, total_trades = await asyncio.gather(
+        TradingOperation.aggregate(_OPERATION_TOTALS_PIPELINE).to_list(),
+        Trade.get_motor_collection().estimated_document_count(),
+    )
+    totals = totals[0] if totals else {}
 
     return {
-        "total_operations": len(operations),
-        "active_operations": len([op for op in operations if op.status == "active"]),
-        "total_trades": len(all_trades),
-        "total_pnl": total_pnl,
-        "total_pnl_pct": (total_pnl / initial_capital * 100) if initial_capital > 0 else 0,
-        "total_capital": total_capital,
-        "initial_capital": initial_capital
+        "total_operations": totals.get("total_operations", 0),
+        "active_operations": totals.get("active_operations", 0),
+        "total_trades": total_trades,
+        "total_pnl": totals.get("total_pnl", 0),
+        "total_pnl_pct": totals.get("total_pnl_pct", 0),
+        "total_capital": totals.get("total_capital", 0),
+        "initial_capital": totals.get("initial_capital", 0)
     }
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize trading engine on startup"""
-    global trading_engine
-
-    # Import here to avoid circular imports
-    from live_trading.brokers import IBKRBroker, OANDABroker, PepperstoneBroker, CTraderBroker
-    from live_trading.journal.journal_manager import JournalManager
-
-    # Log broker type for debugging
-    logger.info(f"Initializing broker: {config.BROKER_TYPE} (from env: {os.getenv('BROKER_TYPE', 'not set')})")
-
-    # Initialize broker based on config
-    if config.BROKER_TYPE == "IBKR":
-        if IBKRBroker is None:
-            raise ImportError(
-                "IBKR broker requested but 'ibapi' module not found. "
-                "Please install IBKR API: pip install -e ./IBJts/source/pythonclient"
-            )
-        broker = IBKRBroker()
-        connected = await broker.connect()
-        if not connected:
-            logger.warning(
-                "Failed to connect to IBKR. Make sure TWS/Gateway is running and API is enabled. "
-                "The system will continue but trading operations will not work until IBKR is connected."
-            )
-    elif config.BROKER_TYPE == "OANDA":
-        if OANDABroker is None:
-            raise ImportError(
-                "OANDA broker requested but 'oandapyV20' module not found. "
-                "Please install OANDA API: pip install oandapyV20"
-            )
-        broker = OANDABroker()
-        connected = await broker.connect()
-        if not connected:
-            logger.warning(
-                "Failed to connect to OANDA. Make sure OANDA_API_KEY and OANDA_ACCOUNT_ID are set correctly. "
-                "The system will continue but trading operations will not work until OANDA is connected."
-            )
-    elif config.BROKER_TYPE == "PEPPERSTONE":
-        if PepperstoneBroker is None:
-            raise ImportError(
-                "Pepperstone broker requested but 'MetaTrader5' module not found. "
-                "Please install MetaTrader5: pip install MetaTrader5"
-            )
-        broker = PepperstoneBroker()
-        connected = await broker.connect()
-        if not connected:
-            logger.warning(
-                "Failed to connect to Pepperstone. Make sure MetaTrader5 terminal is installed and running, "
-                "and PEPPERSTONE_LOGIN, PEPPERSTONE_PASSWORD, and PEPPERSTONE_SERVER are set correctly. "
-                "The system will continue but trading operations will not work until Pepperstone is connected."
-            )
-    elif config.BROKER_TYPE == "CTRADER":
-        if CTraderBroker is None:
-            raise ImportError(
-                "cTrader broker requested but 'ctrader-open-api' module not found. "
-                "Please install cTrader Open API: pip install ctrader-open-api"
-            )
-        broker = CTraderBroker()
-        connected = await broker.connect()
-        if connected:
-            # Start connection health monitor
-            await broker.start_connection_monitor()
-        else:
-            logger.warning(
-                "Failed to connect to cTrader. Make sure CTRADER_CLIENT_ID, CTRADER_CLIENT_SECRET, "
-                "and CTRADER_ACCESS_TOKEN are set correctly. "
-                "The system will continue but trading operations will not work until cTrader is connected."
-            )
-    else:
-        raise ValueError(
-            f"Unsupported broker type: {config.BROKER_TYPE}. "
-            f"Supported types: IBKR, OANDA, PEPPERSTONE, CTRADER"
-        )
-
-    # Initialize journal manager
-    journal_manager = JournalManager()
-
-    # Initialize trading engine
-    trading_engine = TradingEngine(broker, journal_manager)
-    await trading_engine.initialize()
-
-    # Recover from journal (crash recovery)
-    await trading_engine.recover_from_journal()
-
-    # Start background task to periodically sync positions from broker
-    import asyncio
-    async def periodic_position_sync():
-        """Periodically sync positions from broker to database"""
-        while True:
-            try:
-                await asyncio.sleep(30)  # Sync every 30 seconds
-                if trading_engine:
-                    active_operations = await TradingOperation.find(
-                        TradingOperation.status == "active"
-                    ).to_list()
-                    for operation in active_operations:
-                        await trading_engine._sync_positions_from_broker(operation)
-            except Exception as e:
-                logger.error(f"Error in periodic position sync: {e}", exc_info=True)
-
-    asyncio.create_task(periodic_position_sync())
-
-    print(f"Trading engine started on {config.API_HOST}:{config.API_PORT}")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Shutdown trading engine"""
-    global trading_engine
-    if trading_engine:
-        await trading_engine.shutdown()
-
-
 # ============================================================================
 # Connection Health Endpoints
 # ============================================================================
@@ -809,6 +1247,44 @@ async def force_reconnect(engine: TradingEngine = Depends(get_trading_engine)):
 # Logging & Daemon Management Endpoints
 # ============================================================================
 
+_LOGGING_UNAVAILABLE_DETAIL = "Logging system not initialized"
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp (trailing 'Z' allowed), memoizing polled windows"""
+    if value.endswith('Z'):
+        return datetime.fromisoformat(value[:-1] + '+00:00')
+    return datetime.fromisoformat(value)
+
+
+def _logs_stream(rows: Iterator[dict], meta: dict) -> Iterator[bytes]:
+    """
+    Serialize a /api/logs page as it is read: {"logs": [...], "count": N, **meta}.
+
+    Rows are encoded one batch per orjson call; the count is only known
+    once the rows are exhausted, so it is written after the array. A sync
+    generator, so Starlette drives it (and the blocking reads) in its
+    threadpool.
+    """
+    yield b'{"logs":['
+    separator = b""
+    count = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= _EXPORT_BATCH_SIZE:
+            yield separator + orjson.dumps(batch, default=_orjson_default, option=_ORJSON_OPTIONS)[1:-1]
+            separator = b","
+            count += len(batch)
+            batch.clear()
+    if batch:
+        yield separator + orjson.dumps(batch, default=_orjson_default, option=_ORJSON_OPTIONS)[1:-1]
+        count += len(batch)
+    # Splice the remaining keys in after the array, dropping their leading brace
+    yield b"]," + orjson.dumps({"count": count, **meta}, default=_orjson_default, option=_ORJSON_OPTIONS)[1:]
+
+
 @app.get("/api/logs")
 async def get_logs(
     level: Optional[str] = None,
@@ -825,14 +1301,15 @@ async def get_logs(
     Query Parameters:
     - level: Filter by log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     - logger_name: Filter by logger name (partial match)
-    - search: Search in log messages
+    - search: Case-insensitive substring search in log messages and extra fields
     - limit: Maximum number of logs to return (default: 100)
     - offset: Offset for pagination
     - start_time: ISO format start time filter
     - end_time: ISO format end time filter
     """
+    if not HAS_LOG_MANAGER:
+        raise HTTPException(status_code=503, detail=_LOGGING_UNAVAILABLE_DETAIL)
     try:
-        from live_trading.logging import get_log_manager
         log_manager = get_log_manager()
 
         # Parse time filters
@@ -840,15 +1317,40 @@ async def get_logs(
         end_dt = None
         if start_time:
             try:
-                start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+                start_dt = _parse_iso(start_time)
             except ValueError:
                 raise HTTPException(status_code=400, detail="Invalid start_time format")
         if end_time:
             try:
-                end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
+                end_dt = _parse_iso(end_time)
             except ValueError:
                 raise HTTPException(status_code=400, detail="Invalid end_time format")
 
+        filters = {
+            "level": level,
+            "logger": logger_name,
+            "search": search,
+            "start_time": start_time,
+            "end_time": end_time
+        }
+
+        # Large pages are streamed from the log store cursor instead of
+        # building the whole list (and the whole JSON body) first
+        if limit > _EXPORT_BATCH_SIZE:
+            rows = log_manager.iter_logs(
+                start_time=start_dt,
+                end_time=end_dt,
+                level=level,
+                logger=logger_name,
+                search=search,
+                limit=limit,
+                offset=offset
+            )
+            return StreamingResponse(
+                _logs_stream(rows, {"limit": limit, "offset": offset, "filters": filters}),
+                media_type="application/json",
+            )
+
         logs = log_manager.get_logs(
             start_time=start_dt,
             end_time=end_dt,
@@ -859,21 +1361,13 @@ async def get_logs(
             offset=offset
         )
 
-        return {
+        return ORJSONAppResponse({
             "logs": logs,
             "count": len(logs),
             "limit": limit,
             "offset": offset,
-            "filters": {
-                "level": level,
-                "logger": logger_name,
-                "search": search,
-                "start_time": start_time,
-                "end_time": end_time
-            }
-        }
-    except ImportError:
-        raise HTTPException(status_code=503, detail="Logging system not initialized")
+            "filters": filters
+        })
     except Exception as e:
         logger.error(f"Error retrieving logs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -882,82 +1376,99 @@ async def get_logs(
 @app.get("/api/logs/stats")
 async def get_log_stats():
     """Get logging statistics including file sizes and log level counts"""
+    if not HAS_LOG_MANAGER:
+        raise HTTPException(status_code=503, detail=_LOGGING_UNAVAILABLE_DETAIL)
     try:
-        from live_trading.logging import get_log_manager
         log_manager = get_log_manager()
         return log_manager.get_stats()
-    except ImportError:
-        raise HTTPException(status_code=503, detail="Logging system not initialized")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+_LOG_FILES_TTL = 1.0  # seconds
+_log_files_cache: dict = {"expires": 0.0, "rotations": None, "value": None}
+
+
+def _describe_log_file(entry: os.DirEntry, file_type: str, compressed: Optional[bool] = None) -> Optional[dict]:
+    """Describe a log file from its directory entry, or None if it is gone"""
+    try:
+        stat = entry.stat()
+    except FileNotFoundError:
+        return None
+    info = {
+        "name": entry.name,
+        "path": entry.path,
+        "size_mb": round(stat.st_size / 1024 / 1024, 2),
+        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+        "type": file_type,
+    }
+    if compressed is not None:
+        info["compressed"] = compressed
+    return info
+
+
+def _scan_dir(path) -> dict:
+    """Map file name -> DirEntry for one directory, in a single pass"""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        return {}
+
+
 @app.get("/api/logs/files")
 async def get_log_files():
     """Get list of available log files with metadata"""
+    if not HAS_LOG_MANAGER:
+        raise HTTPException(status_code=503, detail=_LOGGING_UNAVAILABLE_DETAIL)
     try:
-        from live_trading.logging import get_log_manager
         log_manager = get_log_manager()
         storage = log_manager.storage
 
+        # Dashboards poll this; reuse the listing briefly unless a rotation
+        # has renamed files since it was built
+        now = asyncio.get_running_loop().time()
+        cache = _log_files_cache
+        if cache["expires"] > now and cache["rotations"] == storage.rotation_count:
+            return cache["value"]
+        rotations = storage.rotation_count
+
         files = []
+        entries = _scan_dir(storage.log_dir)
 
         # Current log file
-        if storage.current_file.exists():
-            stat = storage.current_file.stat()
-            files.append({
-                "name": storage.current_file.name,
-                "path": str(storage.current_file),
-                "size_mb": round(stat.st_size / 1024 / 1024, 2),
-                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "type": "current"
-            })
+        current = entries.get(storage.current_file.name)
+        if current is not None:
+            info = _describe_log_file(current, "current")
+            if info:
+                files.append(info)
 
         # Rotated files
         for i in range(1, storage.max_files + 1):
-            path = storage.log_dir / f"live_trading.log.{i}"
-            path_gz = storage.log_dir / f"live_trading.log.{i}.gz"
-
-            if path.exists():
-                stat = path.stat()
-                files.append({
-                    "name": path.name,
-                    "path": str(path),
-                    "size_mb": round(stat.st_size / 1024 / 1024, 2),
-                    "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    "type": "rotated",
-                    "compressed": False
-                })
-            elif path_gz.exists():
-                stat = path_gz.stat()
-                files.append({
-                    "name": path_gz.name,
-                    "path": str(path_gz),
-                    "size_mb": round(stat.st_size / 1024 / 1024, 2),
-                    "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    "type": "rotated",
-                    "compressed": True
-                })
+            name = f"live_trading.log.{i}"
+            if name in entries:
+                info = _describe_log_file(entries[name], "rotated", compressed=False)
+            elif f"{name}.gz" in entries:
+                info = _describe_log_file(entries[f"{name}.gz"], "rotated", compressed=True)
+            else:
+                continue
+            if info:
+                files.append(info)
 
         # Archive files
-        for archive_file in sorted(storage.archive_dir.glob("*.log.gz"), reverse=True):
-            stat = archive_file.stat()
-            files.append({
-                "name": archive_file.name,
-                "path": str(archive_file),
-                "size_mb": round(stat.st_size / 1024 / 1024, 2),
-                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "type": "archive",
-                "compressed": True
-            })
+        archives = _scan_dir(storage.archive_dir)
+        for name in sorted((n for n in archives if n.endswith(".log.gz")), reverse=True):
+            info = _describe_log_file(archives[name], "archive", compressed=True)
+            if info:
+                files.append(info)
 
-        return {
+        result = {
             "files": files,
             "total_count": len(files),
             "log_directory": str(storage.log_dir)
         }
-    except ImportError:
-        raise HTTPException(status_code=503, detail="Logging system not initialized")
+        cache.update(expires=now + _LOG_FILES_TTL, rotations=rotations, value=result)
+        return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -971,8 +1482,9 @@ async def get_logs_count(
     end_time: Optional[str] = None
 ):
     """Get total count of logs matching filters (for pagination)"""
+    if not HAS_LOG_MANAGER:
+        raise HTTPException(status_code=503, detail=_LOGGING_UNAVAILABLE_DETAIL)
     try:
-        from live_trading.logging import get_log_manager
         log_manager = get_log_manager()
 
         # Parse time filters
@@ -980,28 +1492,25 @@ async def get_logs_count(
         end_dt = None
         if start_time:
             try:
-                start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+                start_dt = _parse_iso(start_time)
             except ValueError:
                 pass
         if end_time:
             try:
-                end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
+                end_dt = _parse_iso(end_time)
             except ValueError:
                 pass
 
-        # Get all matching logs (with high limit) to count
-        logs = log_manager.get_logs(
+        count = log_manager.count_logs(
             level=level,
             logger=logger_name,
             search=search,
             start_time=start_dt,
-            end_time=end_dt,
-            limit=100000,  # High limit for counting
-            offset=0
+            end_time=end_dt
         )
 
         return {
-            "count": len(logs),
+            "count": count,
             "filters": {
                 "level": level,
                 "logger_name": logger_name,
@@ -1010,8 +1519,6 @@ async def get_logs_count(
                 "end_time": end_time
             }
         }
-    except ImportError:
-        raise HTTPException(status_code=503, detail="Logging system not initialized")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1019,60 +1526,53 @@ async def get_logs_count(
 @app.get("/api/logs/errors")
 async def get_recent_errors(limit: int = 50):
     """Get recent error logs"""
-    try:
-        from live_trading.logging import get_log_manager
-        log_manager = get_log_manager()
-        return {
-            "errors": log_manager.get_recent_errors(limit=limit),
-            "limit": limit
-        }
-    except ImportError:
-        raise HTTPException(status_code=503, detail="Logging system not initialized")
+    if not HAS_LOG_MANAGER:
+        raise HTTPException(status_code=503, detail=_LOGGING_UNAVAILABLE_DETAIL)
+    log_manager = get_log_manager()
+    return {
+        "errors": log_manager.get_recent_errors(limit=limit),
+        "limit": limit
+    }
 
 
 @app.get("/api/logs/warnings")
 async def get_recent_warnings(limit: int = 50):
     """Get recent warning logs"""
-    try:
-        from live_trading.logging import get_log_manager
-        log_manager = get_log_manager()
-        return {
-            "warnings": log_manager.get_recent_warnings(limit=limit),
-            "limit": limit
-        }
-    except ImportError:
-        raise HTTPException(status_code=503, detail="Logging system not initialized")
+    if not HAS_LOG_MANAGER:
+        raise HTTPException(status_code=503, detail=_LOGGING_UNAVAILABLE_DETAIL)
+    log_manager = get_log_manager()
+    return {
+        "warnings": log_manager.get_recent_warnings(limit=limit),
+        "limit": limit
+    }
 
 
 @app.post("/api/logs/cleanup")
 async def cleanup_old_logs(older_than_days: int = 30):
     """Clean up old log files"""
-    try:
-        from live_trading.logging import get_log_manager
-        log_manager = get_log_manager()
-        result = log_manager.cleanup_old_logs(older_than_days=older_than_days)
-        return {
-            "success": True,
-            "older_than_days": older_than_days,
-            **result
-        }
-    except ImportError:
-        raise HTTPException(status_code=503, detail="Logging system not initialized")
+    if not HAS_LOG_MANAGER:
+        raise HTTPException(status_code=503, detail=_LOGGING_UNAVAILABLE_DETAIL)
+    log_manager = get_log_manager()
+    result = log_manager.cleanup_old_logs(older_than_days=older_than_days)
+    return {
+        "success": True,
+        "older_than_days": older_than_days,
+        **result
+    }
 
 
 @app.get("/api/daemon/status")
 async def get_daemon_status():
     """Get daemon process status"""
-    try:
-        from live_trading.daemon import get_daemon_manager
-        daemon_manager = get_daemon_manager()
-        return daemon_manager.get_status()
-    except ImportError:
+    if not HAS_DAEMON_MANAGER:
         return {
             "running": True,
             "mode": "interactive",
             "message": "Running in interactive mode (not as daemon)"
         }
+    try:
+        daemon_manager = get_daemon_manager()
+        return daemon_manager.get_status()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1,10 +1,109 @@
 """
 Base Broker interface.
 """
+import asyncio
+import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import Callable, Optional, Dict, Any
+from collections import deque
+from typing import Callable, Optional, Dict, Any, List
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+
+class SubscriptionMap(dict):
+    """
+    Broker subscription map (asset -> broker handle) that keeps a tuple
+    snapshot of its keys, rebuilt only after the map changes, so status
+    polling doesn't allocate a new key list per call.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._snapshot: Optional[tuple] = None
+
+    def keys_snapshot(self) -> tuple:
+        """Subscribed assets as a tuple, cached until the next change"""
+        if self._snapshot is None:
+            self._snapshot = tuple(self)
+        return self._snapshot
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            self._snapshot = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._snapshot = None
+
+    def pop(self, *args):
+        self._snapshot = None
+        return super().pop(*args)
+
+    def popitem(self):
+        self._snapshot = None
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self._snapshot = None
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        self._snapshot = None
+        super().update(*args, **kwargs)
+
+    def clear(self):
+        self._snapshot = None
+        super().clear()
+
+
+class TickBatcher:
+    """
+    Per-tick callback that coalesces ticks arriving within a short window
+    and hands them to a batch callback as one list.
+
+    Safe to call from a broker's network thread; the flush always runs on
+    the event loop the batcher was created for.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[List[Dict[str, Any]]], None],
+        window: float,
+        loop: asyncio.AbstractEventLoop,
+        name: str = ""
+    ):
+        self._callback = callback
+        self._window = window
+        self._loop = loop
+        self._name = name
+        self._pending: deque = deque()
+        self._lock = threading.Lock()
+        self._scheduled = False
+
+    def __call__(self, tick: Dict[str, Any]):
+        with self._lock:
+            self._pending.append(tick)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._loop.call_soon_threadsafe(self._loop.call_later, self._window, self.flush)
+
+    def flush(self):
+        """Deliver all pending ticks to the batch callback"""
+        with self._lock:
+            ticks = list(self._pending)
+            self._pending.clear()
+            self._scheduled = False
+        if not ticks:
+            return
+        try:
+            self._callback(ticks)
+        except Exception as e:
+            logger.error(f"Error in batch callback {self._name or self._callback!r}: {e}")
+
 
 class BaseBroker(ABC):
     """Base class for broker adapters"""
@@ -42,6 +141,29 @@ class BaseBroker(ABC):
         """
         pass
 
+    async def subscribe_market_data_batch(
+        self,
+        asset: str,
+        callback: Callable[[List[Dict[str, Any]]], None],
+        callback_id: str = None,
+        batch_window_ms: float = 1
+    ) -> bool:
+        """
+        Subscribe to market data, receiving ticks in batches.
+
+        Ticks arriving within batch_window_ms of the first pending tick are
+        delivered to the callback as a single list, so bursts cost one call
+        instead of one per tick. Unsubscribe with the same callback_id via
+        unsubscribe_market_data().
+        """
+        batcher = TickBatcher(
+            callback,
+            batch_window_ms / 1000,
+            asyncio.get_running_loop(),
+            name=callback_id or ""
+        )
+        return await self.subscribe_market_data(asset, batcher, callback_id)
+
     @abstractmethod
     async def unsubscribe_market_data(self, asset: str, callback_id: str = None):
         """
@@ -107,9 +229,12 @@ class BaseBroker(ABC):
         Returns:
             Dictionary with connection status, subscriptions, and callback counts
         """
+        subscriptions = getattr(self, '_data_subscriptions', None)
+        if isinstance(subscriptions, SubscriptionMap):
+            subscriptions = subscriptions.keys_snapshot()
         return {
             "connected": getattr(self, 'connected', False),
             "authenticated": getattr(self, 'authenticated', False),
-            "subscriptions": list(getattr(self, '_data_subscriptions', {}).keys()),
+            "subscriptions": tuple(subscriptions or ()),
             "subscription_details": {}
         }
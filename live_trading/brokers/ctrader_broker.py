@@ -3,12 +3,18 @@ cTrader Broker Adapter using Open API.
 """
 import asyncio
 import atexit
+import itertools
 import logging
+import re
 import threading
+import time
 import weakref
+from functools import lru_cache
 from typing import Callable, Optional, Dict, Any, List
-from datetime import datetime
-from collections import defaultdict
+from datetime import datetime, timedelta
+from collections import defaultdict, deque
+
+import numpy as np
 
 # Keep track of all CTraderBroker instances for cleanup
 _broker_instances: List[weakref.ref] = []
@@ -44,13 +50,85 @@ except ImportError:
     Auth = None
     EndPoints = None
 
-from live_trading.brokers.base_broker import BaseBroker
+from live_trading.brokers.base_broker import BaseBroker, SubscriptionMap
 from live_trading.config import config
+from forex_strategies.jit import njit
 
 logger = logging.getLogger(__name__)
 
-
-def twisted_to_asyncio(deferred: Deferred, loop: asyncio.AbstractEventLoop):
+# Broker-specific symbol suffixes (at most one is stripped) and the
+# separators dropped when normalizing cTrader symbol names
+_SYMBOL_SUFFIX_RE = re.compile(r"\.(?:fx|FX|pro|PRO|ecn|ECN|m|M)\Z")
+_MATCH_SUFFIX_RE = re.compile(r"\.(?:FX|PRO|ECN|M|C)\Z")
+_SYMBOL_SEPARATORS = str.maketrans("", "", "/._")
+
+def _by_payload_type(handlers: Dict[str, Any]) -> Dict[int, Any]:
+    """
+    Re-key a {message class name: handler} table by the payloadType each
+    message is sent with, skipping names this SDK version doesn't define.
+    """
+    messages = globals()
+    return {
+        messages[name]().payloadType: handler
+        for name, handler in handlers.items()
+        if name in messages
+    }
+
+
+# Spot ticks buffered between the reactor thread and the callback worker
+_TICK_QUEUE_SIZE = 10000
+
+# Map cTrader order status to our format
+_ORDER_STATUS_MAP: Dict[int, str] = {}
+if CTRADER_AVAILABLE:
+    _ORDER_STATUS_MAP = {
+        ProtoOAOrderStatus.ORDER_STATUS_ACCEPTED: "ACCEPTED",
+        ProtoOAOrderStatus.ORDER_STATUS_FILLED: "FILLED",
+        ProtoOAOrderStatus.ORDER_STATUS_REJECTED: "REJECTED",
+        ProtoOAOrderStatus.ORDER_STATUS_EXPIRED: "EXPIRED",
+        ProtoOAOrderStatus.ORDER_STATUS_CANCELLED: "CANCELLED",
+    }
+
+
+@njit("float64[:, :](int64[:, :], float64)", cache=True)
+def _decode_trendbars(raw, divisor):
+    """
+    Convert raw trendbar columns (low, deltaOpen, deltaHigh, deltaClose) to
+    (open, high, low, close) prices. Low is in pipettes and the deltas are
+    pipettes above it, each scaled by ``divisor`` (10^digits).
+    """
+    n = raw.shape[0]
+    out = np.empty((n, 4), np.float64)
+    for i in range(n):
+        low = raw[i, 0] / divisor
+        out[i, 0] = low + raw[i, 1] / divisor
+        out[i, 1] = low + raw[i, 2] / divisor
+        out[i, 2] = low
+        out[i, 3] = low + raw[i, 3] / divisor
+    return out
+
+
+@lru_cache(maxsize=4096)
+def _symbol_to_asset(symbol: str) -> str:
+    """Convert a cTrader symbol name to asset format (EUR-USD)"""
+    # Remove common suffixes, then separators
+    clean_symbol = _SYMBOL_SUFFIX_RE.sub("", symbol).translate(_SYMBOL_SEPARATORS)
+
+    # For 6-character forex pairs (e.g., EURUSD), insert hyphen
+    if len(clean_symbol) == 6 and clean_symbol.isalpha():
+        return f"{clean_symbol[:3]}-{clean_symbol[3:]}"
+
+    # For other formats, just replace separators with hyphen
+    return symbol.replace("/", "-").replace("_", "-")
+
+
+@lru_cache(maxsize=4096)
+def _normalize_symbol(symbol_name: str) -> str:
+    """Uppercase a cTrader symbol name without its suffix or separators"""
+    return _MATCH_SUFFIX_RE.sub("", symbol_name.upper()).translate(_SYMBOL_SEPARATORS)
+
+
+def twisted_to_asyncio(deferred: "Deferred", loop: asyncio.AbstractEventLoop):
     """Convert a Twisted Deferred to an asyncio Future"""
     future = loop.create_future()
 
@@ -78,40 +156,128 @@ class CTraderBroker(BaseBroker):
         self.connected = False
         self.authenticated = False
         self.account_id: Optional[int] = None
-        self._data_subscriptions: Dict[str, int] = {}  # asset -> symbol_id
+        self._data_subscriptions: Dict[str, int] = SubscriptionMap()  # asset -> symbol_id
         # Multiple callbacks per asset (supports multiple operations on same asset)
         self._data_callbacks: Dict[str, List[Callable]] = {}  # asset -> [callbacks]
         self._data_callback_ids: Dict[str, List[str]] = {}  # asset -> [callback_ids] for tracking
         self._symbol_cache: Dict[str, int] = {}  # asset -> symbol_id
+        self._normalized_symbol_index: Dict[str, int] = {}  # normalized symbol name -> symbol_id
         self._symbol_id_to_name: Dict[int, str] = {}  # symbol_id -> asset (reverse lookup)
         self._symbol_digits: Dict[int, int] = {}  # symbol_id -> digits (decimal places)
+        self._symbol_price_divisor: Dict[int, float] = {}  # symbol_id -> 10 ** digits
         self._order_callbacks: Dict[str, Callable] = {}  # order_id -> callback
         self._reactor_thread: Optional[threading.Thread] = None
         self._pending_requests: Dict[int, Deferred] = {}  # request_id -> deferred
-        self._request_id_counter = 0
+        self._request_ids = itertools.count(1)  # next() is atomic, safe across threads
         self._positions_cache: List[Dict[str, Any]] = []
         self._account_info_cache: Dict[str, Any] = {}
+        # Sends queued from other threads, flushed by a single callFromThread
+        self._pending_sends: deque = deque()
+        self._pending_sends_lock = threading.Lock()
+        self._flush_scheduled = False
         self._historical_data_callbacks: Dict[int, Callable] = {}  # request_id -> callback
         self._historical_data_context: Dict[int, Dict] = {}  # request_id -> context
         self._connection_error: Optional[str] = None  # Store connection errors
         self._auth_error: Optional[str] = None  # Store authentication errors
         self._shutdown_requested = False
+        # asyncio loop the broker was connected from, for reactor -> asyncio calls
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
         # Reconnection state
         self._reconnecting = False
         self._reconnect_attempts = 0
         self._max_reconnect_attempts = 5
         self._reconnect_delay = 5  # seconds
-        self._last_message_time: Optional[datetime] = None
+        # time.monotonic() of the last inbound message (cheap to stamp per message)
+        self._last_message_mono: Optional[float] = None
         self._connection_monitor_task: Optional[asyncio.Task] = None
 
+        # Spot ticks are handed from the reactor thread to a worker thread
+        # that runs the subscriber callbacks, so a slow callback can't stall
+        # the network loop. Bounded: when full the oldest tick is dropped.
+        self._tick_queue: deque = deque(maxlen=_TICK_QUEUE_SIZE)
+        self._tick_ready = threading.Condition()
+        self._tick_worker: Optional[threading.Thread] = None
+        self._tick_worker_stop = False
+        self._dropped_ticks = 0
+
+        # Inbound payloadType -> handler for the extracted message, looked up
+        # per message in _on_message_received. None marks messages that need
+        # no parsing here: heartbeats (they only refresh the message time) and
+        # responses consumed by their request's own deferred callback.
+        self._message_handlers: Dict[int, Optional[Callable[[Any], None]]] = _by_payload_type({
+            "ProtoOASpotEvent": self._handle_spot_event,
+            "ProtoOAExecutionEvent": self._handle_execution_event,
+            "ProtoOASubscribeSpotsRes": self._handle_subscribe_spots_res,
+            "ProtoOAOrderErrorEvent": self._handle_order_error,
+            "ProtoOAReconcileRes": self._handle_get_positions_res,
+            "ProtoOAGetPositionsRes": self._handle_get_positions_res,
+            "ProtoOASymbolsListRes": self._handle_symbols_list_res,
+            "ProtoOASymbolByIdRes": self._handle_symbols_list_res,
+            "ProtoOAGetTickDataRes": self._handle_get_tick_data_res,
+            "ProtoOAErrorRes": self._handle_error_res,
+            "ProtoHeartbeatEvent": None,
+            "ProtoOAGetAccountListByAccessTokenRes": None,  # _on_account_list
+            "ProtoOAGetAccountListRes": None,  # _on_account_list
+            "ProtoOAAccountAuthRes": None,  # _on_account_auth_success
+            "ProtoOAApplicationAuthRes": None,  # _on_application_auth_success
+            "ProtoOAGetTrendbarsRes": None,  # fetch_historical_data
+        })
+
         # Register this instance for cleanup at exit
         _broker_instances.append(weakref.ref(self))
 
     def _get_next_request_id(self) -> int:
         """Get next request ID"""
-        self._request_id_counter += 1
-        return self._request_id_counter
+        return next(self._request_ids)
+
+    def _send_from_thread(self, send: Callable[[], None]):
+        """
+        Run a send closure on the reactor thread.
+
+        Sends queued while a flush is already pending ride along with it, so
+        a burst of requests (e.g. resubscribing after a reconnect) wakes the
+        reactor once instead of once per request.
+        """
+        with self._pending_sends_lock:
+            self._pending_sends.append(send)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        scheduled = False
+        try:
+            reactor.callFromThread(self._flush_pending_sends)
+            scheduled = True
+        finally:
+            if not scheduled:
+                # Let the next send try to schedule a flush again
+                with self._pending_sends_lock:
+                    self._flush_scheduled = False
+
+    def _flush_pending_sends(self):
+        """Drain queued send closures (runs on the reactor thread)."""
+        with self._pending_sends_lock:
+            self._flush_scheduled = False
+        pending = self._pending_sends
+        while pending:
+            send = pending.popleft()
+            try:
+                send()
+            except Exception as e:
+                logger.error(f"Error running queued send: {e}", exc_info=True)
+
+    def _discard_pending_sends(self):
+        """
+        Drop sends still waiting for the reactor. Called once the reactor is
+        stopped: a flush scheduled on it will never run, and would otherwise
+        leave _flush_scheduled set so later sends queue up forever.
+        """
+        with self._pending_sends_lock:
+            dropped = len(self._pending_sends)
+            self._pending_sends.clear()
+            self._flush_scheduled = False
+        if dropped:
+            logger.debug("Discarded %d queued cTrader sends", dropped)
 
     def _convert_asset_to_symbol(self, asset: str) -> str:
         """
@@ -123,39 +289,13 @@ class CTraderBroker(BaseBroker):
 
     def _convert_symbol_to_asset(self, symbol: str) -> str:
         """Convert cTrader symbol to asset format (EUR-USD)"""
-        # Remove common suffixes
-        clean_symbol = symbol
-        for suffix in [".fx", ".FX", ".pro", ".PRO", ".ecn", ".ECN", ".m", ".M"]:
-            if clean_symbol.endswith(suffix):
-                clean_symbol = clean_symbol[:-len(suffix)]
-                break
+        # Memoized: the full symbol list is re-converted on every lookup
+        return _symbol_to_asset(symbol)
 
-        # Handle different formats
-        clean_symbol = clean_symbol.replace("/", "").replace(".", "").replace("_", "")
-
-        # For 6-character forex pairs (e.g., EURUSD), insert hyphen
-        if len(clean_symbol) == 6 and clean_symbol.isalpha():
-            return f"{clean_symbol[:3]}-{clean_symbol[3:]}"
-
-        # For other formats, just replace separators with hyphen
-        return symbol.replace("/", "-").replace("_", "-")
-
-    def _symbol_matches_asset(self, symbol_name: str, asset: str) -> bool:
-        """Check if a cTrader symbol matches our asset format"""
-        # Normalize both to uppercase without separators
-        asset_normalized = asset.replace("-", "").upper()
-        symbol_normalized = symbol_name.upper()
-
-        # Remove common suffixes from symbol
-        for suffix in [".FX", ".PRO", ".ECN", ".M", ".C"]:
-            if symbol_normalized.endswith(suffix):
-                symbol_normalized = symbol_normalized[:-len(suffix)]
-                break
-
-        # Remove separators
-        symbol_normalized = symbol_normalized.replace("/", "").replace(".", "").replace("_", "")
-
-        return symbol_normalized == asset_normalized
+    def _indexed_symbol_id(self, asset: str) -> Optional[int]:
+        """Find the cTrader symbol matching our asset format in the normalized index"""
+        # Symbol names are indexed uppercase without suffix or separators
+        return self._normalized_symbol_index.get(asset.replace("-", "").upper())
 
     def _convert_price(self, raw_price: float, symbol_id: int) -> float:
         """
@@ -166,9 +306,9 @@ class CTraderBroker(BaseBroker):
 
         For forex pairs with 5 decimal places (most common), the factor is 100000.
         """
-        digits = self._symbol_digits.get(symbol_id, 5)  # Default to 5 for forex
-        conversion_factor = 10 ** digits
-        return raw_price / conversion_factor
+        # Divisor precomputed per symbol (default 10^5 for forex); dividing
+        # rather than multiplying by 10^-digits keeps prices exactly rounded
+        return raw_price / self._symbol_price_divisor.get(symbol_id, 100000.0)
 
     def _start_reactor(self):
         """Start Twisted reactor in a separate thread"""
@@ -182,18 +322,16 @@ class CTraderBroker(BaseBroker):
                 self._connection_error = f"Twisted reactor error: {e}"
 
         if not reactor.running:
+            # Signalled by the reactor itself as soon as it is running
+            started = threading.Event()
+            reactor.callWhenRunning(started.set)
             self._reactor_thread = threading.Thread(target=run_reactor, daemon=True, name="TwistedReactor")
+            start = time.monotonic()
             self._reactor_thread.start()
-            # Wait for reactor to actually be running
-            import time
-            max_wait = 5.0
-            waited = 0
-            while not reactor.running and waited < max_wait:
-                time.sleep(0.1)
-                waited += 0.1
 
-            if reactor.running:
-                logger.info(f"✓ Twisted reactor started successfully (waited {waited:.1f}s)")
+            if started.wait(timeout=5.0):
+                waited = time.monotonic() - start
+                logger.info(f"✓ Twisted reactor started successfully (waited {waited:.3f}s)")
             else:
                 logger.error("✗ Twisted reactor failed to start within timeout")
         else:
@@ -253,6 +391,8 @@ class CTraderBroker(BaseBroker):
     def _force_stop(self):
         """Force stop the reactor - called at exit"""
         self._shutdown_requested = True
+        self._stop_tick_worker()
+        self._discard_pending_sends()
         try:
             if CTRADER_AVAILABLE and reactor.running:
                 try:
@@ -267,7 +407,7 @@ class CTraderBroker(BaseBroker):
         logger.info("[CONNECTION] ✅ Connected to cTrader server")
         self.connected = True
         self._connection_error = None
-        self._last_message_time = datetime.utcnow()  # Reset message time on connect
+        self._last_message_mono = time.monotonic()  # Reset message time on connect
 
         # Authenticate application
         if not config.CTRADER_CLIENT_ID:
@@ -412,7 +552,7 @@ class CTraderBroker(BaseBroker):
         logger.info(f"[CONNECTION] ✅ Authenticated! Account ID: {self.account_id}")
         self.authenticated = True
         self._auth_error = None
-        self._last_message_time = datetime.utcnow()  # Reset message time on auth
+        self._last_message_mono = time.monotonic()  # Reset message time on auth
         # Now we can start trading operations
 
     def _on_auth_error(self, failure):
@@ -455,14 +595,10 @@ class CTraderBroker(BaseBroker):
         # Trigger reconnection if not shutting down
         if not self._shutdown_requested and not self._reconnecting:
             logger.info(f"[CONNECTION] 🔄 Will attempt to reconnect (was_connected={was_connected})...")
-            # Schedule reconnection on asyncio loop
+            # Schedule reconnection on the asyncio loop captured in connect();
+            # this runs on the reactor thread, which has no loop of its own
             try:
-                # Try to get the running loop
-                try:
-                    loop = asyncio.get_running_loop()
-                except RuntimeError:
-                    loop = asyncio.get_event_loop()
-
+                loop = self._loop
                 if loop and loop.is_running():
                     loop.call_soon_threadsafe(lambda: asyncio.create_task(self._attempt_reconnect()))
                 else:
@@ -478,7 +614,7 @@ class CTraderBroker(BaseBroker):
         """Callback for all received messages - runs on reactor thread"""
         try:
             # Track last message time for connection health monitoring
-            self._last_message_time = datetime.utcnow()
+            self._last_message_mono = time.monotonic()
 
             # Use Protobuf.extract() to get the actual message from the wrapper
             # This is the correct way to handle cTrader Open API messages
@@ -486,56 +622,37 @@ class CTraderBroker(BaseBroker):
                 logger.warning("[Reactor Thread] Protobuf helper not available")
                 return
 
+            # Dispatch on the wrapper's payloadType; the payload is only
+            # parsed for messages that have a handler
+            payload_type = message.payloadType
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[Reactor Thread] Message received: payloadType=%s", payload_type)
+            try:
+                handler = self._message_handlers[payload_type]
+            except KeyError:
+                logger.debug("[Reactor Thread] Unhandled message type: payloadType=%s", payload_type)
+                return
+            if handler is None:
+                return
+
             try:
                 extracted = Protobuf.extract(message)
-                message_type = type(extracted).__name__
-                logger.debug(f"[Reactor Thread] Message received: {message_type}")
             except Exception as e:
-                logger.debug(f"[Reactor Thread] Could not extract message: {e}")
+                logger.debug("[Reactor Thread] Could not extract message: %s", e)
                 return
 
-            # Handle different message types based on class name
-            if message_type == "ProtoOASpotEvent":
-                self._handle_spot_event(extracted)
-            elif message_type == "ProtoOAExecutionEvent":
-                self._handle_execution_event(extracted)
-            elif message_type == "ProtoOASubscribeSpotsRes":
-                self._handle_subscribe_spots_res(extracted)
-            elif message_type in ("ProtoOAGetAccountListByAccessTokenRes", "ProtoOAGetAccountListRes"):
-                # Already handled in _on_account_list callback
-                pass
-            elif message_type == "ProtoOAAccountAuthRes":
-                # Already handled in _on_account_auth_success callback
-                pass
-            elif message_type == "ProtoOAApplicationAuthRes":
-                # Already handled in _on_application_auth_success callback
-                pass
-            elif message_type == "ProtoOAOrderErrorEvent":
-                self._handle_order_error(extracted)
-            elif message_type in ("ProtoOAReconcileRes", "ProtoOAGetPositionsRes"):
-                self._handle_get_positions_res(extracted)
-            elif message_type in ("ProtoOASymbolsListRes", "ProtoOASymbolByIdRes"):
-                self._handle_symbols_list_res(extracted)
-            elif message_type == "ProtoOAGetTickDataRes":
-                self._handle_get_tick_data_res(extracted)
-            elif message_type == "ProtoOAGetTrendbarsRes":
-                # Handled via deferred callback in fetch_historical_data
-                logger.debug(f"[Reactor Thread] Received trendbar response with {len(extracted.trendbar) if hasattr(extracted, 'trendbar') else 0} bars")
-            elif message_type == "ProtoOAErrorRes":
-                # Handle error responses
-                error_code = getattr(extracted, 'errorCode', 'UNKNOWN')
-                description = getattr(extracted, 'description', 'No description')
-                logger.error(f"[Reactor Thread] ✗ cTrader API Error: {error_code} - {description}")
-                self._auth_error = f"API Error: {error_code} - {description}"
-            elif message_type == "ProtoHeartbeatEvent":
-                # Heartbeat - log at debug level for monitoring
-                logger.debug("[Reactor Thread] Heartbeat received - connection is alive")
-            else:
-                logger.debug(f"[Reactor Thread] Unhandled message type: {message_type}")
+            handler(extracted)
 
         except Exception as e:
             logger.error(f"[Reactor Thread] Error handling message: {e}", exc_info=True)
 
+    def _handle_error_res(self, response):  # type: ignore
+        """Handle error responses"""
+        error_code = getattr(response, 'errorCode', 'UNKNOWN')
+        description = getattr(response, 'description', 'No description')
+        logger.error(f"[Reactor Thread] ✗ cTrader API Error: {error_code} - {description}")
+        self._auth_error = f"API Error: {error_code} - {description}"
+
     def _handle_spot_event(self, event):  # type: ignore
         """Handle spot price updates"""
         try:
@@ -547,16 +664,15 @@ class CTraderBroker(BaseBroker):
             bid = self._convert_price(raw_bid, symbol_id)
             ask = self._convert_price(raw_ask, symbol_id)
 
-            # Log conversion details on first spot for debugging
-            digits = self._symbol_digits.get(symbol_id, 5)
-            logger.debug(f"Spot price conversion: raw_bid={raw_bid} -> {bid:.5f}, raw_ask={raw_ask} -> {ask:.5f} (digits={digits})")
+            # Checked once per tick so disabled debug logs cost no formatting
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                digits = self._symbol_digits.get(symbol_id, 5)
+                logger.debug("Spot price conversion: raw_bid=%s -> %.5f, raw_ask=%s -> %.5f (digits=%s)",
+                             raw_bid, bid, raw_ask, ask, digits)
 
             # Find asset by symbol_id
-            asset = None
-            for cached_asset, cached_symbol_id in self._symbol_cache.items():
-                if cached_symbol_id == symbol_id:
-                    asset = cached_asset
-                    break
+            asset = self._symbol_id_to_name.get(symbol_id)
 
             if asset and asset in self._data_callbacks:
                 mid_price = (bid + ask) / 2.0
@@ -567,8 +683,10 @@ class CTraderBroker(BaseBroker):
                     return
 
                 # Check for unreasonable spread (>1% is suspicious for forex)
-                spread_pct = abs(ask - bid) / bid * 100 if bid > 0 else 0
-                if spread_pct > 1:
+                # bid > 0 here, so compare without dividing and only work out
+                # the percentage when warning
+                if abs(ask - bid) > bid * 0.01:
+                    spread_pct = abs(ask - bid) / bid * 100
                     logger.warning(f"[cTrader] Unusually large spread for {asset}: {spread_pct:.2f}% (bid={bid:.5f}, ask={ask:.5f})")
 
                 tick_data = {
@@ -580,19 +698,60 @@ class CTraderBroker(BaseBroker):
                     "ask": ask,
                     "timestamp": datetime.utcnow()
                 }
+                # Callbacks run on the tick worker, not the reactor thread
+                self._enqueue_tick(asset, tick_data)
+                if debug:
+                    logger.debug("Spot update for %s: mid=%.5f, bid=%.5f, ask=%.5f", asset, mid_price, bid, ask)
+
+        except Exception as e:
+            logger.error(f"Error handling spot event: {e}", exc_info=True)
+
+    def _enqueue_tick(self, asset: str, tick_data: Dict[str, Any]):
+        """Queue a tick for the worker thread, dropping the oldest if full"""
+        with self._tick_ready:
+            if len(self._tick_queue) == self._tick_queue.maxlen:
+                self._dropped_ticks += 1
+                if self._dropped_ticks % 1000 == 1:
+                    logger.warning(f"[cTrader] Tick queue full - dropped {self._dropped_ticks} oldest ticks so far (callbacks too slow)")
+            self._tick_queue.append((asset, tick_data))
+            if self._tick_worker is None or not self._tick_worker.is_alive():
+                self._tick_worker_stop = False
+                self._tick_worker = threading.Thread(target=self._drain_ticks, name="ctrader-ticks", daemon=True)
+                self._tick_worker.start()
+            self._tick_ready.notify()
+
+    def _drain_ticks(self):
+        """Tick worker: fan queued ticks out to the asset's callbacks"""
+        while True:
+            with self._tick_ready:
+                while not self._tick_queue and not self._tick_worker_stop:
+                    self._tick_ready.wait()
+                if not self._tick_queue:
+                    return
+                pending = list(self._tick_queue)
+                self._tick_queue.clear()
+
+            get_callbacks = self._data_callbacks.get
+            get_callback_ids = self._data_callback_ids.get
+            log_error = logger.error
+            for asset, tick_data in pending:
                 # Fan out to ALL registered callbacks for this asset
-                callbacks = self._data_callbacks[asset]
-                callback_ids = self._data_callback_ids.get(asset, [])
-                for i, callback in enumerate(callbacks):
+                callbacks = get_callbacks(asset, ())
+                for callback, cb_id in itertools.zip_longest(callbacks, get_callback_ids(asset, ())):
+                    if callback is None:
+                        break
                     try:
                         callback(tick_data)
                     except Exception as cb_error:
-                        cb_id = callback_ids[i] if i < len(callback_ids) else f"callback_{i}"
-                        logger.error(f"Error in callback {cb_id} for {asset}: {cb_error}")
-                logger.debug(f"Spot update for {asset}: mid={mid_price:.5f}, bid={bid:.5f}, ask={ask:.5f} (sent to {len(callbacks)} callbacks)")
+                        if cb_id is None:
+                            cb_id = f"callback_{callbacks.index(callback)}"
+                        log_error(f"Error in callback {cb_id} for {asset}: {cb_error}")
 
-        except Exception as e:
-            logger.error(f"Error handling spot event: {e}", exc_info=True)
+    def _stop_tick_worker(self):
+        """Let the tick worker deliver what is queued, then exit"""
+        with self._tick_ready:
+            self._tick_worker_stop = True
+            self._tick_ready.notify()
 
     def _handle_execution_event(self, event):  # type: ignore
         """Handle order execution events"""
@@ -603,15 +762,7 @@ class CTraderBroker(BaseBroker):
             if order_id in self._order_callbacks:
                 callback = self._order_callbacks[order_id]
 
-                # Map cTrader order status to our format
-                status_map = {
-                    ProtoOAOrderStatus.ORDER_STATUS_ACCEPTED: "ACCEPTED",
-                    ProtoOAOrderStatus.ORDER_STATUS_FILLED: "FILLED",
-                    ProtoOAOrderStatus.ORDER_STATUS_REJECTED: "REJECTED",
-                    ProtoOAOrderStatus.ORDER_STATUS_EXPIRED: "EXPIRED",
-                    ProtoOAOrderStatus.ORDER_STATUS_CANCELLED: "CANCELLED",
-                }
-                status = status_map.get(order.orderStatus, "UNKNOWN")
+                status = _ORDER_STATUS_MAP.get(order.orderStatus, "UNKNOWN")
 
                 # Convert execution price if present
                 symbol_id = getattr(order, 'tradeData', {}).symbolId if hasattr(order, 'tradeData') else None
@@ -652,36 +803,37 @@ class CTraderBroker(BaseBroker):
     def _handle_get_positions_res(self, response):  # type: ignore
         """Handle get positions response"""
         positions_list = []
+        # Loop-invariant lookups bound once
+        buy = ProtoOATradeSide.BUY
+        asset_for_symbol = self._symbol_id_to_name.get
+        convert_price = self._convert_price
         for position in response.position:
             # Get symbol name from cache
             symbol_id = position.symbolId
-            asset = None
-            for cached_asset, cached_symbol_id in self._symbol_cache.items():
-                if cached_symbol_id == symbol_id:
-                    asset = cached_asset
-                    break
+            asset = asset_for_symbol(symbol_id)
 
             if not asset:
                 continue
 
             # Convert prices from cTrader integer format
-            entry_price = self._convert_price(position.entryPrice, symbol_id) if hasattr(position, 'entryPrice') else 0
-            current_price = self._convert_price(position.price, symbol_id) if hasattr(position, 'price') else 0
+            entry_price = convert_price(getattr(position, 'entryPrice', 0), symbol_id)
+            current_price = convert_price(getattr(position, 'price', 0), symbol_id)
 
             # Determine position type
-            if position.tradeSide == ProtoOATradeSide.BUY:
+            volume = position.volume
+            if position.tradeSide == buy:
                 position_type = "LONG"
-                quantity = position.volume
+                quantity = volume
             else:
                 position_type = "SHORT"
-                quantity = -position.volume
+                quantity = -volume
 
             # Calculate unrealized PnL (swap, commission, grossProfit are in account currency, not price units)
-            unrealized_pnl = (position.swap if hasattr(position, 'swap') else 0) + \
-                            (position.commission if hasattr(position, 'commission') else 0) + \
-                            (position.grossProfit if hasattr(position, 'grossProfit') else 0)
-            # Convert PnL from cents to actual currency (money is stored in cents)
-            unrealized_pnl = unrealized_pnl / 100.0
+            # and convert it from cents to actual currency (money is stored in cents)
+            unrealized_pnl = (getattr(position, 'swap', 0) +
+                              getattr(position, 'commission', 0) +
+                              getattr(position, 'grossProfit', 0)) / 100.0
+            notional = entry_price * abs(volume)
 
             positions_list.append({
                 "asset": asset,
@@ -690,7 +842,7 @@ class CTraderBroker(BaseBroker):
                 "avg_price": entry_price,
                 "current_price": current_price,
                 "unrealized_pnl": unrealized_pnl,
-                "unrealized_pnl_pct": (unrealized_pnl / (entry_price * abs(position.volume))) * 100 if position.volume != 0 and entry_price != 0 else 0
+                "unrealized_pnl_pct": (unrealized_pnl / notional) * 100 if notional else 0
             })
 
         self._positions_cache = positions_list
@@ -702,12 +854,15 @@ class CTraderBroker(BaseBroker):
                 for symbol in response.symbol:
                     symbol_asset = self._convert_symbol_to_asset(symbol.symbolName)
                     self._symbol_cache[symbol_asset] = symbol.symbolId
-                    self._symbol_id_to_name[symbol.symbolId] = symbol_asset  # Reverse lookup
+                    # Reverse lookup; never replaces a matched/subscribed asset name
+                    self._symbol_id_to_name.setdefault(symbol.symbolId, symbol_asset)
+                    self._normalized_symbol_index[_normalize_symbol(symbol.symbolName)] = symbol.symbolId
 
                     # Store digits for price conversion
                     # cTrader symbols have a 'digits' field indicating decimal places
                     digits = getattr(symbol, 'digits', 5)  # Default to 5 for forex
                     self._symbol_digits[symbol.symbolId] = digits
+                    self._symbol_price_divisor[symbol.symbolId] = float(10 ** digits)
 
                     logger.debug(f"Cached symbol: {symbol_asset} -> {symbol.symbolId} (digits={digits})")
         except Exception as e:
@@ -720,10 +875,10 @@ class CTraderBroker(BaseBroker):
             # In a more sophisticated implementation, you'd track request IDs
             bars = []
             if hasattr(response, 'tickData'):
-                # Try to get symbol_id from the response to determine digits
+                # Try to get symbol_id from the response to pick the cached
+                # 10^digits divisor (10^5 for forex when unknown)
                 symbol_id = getattr(response, 'symbolId', None)
-                digits = self._symbol_digits.get(symbol_id, 5) if symbol_id else 5
-                conversion_factor = 10 ** digits
+                conversion_factor = self._symbol_price_divisor.get(symbol_id, 100000.0)
 
                 for tick in response.tickData:
                     # Convert tick prices from integer format
@@ -739,7 +894,7 @@ class CTraderBroker(BaseBroker):
 
             # Call the first available callback (simplified - in production use request tracking)
             if self._historical_data_callbacks:
-                callback_key = list(self._historical_data_callbacks.keys())[0]
+                callback_key = next(iter(self._historical_data_callbacks))
                 callback = self._historical_data_callbacks.pop(callback_key)
                 context = self._historical_data_context.pop(callback_key, {})
                 callback(bars, context)
@@ -768,6 +923,7 @@ class CTraderBroker(BaseBroker):
         self._auth_error = None
         self.connected = False
         self.authenticated = False
+        self._loop = asyncio.get_running_loop()
 
         try:
             # Validate configuration
@@ -944,6 +1100,8 @@ class CTraderBroker(BaseBroker):
 
         # Stop the reactor (which will also stop the client)
         self._stop_reactor()
+        self._stop_tick_worker()
+        self._discard_pending_sends()
 
         logger.info("[CONNECTION] ✅ Disconnected from cTrader (graceful)")
 
@@ -972,15 +1130,23 @@ class CTraderBroker(BaseBroker):
         # Wait before reconnecting (exponential backoff)
         await asyncio.sleep(delay)
 
-        try:
-            # Store current subscriptions before reconnecting
-            # Deep copy the callback lists and IDs
-            saved_subscriptions = dict(self._data_subscriptions)
-            saved_callbacks = {asset: list(callbacks) for asset, callbacks in self._data_callbacks.items()}
-            saved_callback_ids = {asset: list(ids) for asset, ids in self._data_callback_ids.items()}
+        # Keep the current subscription state to restore after reconnecting.
+        # The tracking dicts are swapped for fresh ones below rather than
+        # cleared, so these references need no copying
+        saved_subscriptions = self._data_subscriptions
+        saved_callbacks = self._data_callbacks
+        saved_callback_ids = self._data_callback_ids
 
-            # Stop existing reactor
+        def keep_saved_subscriptions():
+            # Failed attempt: hand the saved state to the next attempt
+            self._data_subscriptions = saved_subscriptions
+            self._data_callbacks = saved_callbacks
+            self._data_callback_ids = saved_callback_ids
+
+        try:
+            # Stop existing reactor; sends queued for it will never run
             self._stop_reactor()
+            self._discard_pending_sends()
             await asyncio.sleep(1)  # Give it time to clean up
 
             # Reset state
@@ -988,10 +1154,10 @@ class CTraderBroker(BaseBroker):
             self.authenticated = False
             self._connection_error = None
             self._auth_error = None
-            # Clear subscription tracking (will be rebuilt)
-            self._data_subscriptions.clear()
-            self._data_callbacks.clear()
-            self._data_callback_ids.clear()
+            # Start subscription tracking afresh (will be rebuilt)
+            self._data_subscriptions = SubscriptionMap()
+            self._data_callbacks = {}
+            self._data_callback_ids = {}
 
             # Attempt to reconnect
             logger.info(f"[CONNECTION] 🔄 Connecting to cTrader...")
@@ -1018,6 +1184,7 @@ class CTraderBroker(BaseBroker):
                 logger.info(f"[CONNECTION] ✅ All subscriptions restored - trading resumed")
             else:
                 logger.warning(f"[CONNECTION] ⚠️ Reconnection failed, scheduling retry...")
+                keep_saved_subscriptions()
                 # Schedule another attempt
                 self._reconnecting = False  # Reset before scheduling next attempt
                 asyncio.create_task(self._attempt_reconnect())
@@ -1025,6 +1192,7 @@ class CTraderBroker(BaseBroker):
 
         except Exception as e:
             logger.error(f"[CONNECTION] ❌ Reconnection error: {e}", exc_info=True)
+            keep_saved_subscriptions()
             self._reconnecting = False  # Reset before scheduling next attempt
             asyncio.create_task(self._attempt_reconnect())
             return
@@ -1042,19 +1210,17 @@ class CTraderBroker(BaseBroker):
             RECONNECT_THRESHOLD = 120  # seconds - force reconnect if no messages
             CHECK_INTERVAL = 30  # seconds between checks
             STATUS_LOG_INTERVAL = 300  # Log subscription details every 5 minutes
-            last_status_log = datetime.utcnow()
+            last_status_log = time.monotonic()
 
             while not self._shutdown_requested:
                 try:
                     await asyncio.sleep(CHECK_INTERVAL)
 
                     # Calculate time since last message
-                    seconds_since_message = None
-                    if self._last_message_time:
-                        seconds_since_message = (datetime.utcnow() - self._last_message_time).total_seconds()
+                    seconds_since_message = self._seconds_since_message()
 
                     # Log status periodically
-                    if (datetime.utcnow() - last_status_log).total_seconds() > STATUS_LOG_INTERVAL:
+                    if time.monotonic() - last_status_log > STATUS_LOG_INTERVAL:
                         # Build detailed subscription info
                         sub_details = []
                         for asset, callbacks in self._data_callbacks.items():
@@ -1069,7 +1235,7 @@ class CTraderBroker(BaseBroker):
                             logger.info(f"[CONNECTION] 📊 Active subscriptions: {', '.join(sub_details)}")
                         else:
                             logger.warning(f"[CONNECTION] ⚠️ No active market data subscriptions")
-                        last_status_log = datetime.utcnow()
+                        last_status_log = time.monotonic()
 
                     if not self.connected or not self.authenticated:
                         logger.error(f"[CONNECTION] ❌ Not connected/authenticated - triggering reconnect")
@@ -1096,6 +1262,12 @@ class CTraderBroker(BaseBroker):
         self._connection_monitor_task = asyncio.create_task(monitor_loop())
         logger.info("[CONNECTION] 🔍 Connection health monitor started")
 
+    def _seconds_since_message(self) -> Optional[float]:
+        """Seconds since the last inbound message, or None if none yet"""
+        if self._last_message_mono is None:
+            return None
+        return time.monotonic() - self._last_message_mono
+
     def get_connection_status(self) -> Dict[str, Any]:
         """Get current connection status"""
         # Build subscription details with callback counts
@@ -1108,21 +1280,26 @@ class CTraderBroker(BaseBroker):
                 "callback_ids": callback_ids
             }
 
+        seconds_since_message = self._seconds_since_message()
+        last_message_time = None
+        if seconds_since_message is not None:
+            last_message_time = (datetime.utcnow() - timedelta(seconds=seconds_since_message)).isoformat()
+
         status = {
             "connected": self.connected,
             "authenticated": self.authenticated,
             "account_id": self.account_id,
             "reconnecting": self._reconnecting,
             "reconnect_attempts": self._reconnect_attempts,
-            "last_message_time": self._last_message_time.isoformat() if self._last_message_time else None,
-            "subscriptions": list(self._data_subscriptions.keys()),
+            "last_message_time": last_message_time,
+            "subscriptions": self._data_subscriptions.keys_snapshot(),
             "subscription_details": subscription_details,
             "connection_error": self._connection_error,
             "auth_error": self._auth_error
         }
 
-        if self._last_message_time:
-            status["seconds_since_message"] = (datetime.utcnow() - self._last_message_time).total_seconds()
+        if seconds_since_message is not None:
+            status["seconds_since_message"] = seconds_since_message
 
         return status
 
@@ -1131,6 +1308,13 @@ class CTraderBroker(BaseBroker):
         if asset in self._symbol_cache:
             return self._symbol_cache[asset]
 
+        # A symbol list loaded earlier may already hold a differently-named match
+        symbol_id = self._indexed_symbol_id(asset)
+        if symbol_id is not None:
+            self._symbol_cache[asset] = symbol_id
+            self._symbol_id_to_name[symbol_id] = asset
+            return symbol_id
+
         if not self.client or not self.authenticated:
             return None
 
@@ -1150,32 +1334,32 @@ class CTraderBroker(BaseBroker):
                 try:
                     extracted = Protobuf.extract(response)
                     if hasattr(extracted, 'symbol'):
-                        found_match = False
-                        sample_symbols = []
+                        symbol_cache = self._symbol_cache
+                        normalized_index = self._normalized_symbol_index
                         for symbol in extracted.symbol:
                             symbol_name = symbol.symbolName
                             symbol_asset = self._convert_symbol_to_asset(symbol_name)
 
                             # Cache the symbol with its converted asset name
-                            self._symbol_cache[symbol_asset] = symbol.symbolId
-                            self._symbol_id_to_name[symbol.symbolId] = symbol_asset
+                            symbol_cache[symbol_asset] = symbol.symbolId
+                            self._symbol_id_to_name.setdefault(symbol.symbolId, symbol_asset)
 
                             # Also cache with original symbol name for direct lookup
-                            self._symbol_cache[symbol_name] = symbol.symbolId
-
-                            # Check if this symbol matches what we're looking for
-                            if self._symbol_matches_asset(symbol_name, asset):
-                                self._symbol_cache[asset] = symbol.symbolId
-                                self._symbol_id_to_name[symbol.symbolId] = asset
-                                found_match = True
-                                logger.info(f"Matched symbol: {symbol_name} -> {asset} (ID: {symbol.symbolId})")
+                            symbol_cache[symbol_name] = symbol.symbolId
 
-                            # Collect sample symbols for debugging
-                            if len(sample_symbols) < 10:
-                                sample_symbols.append(symbol_name)
+                            # Index by normalized name so any asset resolves in one lookup
+                            normalized_index[_normalize_symbol(symbol_name)] = symbol.symbolId
 
+                        sample_symbols = [symbol.symbolName for symbol in extracted.symbol[:10]]
                         logger.info(f"Cached {len(extracted.symbol)} symbols. Sample: {sample_symbols}")
-                        if not found_match:
+
+                        # Check if a symbol matches what we're looking for
+                        matched_id = self._indexed_symbol_id(asset)
+                        if matched_id is not None:
+                            symbol_cache[asset] = matched_id
+                            self._symbol_id_to_name[matched_id] = asset
+                            logger.info(f"Matched symbol: {asset} -> ID {matched_id}")
+                        else:
                             logger.warning(f"No exact match found for {asset} in symbol list")
 
                     if not future.done():
@@ -1203,7 +1387,7 @@ class CTraderBroker(BaseBroker):
                     if not future.done():
                         loop.call_soon_threadsafe(future.set_result, False)
 
-            reactor.callFromThread(send_request)
+            self._send_from_thread(send_request)
 
             # Wait for response with timeout
             try:
@@ -1276,6 +1460,8 @@ class CTraderBroker(BaseBroker):
                 return False
 
             self._data_subscriptions[asset] = symbol_id
+            # Spot events carry only the symbol_id; route them to this asset
+            self._symbol_id_to_name[symbol_id] = asset
 
             # Subscribe to spots - must be sent from reactor thread
             request = ProtoOASubscribeSpotsReq()
@@ -1303,7 +1489,7 @@ class CTraderBroker(BaseBroker):
                     else:
                         loop.call_soon_threadsafe(future.set_result, False)
 
-                reactor.callFromThread(send_request)
+                self._send_from_thread(send_request)
                 logger.debug(f"[CONNECTION] Requesting cTrader subscription for {asset} (symbol_id: {symbol_id})")
 
                 # Wait with timeout
@@ -1376,7 +1562,7 @@ class CTraderBroker(BaseBroker):
                     else:
                         loop.call_soon_threadsafe(future.set_result, False)
 
-                reactor.callFromThread(send_request)
+                self._send_from_thread(send_request)
 
                 # Short timeout for unsubscribe
                 try:
@@ -1493,7 +1679,7 @@ class CTraderBroker(BaseBroker):
                 else:
                     loop.call_soon_threadsafe(future.set_result, "")
 
-            reactor.callFromThread(send_request)
+            self._send_from_thread(send_request)
 
             # Wait for response with timeout
             try:
@@ -1549,7 +1735,7 @@ class CTraderBroker(BaseBroker):
                 else:
                     loop.call_soon_threadsafe(future.set_result, False)
 
-            reactor.callFromThread(send_request)
+            self._send_from_thread(send_request)
 
             # Wait for response with timeout
             try:
@@ -1584,24 +1770,24 @@ class CTraderBroker(BaseBroker):
                     if hasattr(extracted, 'position'):
                         for pos in extracted.position:
                             # Get symbol_id for price conversion
-                            symbol_id = pos.tradeData.symbolId if hasattr(pos, 'tradeData') else None
+                            trade_data = getattr(pos, 'tradeData', None)
+                            symbol_id = trade_data.symbolId if trade_data is not None else None
 
                             # Convert prices from cTrader integer format
-                            entry_price = self._convert_price(pos.price, symbol_id) if hasattr(pos, 'price') and symbol_id else 0
+                            entry_price = self._convert_price(getattr(pos, 'price', 0), symbol_id) if symbol_id else 0
 
                             # Convert unrealized PnL from cents to actual currency
-                            unrealized_pnl = ((pos.swap if hasattr(pos, 'swap') else 0) +
-                                            (pos.commission if hasattr(pos, 'commission') else 0)) / 100.0
+                            unrealized_pnl = (getattr(pos, 'swap', 0) + getattr(pos, 'commission', 0)) / 100.0
 
                             positions.append({
                                 "position_id": str(pos.positionId),
                                 "symbol": self._get_symbol_name(symbol_id) if symbol_id else "UNKNOWN",
-                                "side": "BUY" if hasattr(pos, 'tradeData') and pos.tradeData.tradeSide == 1 else "SELL",
-                                "volume": pos.tradeData.volume / 100 if hasattr(pos, 'tradeData') else 0,  # Convert from cents
+                                "side": "BUY" if trade_data is not None and trade_data.tradeSide == 1 else "SELL",
+                                "volume": trade_data.volume / 100 if trade_data is not None else 0,  # Convert from cents
                                 "entry_price": entry_price,
                                 "current_price": entry_price,  # Will be updated with spot price
                                 "unrealized_pnl": unrealized_pnl,
-                                "margin_used": pos.usedMargin / 100 if hasattr(pos, 'usedMargin') else 0,
+                                "margin_used": getattr(pos, 'usedMargin', 0) / 100,
                             })
 
                     self._positions_cache = positions
@@ -1622,7 +1808,7 @@ class CTraderBroker(BaseBroker):
                     d = self.client.send(request)
                     d.addCallbacks(on_success, on_error)
 
-            reactor.callFromThread(send_request)
+            self._send_from_thread(send_request)
 
             # Wait for response with timeout
             try:
@@ -1693,7 +1879,7 @@ class CTraderBroker(BaseBroker):
                     d = self.client.send(request)
                     d.addCallbacks(on_success, on_error)
 
-            reactor.callFromThread(send_request)
+            self._send_from_thread(send_request)
 
             # Wait for response with timeout
             try:
@@ -1804,26 +1990,22 @@ class CTraderBroker(BaseBroker):
                     if hasattr(extracted, 'trendbar') and extracted.trendbar:
                         # Get digits for this symbol for price conversion
                         digits = self._symbol_digits.get(symbol_id, 5)  # Default to 5 for forex
-                        conversion_factor = 10 ** digits
+                        conversion_factor = self._symbol_price_divisor.get(symbol_id, 100000.0)
+
+                        # Convert trendbars to OHLC in one compiled pass.
+                        # Trendbars use delta values from the low price
+                        raw = np.array(
+                            [(getattr(bar, 'low', 0), getattr(bar, 'deltaOpen', 0),
+                              getattr(bar, 'deltaHigh', 0), getattr(bar, 'deltaClose', 0))
+                             for bar in extracted.trendbar],
+                            dtype=np.int64,
+                        )
+                        ohlc = _decode_trendbars(raw, conversion_factor)
 
                         anomaly_count = 0
-                        for idx, bar in enumerate(extracted.trendbar):
-                            # Convert trendbar to OHLCV format
-                            # Trendbars use delta values from the low price
+                        for idx, (bar, (open_price, high, low, close)) in enumerate(zip(extracted.trendbar, ohlc.tolist())):
                             # utcTimestampInMinutes is the bar timestamp in minutes since epoch
                             timestamp_seconds = bar.utcTimestampInMinutes * 60 if hasattr(bar, 'utcTimestampInMinutes') else 0
-
-                            # Get raw values for debugging
-                            raw_low = bar.low if hasattr(bar, 'low') else 0
-                            raw_delta_open = bar.deltaOpen if hasattr(bar, 'deltaOpen') else 0
-                            raw_delta_high = bar.deltaHigh if hasattr(bar, 'deltaHigh') else 0
-                            raw_delta_close = bar.deltaClose if hasattr(bar, 'deltaClose') else 0
-
-                            # Convert: low is in pipettes, deltas are ALSO in pipettes
-                            low = raw_low / conversion_factor
-                            open_price = low + (raw_delta_open / conversion_factor)
-                            high = low + (raw_delta_high / conversion_factor)
-                            close = low + (raw_delta_close / conversion_factor)
                             volume = bar.volume if hasattr(bar, 'volume') else 0
 
                             # Validate OHLC consistency
@@ -1851,6 +2033,7 @@ class CTraderBroker(BaseBroker):
                             if is_anomaly:
                                 anomaly_count += 1
                                 if anomaly_count <= 5:  # Only log first 5 anomalies
+                                    raw_low, raw_delta_open, raw_delta_high, raw_delta_close = raw[idx].tolist()
                                     logger.warning(
                                         f"OHLC anomaly for {asset} bar {idx}: {', '.join(anomaly_reason)}. "
                                         f"Raw: low={raw_low}, dO={raw_delta_open}, dH={raw_delta_high}, dC={raw_delta_close}. "
@@ -1925,7 +2108,7 @@ class CTraderBroker(BaseBroker):
                         loop.call_soon_threadsafe(future.set_result, False)
 
             logger.info(f"Requesting historical data for {asset}: bar_size={bar_size}, interval={interval}, symbolId={symbol_id}")
-            reactor.callFromThread(send_request)
+            self._send_from_thread(send_request)
 
             # Wait for response with timeout
             try:
@@ -17,7 +17,7 @@ from ibapi.order import Order as IBOrder
 from ibapi.common import TickerId, BarData, MarketDataTypeEnum
 from ibapi.ticktype import TickTypeEnum
 
-from live_trading.brokers.base_broker import BaseBroker
+from live_trading.brokers.base_broker import BaseBroker, SubscriptionMap
 from live_trading.config import config
 
 logger = logging.getLogger(__name__)
@@ -486,7 +486,7 @@ class IBKRBroker(BaseBroker):
         self.connected = False
         self._req_id_counter = 0
         self._order_id_counter = 0
-        self._data_subscriptions: Dict[str, int] = {}  # asset -> req_id
+        self._data_subscriptions: Dict[str, int] = SubscriptionMap()  # asset -> req_id
         self._api_thread: Optional[threading.Thread] = None
         self._contracts_cache: Optional[Dict[str, Dict[str, str]]] = None
 
@@ -12,7 +12,7 @@ from oandapyV20 import API
 from oandapyV20.endpoints import accounts, orders, positions, pricing, instruments
 from oandapyV20.exceptions import V20Error
 
-from live_trading.brokers.base_broker import BaseBroker
+from live_trading.brokers.base_broker import BaseBroker, SubscriptionMap
 from live_trading.config import config
 
 logger = logging.getLogger(__name__)
@@ -25,7 +25,7 @@ class OANDABroker(BaseBroker):
         self.api: Optional[API] = None
         self.account_id: Optional[str] = None
         self.connected = False
-        self._data_subscriptions: Dict[str, websocket.WebSocketApp] = {}  # asset -> websocket
+        self._data_subscriptions: Dict[str, websocket.WebSocketApp] = SubscriptionMap()  # asset -> websocket
         self._data_callbacks: Dict[str, Callable] = {}  # asset -> callback
         self._ws_threads: Dict[str, threading.Thread] = {}  # asset -> thread
 
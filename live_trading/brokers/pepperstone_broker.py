@@ -15,7 +15,7 @@ except ImportError:
     MT5_AVAILABLE = False
     mt5 = None
 
-from live_trading.brokers.base_broker import BaseBroker
+from live_trading.brokers.base_broker import BaseBroker, SubscriptionMap
 from live_trading.config import config
 
 logger = logging.getLogger(__name__)
@@ -31,7 +31,7 @@ class PepperstoneBroker(BaseBroker):
             )
         self.connected = False
         self.account_info: Optional[Dict[str, Any]] = None
-        self._data_subscriptions: Dict[str, bool] = {}  # asset -> subscribed
+        self._data_subscriptions: Dict[str, bool] = SubscriptionMap()  # asset -> subscribed
         self._data_callbacks: Dict[str, Callable] = {}  # asset -> callback
         self._tick_threads: Dict[str, threading.Thread] = {}  # asset -> thread
         self._stop_tick_threads: Dict[str, bool] = {}  # asset -> stop flag
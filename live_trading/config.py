@@ -33,6 +33,8 @@ class Config:
     MONGODB_URL: str = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
     MONGODB_DB_NAME: str = os.getenv("MONGODB_DB_NAME", "trading_bot")
     MONGODB_CONNECT_TIMEOUT_MS: int = int(os.getenv("MONGODB_CONNECT_TIMEOUT_MS", "30000"))  # 30 seconds for Atlas
+    MONGODB_MAX_POOL_SIZE: int = int(os.getenv("MONGODB_MAX_POOL_SIZE", "20"))
+    MONGODB_MIN_POOL_SIZE: int = int(os.getenv("MONGODB_MIN_POOL_SIZE", "5"))  # Connections kept warm
 
     # Broker Configuration
     BROKER_TYPE: str = os.getenv("BROKER_TYPE", "IBKR").upper()  # IBKR, OANDA, PEPPERSTONE, or CTRADER
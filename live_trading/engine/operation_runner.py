@@ -3,7 +3,7 @@ Operation Runner - Manages a single trading operation.
 """
 import logging
 import asyncio
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from bson import ObjectId
 
@@ -32,6 +32,7 @@ class OperationRunner:
         self.running = False
         self.task: Optional[asyncio.Task] = None
         self.event_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tick_tasks: set = set()  # in-flight tick batches (keeps tasks referenced)
 
     async def start(self):
         """Start the operation"""
@@ -90,12 +91,18 @@ class OperationRunner:
             await self._fill_data_gaps(operation)
 
         # Subscribe to market data from broker
-        # Create a callback that routes broker ticks to data manager
-        # Note: Broker callbacks are synchronous and run in the IBKR API thread,
-        # so we need to use run_coroutine_threadsafe to schedule async work
-        def broker_tick_callback(tick_data: Dict):
-            """Callback to route broker ticks to data manager"""
-            if tick_data.get("type") == "tick":
+        # Broker callbacks run on the broker's own thread. Ticks are queued and
+        # handed over in batches on the event loop, so a burst of ticks costs
+        # one cross-thread wakeup instead of one per tick
+        tick_count = 0
+
+        def broker_ticks_callback(ticks: List[Dict]):
+            """Route a batch of broker ticks to the data manager (runs on the event loop)"""
+            nonlocal tick_count
+            batch = []
+            for tick_data in ticks:
+                if tick_data.get("type") != "tick":
+                    continue
                 # Extract price from tick data
                 # IBKR sends different tick types (bid, ask, last, etc.)
                 price = tick_data.get("price")
@@ -103,41 +110,30 @@ class OperationRunner:
                 timestamp = tick_data.get("timestamp", datetime.utcnow())
 
                 # Log first tick and periodic ticks for debugging
-                tick_count = getattr(broker_tick_callback, '_tick_count', 0) + 1
-                broker_tick_callback._tick_count = tick_count
+                tick_count += 1
                 if tick_count == 1:
                     logger.info(f"[TICK] First tick received for {operation.asset}: price={price}")
                 elif tick_count % 500 == 0:
                     logger.info(f"[TICK] Tick #{tick_count} for {operation.asset}: price={price}")
 
-                if price is not None and self.event_loop is not None:
-                    # Schedule async work from the IBKR thread to the main event loop
-                    # This is the correct way to call async functions from a different thread
-                    try:
-                        coro = self.data_manager.handle_tick(
-                            operation_id=str(self.operation_id),
-                            asset=operation.asset,
-                            price=price,
-                            size=size,
-                            timestamp=timestamp
-                        )
-                        # Schedule the coroutine in the main event loop
-                        future = asyncio.run_coroutine_threadsafe(coro, self.event_loop)
-                        # Don't wait for the result - fire and forget
-                        # The future will be executed in the main event loop
-                    except Exception as e:
-                        logger.error(f"Error scheduling tick processing: {e}", exc_info=True)
-                elif price is not None:
-                    logger.warning(f"Received tick but no event loop available (price: {price})")
+                if price is not None:
+                    batch.append((price, size, timestamp))
+
+            if batch:
+                # Fire and forget - ticks in a batch are processed in order
+                task = asyncio.ensure_future(self._handle_ticks(operation.asset, batch))
+                self._tick_tasks.add(task)
+                task.add_done_callback(self._tick_tasks.discard)
 
         # Get broker from data manager and subscribe
         # Use operation_id as callback_id to allow multiple operations on same asset
         if self.data_manager.broker:
             callback_id = f"op_{self.operation_id}"
-            subscribed = await self.data_manager.broker.subscribe_market_data(
+            subscribed = await self.data_manager.broker.subscribe_market_data_batch(
                 asset=operation.asset,
-                callback=broker_tick_callback,
-                callback_id=callback_id
+                callback=broker_ticks_callback,
+                callback_id=callback_id,
+                batch_window_ms=0
             )
             if subscribed:
                 logger.info(f"Subscribed to market data for {operation.asset} (callback_id: {callback_id})")
@@ -195,6 +191,21 @@ class OperationRunner:
             await operation.save()
             logger.info(f"Operation {self.operation_id} resumed")
 
+    async def _handle_ticks(self, asset: str, ticks: List[Tuple[float, float, datetime]]):
+        """Feed a batch of (price, size, timestamp) ticks to the data manager in order"""
+        operation_id = str(self.operation_id)
+        for price, size, timestamp in ticks:
+            try:
+                await self.data_manager.handle_tick(
+                    operation_id=operation_id,
+                    asset=asset,
+                    price=price,
+                    size=size,
+                    timestamp=timestamp
+                )
+            except Exception as e:
+                logger.error(f"Error processing tick: {e}", exc_info=True)
+
     async def _on_new_bar(self, bar_data: Dict, indicators: Dict):
         """Callback when a new bar is completed"""
         if not self.running:
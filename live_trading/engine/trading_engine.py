@@ -1,6 +1,7 @@
 """
 Trading Engine - Orchestrates all trading operations.
 """
+import asyncio
 import logging
 from typing import Dict, Optional, List, Any
 from datetime import datetime
@@ -65,6 +66,8 @@ class TradingEngine:
             connection_options = {
                 "serverSelectionTimeoutMS": config.MONGODB_CONNECT_TIMEOUT_MS,
                 "connectTimeoutMS": config.MONGODB_CONNECT_TIMEOUT_MS,
+                "maxPoolSize": config.MONGODB_MAX_POOL_SIZE,
+                "minPoolSize": config.MONGODB_MIN_POOL_SIZE,
             }
 
             # For Atlas connections, ensure connection string has required parameters
@@ -147,8 +150,27 @@ class TradingEngine:
         # Initialize journal sequence counter
         await self.journal.initialize_sequence_counter()
 
+        await self.warm_connection_pool()
+
         logger.info("Trading engine initialized")
 
+    async def warm_connection_pool(self):
+        """
+        Open pooled MongoDB connections up front so the first API requests
+        don't pay connection setup latency.
+
+        Issues one concurrent query per collection the API reads, which makes
+        the driver check out (and establish) a connection for each.
+        """
+        models = (TradingOperation, Trade, Order, Position, Transaction)
+        results = await asyncio.gather(
+            *(model.find_one() for model in models),
+            return_exceptions=True
+        )
+        for model, result in zip(models, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to warm connection for {model.__name__}: {result}")
+
     async def start_operation(
         self,
         asset: str,
@@ -5,10 +5,12 @@ Integrates with Python's logging module and provides storage backends.
 import logging
 import sys
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Callable, Optional, Dict, Any, Iterator, List
 from pathlib import Path
 import json
 import threading
+from collections import deque
+from itertools import islice
 
 from .log_storage import LogStorage, FileLogStorage, LogEntry
 
@@ -18,9 +20,15 @@ class StorageHandler(logging.Handler):
     Custom logging handler that writes to a LogStorage backend.
     """
 
-    def __init__(self, storage: LogStorage, level: int = logging.DEBUG):
+    def __init__(
+        self,
+        storage: LogStorage,
+        level: int = logging.DEBUG,
+        on_entry: Optional[Callable[[LogEntry], None]] = None
+    ):
         super().__init__(level)
         self.storage = storage
+        self.on_entry = on_entry
 
     def emit(self, record: logging.LogRecord):
         try:
@@ -45,10 +53,16 @@ class StorageHandler(logging.Handler):
             )
 
             self.storage.write(entry)
+            if self.on_entry is not None:
+                self.on_entry(entry)
         except Exception:
             self.handleError(record)
 
 
+# How many recent errors/warnings LogManager keeps in memory
+RECENT_LOGS_SIZE = 1024
+
+
 class LogManager:
     """
     Singleton log manager for the live trading application.
@@ -95,6 +109,17 @@ class LogManager:
         # Track configured loggers
         self._configured_loggers: set = set()
 
+        # Most recent errors/warnings, appended by the storage handler so the
+        # polled "recent" endpoints don't query the store. Seeded from the
+        # store on first use; only trusted once the handler is attached.
+        self._recent: Dict[str, deque] = {
+            "ERROR": deque(maxlen=RECENT_LOGS_SIZE),
+            "WARNING": deque(maxlen=RECENT_LOGS_SIZE),
+        }
+        self._recent_lock = threading.Lock()
+        self._recent_seeded = False
+        self._storage_handler: Optional[StorageHandler] = None
+
         self._initialized = True
 
     def setup_logging(self, app_name: str = "live_trading"):
@@ -121,8 +146,9 @@ class LogManager:
         root_logger.addHandler(console_handler)
 
         # Storage handler (writes to files)
-        storage_handler = StorageHandler(self.storage, level=self.file_level)
+        storage_handler = StorageHandler(self.storage, level=self.file_level, on_entry=self._remember)
         root_logger.addHandler(storage_handler)
+        self._storage_handler = storage_handler
 
         # Configure specific loggers
         self._configure_app_loggers(app_name)
@@ -186,6 +212,48 @@ class LogManager:
         )
         return [entry.to_dict() for entry in entries]
 
+    def iter_logs(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        level: Optional[str] = None,
+        logger: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: int = 1000,
+        offset: int = 0
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Like get_logs(), but yields log entry dictionaries one at a time
+        so large result sets are never held in memory at once.
+        """
+        for entry in self.storage.iter_entries(
+            start_time=start_time,
+            end_time=end_time,
+            level=level,
+            logger=logger,
+            search=search,
+            limit=limit,
+            offset=offset
+        ):
+            yield entry.to_dict()
+
+    def count_logs(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        level: Optional[str] = None,
+        logger: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> int:
+        """Count logs matching the same filters as get_logs()"""
+        return self.storage.count(
+            start_time=start_time,
+            end_time=end_time,
+            level=level,
+            logger=logger,
+            search=search
+        )
+
     def get_stats(self) -> Dict[str, Any]:
         """Get logging statistics"""
         stats = self.storage.get_stats()
@@ -196,13 +264,55 @@ class LogManager:
         """Clean up old log files"""
         return self.storage.cleanup(older_than_days)
 
+    def _remember(self, entry: LogEntry):
+        """Storage handler hook: keep errors/warnings in the recent buffers"""
+        recent = self._recent.get(entry.level)
+        if recent is not None:
+            with self._recent_lock:
+                recent.append(entry.to_dict())
+
+    def _recent_logs(self, level: str, limit: int) -> List[Dict[str, Any]]:
+        """Newest-first entries for a level from the in-memory buffer"""
+        # Without our handler nothing feeds the buffers (e.g. the CLI reading
+        # a daemon's logs), and deeper requests than the buffer need the store
+        if self._storage_handler is None or limit > RECENT_LOGS_SIZE:
+            return self.get_logs(level=level, limit=limit)
+
+        if not self._recent_seeded:
+            self._seed_recent()
+        with self._recent_lock:
+            return list(islice(reversed(self._recent[level]), limit))
+
+    def _seed_recent(self):
+        """Fill the recent buffers with what was logged before the handler"""
+        # Read without holding the lock: the read path may itself log, and
+        # the handler takes the lock while emitting
+        stored = {
+            name: self.get_logs(level=name, limit=RECENT_LOGS_SIZE)
+            for name in self._recent
+        }
+        with self._recent_lock:
+            if self._recent_seeded:
+                return
+            for name, recent in self._recent.items():
+                entries = list(reversed(stored[name]))
+                # Entries emitted while reading may or may not be in the store
+                seen = {(e["timestamp"], e["logger"], e["message"]) for e in entries}
+                entries.extend(
+                    e for e in recent
+                    if (e["timestamp"], e["logger"], e["message"]) not in seen
+                )
+                recent.clear()
+                recent.extend(entries)
+            self._recent_seeded = True
+
     def get_recent_errors(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Shortcut to get recent errors"""
-        return self.get_logs(level="ERROR", limit=limit)
+        return self._recent_logs("ERROR", limit)
 
     def get_recent_warnings(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Shortcut to get recent warnings"""
-        return self.get_logs(level="WARNING", limit=limit)
+        return self._recent_logs("WARNING", limit)
 
 
 # Global instance access
@@ -2,18 +2,29 @@
 Modular log storage backends.
 Designed to be extensible - can add database storage, cloud storage, etc.
 """
+import atexit
 import os
 import json
 import gzip
+import io
+import logging
 import shutil
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Generator
+from typing import List, Dict, Any, Optional, Generator, Iterator, Tuple
 from dataclasses import dataclass, asdict
+import queue
+import sqlite3
 import threading
 import re
 
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
 
 @dataclass
 class LogEntry:
@@ -61,6 +72,31 @@ class LogStorage(ABC):
         """Read log entries with optional filters"""
         pass
 
+    def iter_entries(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        level: Optional[str] = None,
+        logger: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: int = 1000,
+        offset: int = 0
+    ) -> Iterator[LogEntry]:
+        """Yield log entries with optional filters (backends may stream)"""
+        return iter(self.read(start_time, end_time, level, logger, search, limit, offset))
+
+    @abstractmethod
+    def count(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        level: Optional[str] = None,
+        logger: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> int:
+        """Count log entries matching the same filters as read()"""
+        pass
+
     @abstractmethod
     def get_stats(self) -> Dict[str, Any]:
         """Get storage statistics"""
@@ -72,6 +108,340 @@ class LogStorage(ABC):
         pass
 
 
+def _probe_fts5() -> bool:
+    """Check whether the bundled SQLite has FTS5 with the trigram tokenizer."""
+    try:
+        conn = sqlite3.connect(":memory:")
+        try:
+            conn.execute("CREATE VIRTUAL TABLE probe USING fts5(x, tokenize='trigram')")
+        finally:
+            conn.close()
+        return True
+    except sqlite3.Error:
+        return False
+
+
+HAS_FTS5 = _probe_fts5()
+
+
+def _to_epoch(value: datetime) -> float:
+    """Convert a datetime to a UTC epoch (naive values are taken as UTC)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _level_number(level: str) -> Optional[int]:
+    """Numeric logging level for a level name, or None if it isn't one"""
+    number = logging.getLevelName(level.upper())
+    return number if isinstance(number, int) else None
+
+
+class SQLiteLogIndex:
+    """
+    SQLite sidecar index over the JSON-lines log files.
+
+    Every entry written to the files is mirrored into a ``logs`` table with
+    an FTS5 trigram table over message/extra, so filtered reads are index
+    lookups instead of a scan over every file. Search is a case-insensitive
+    substring match, like the file scan; it falls back to LIKE for terms
+    shorter than a trigram or when the SQLite build lacks FTS5. Only one process writes the index (see
+    FileLogStorage._lock_index); others open it with ``read_only=True``.
+    """
+
+    # Bump when the schema changes; an index with another version is
+    # dropped and rebuilt from the log files
+    SCHEMA_VERSION = 2
+
+    def __init__(self, db_path: Path, read_only: bool = False):
+        self.db_path = db_path
+        self.read_only = read_only
+        self._lock = threading.Lock()
+        if read_only:
+            # Another process owns the index; never create, clear or write it
+            self._conn = sqlite3.connect(
+                f"{db_path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+            )
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != self.SCHEMA_VERSION:
+                self._conn.close()
+                raise sqlite3.OperationalError(f"log index schema version {version}")
+            return
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        with self._lock, self._conn:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != self.SCHEMA_VERSION:
+                # Dropping the tables drops their triggers too
+                self._conn.executescript("""
+                    DROP TABLE IF EXISTS logs_fts;
+                    DROP TABLE IF EXISTS logs;
+                    DROP TABLE IF EXISTS log_index_meta;
+                """)
+                self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS logs (
+                    id INTEGER PRIMARY KEY,
+                    ts REAL NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    level TEXT NOT NULL,
+                    levelno INTEGER,
+                    logger TEXT NOT NULL,
+                    message TEXT NOT NULL,
+                    extra TEXT
+                );
+                -- Ascending indexes: scanned backwards they yield exactly
+                -- ORDER BY ts DESC, id DESC (rowid is the implicit tail key)
+                CREATE INDEX IF NOT EXISTS ix_logs_ts ON logs(ts);
+                CREATE INDEX IF NOT EXISTS ix_logs_levelno_ts ON logs(levelno, ts);
+                CREATE TABLE IF NOT EXISTS log_index_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            """)
+            if HAS_FTS5:
+                self._conn.executescript("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS logs_fts USING fts5(
+                        message, extra,
+                        content='logs', content_rowid='id',
+                        tokenize="trigram case_sensitive 0"
+                    );
+                    CREATE TRIGGER IF NOT EXISTS logs_ai AFTER INSERT ON logs BEGIN
+                        INSERT INTO logs_fts(rowid, message, extra)
+                        VALUES (new.id, new.message, new.extra);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS logs_ad AFTER DELETE ON logs BEGIN
+                        INSERT INTO logs_fts(logs_fts, rowid, message, extra)
+                        VALUES ('delete', old.id, old.message, old.extra);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS logs_au AFTER UPDATE ON logs BEGIN
+                        INSERT INTO logs_fts(logs_fts, rowid, message, extra)
+                        VALUES ('delete', old.id, old.message, old.extra);
+                        INSERT INTO logs_fts(rowid, message, extra)
+                        VALUES (new.id, new.message, new.extra);
+                    END;
+                """)
+
+    @staticmethod
+    def _row(entry: LogEntry) -> tuple:
+        ts = datetime.fromisoformat(entry.timestamp.replace('Z', '+00:00'))
+        return (
+            _to_epoch(ts),
+            entry.timestamp,
+            entry.level.upper(),
+            _level_number(entry.level),
+            entry.logger,
+            entry.message,
+            json.dumps(entry.extra) if entry.extra else None,
+        )
+
+    def add(self, entry: LogEntry):
+        """Index a single entry"""
+        self.add_many([entry])
+
+    def add_many(self, entries: List[LogEntry]):
+        """Index a batch of entries in one transaction"""
+        rows = []
+        for entry in entries:
+            try:
+                rows.append(self._row(entry))
+            except (ValueError, TypeError, AttributeError):
+                continue
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO logs (ts, timestamp, level, levelno, logger, message, extra) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def is_backfilled(self) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM log_index_meta WHERE key = 'backfilled'"
+            ).fetchone()
+        return row is not None and row[0] == '1'
+
+    def mark_backfilled(self):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO log_index_meta (key, value) VALUES ('backfilled', '1')"
+            )
+
+    def mark_stale(self):
+        """Flag the index as incomplete so the next writer rebuilds it"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM log_index_meta WHERE key = 'backfilled'")
+
+    def clear(self):
+        """Drop all indexed rows (used before a fresh backfill)"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM logs")
+            self._conn.execute("DELETE FROM log_index_meta")
+            if HAS_FTS5:
+                self._conn.execute("INSERT INTO logs_fts(logs_fts) VALUES ('delete-all')")
+
+    @staticmethod
+    def _fts_query(search: str) -> str:
+        """Quote the search text as one phrase so FTS5 syntax is inert"""
+        return '"' + search.replace('"', '""') + '"'
+
+    @staticmethod
+    def _like_pattern(value: str) -> str:
+        escaped = value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return f"%{escaped}%"
+
+    def _where(
+        self,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        level: Optional[str],
+        logger: Optional[str],
+        search: Optional[str]
+    ) -> Tuple[str, str, list]:
+        """Build the FROM/JOIN and WHERE clauses shared by the read queries"""
+        join = ""
+        clauses = []
+        params: list = []
+
+        if search:
+            # A trigram phrase matches any substring of at least 3 characters
+            if HAS_FTS5 and len(search) >= 3:
+                join = " JOIN logs_fts ON logs_fts.rowid = logs.id"
+                clauses.append("logs_fts MATCH ?")
+                params.append(self._fts_query(search.strip()))
+            else:
+                pattern = self._like_pattern(search)
+                clauses.append("(logs.message LIKE ? ESCAPE '\\' OR logs.extra LIKE ? ESCAPE '\\')")
+                params.extend([pattern, pattern])
+        if level:
+            # Standard levels filter on the indexed integer; anything else
+            # falls back to the stored name
+            number = _level_number(level)
+            if number is not None:
+                clauses.append("logs.levelno = ?")
+                params.append(number)
+            else:
+                clauses.append("logs.level = ?")
+                params.append(level.upper())
+        if logger:
+            clauses.append("logs.logger LIKE ? ESCAPE '\\'")
+            params.append(self._like_pattern(logger))
+        if start_time:
+            clauses.append("logs.ts >= ?")
+            params.append(_to_epoch(start_time))
+        if end_time:
+            clauses.append("logs.ts <= ?")
+            params.append(_to_epoch(end_time))
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return join, where, params
+
+    def _select(
+        self,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        level: Optional[str],
+        logger: Optional[str],
+        search: Optional[str],
+        limit: int,
+        offset: int
+    ) -> Tuple[str, tuple]:
+        join, where, params = self._where(start_time, end_time, level, logger, search)
+        sql = (
+            "SELECT logs.timestamp, logs.level, logs.logger, logs.message, logs.extra "
+            f"FROM logs{join}{where} ORDER BY logs.ts DESC, logs.id DESC LIMIT ? OFFSET ?"
+        )
+        return sql, (*params, limit, offset)
+
+    @staticmethod
+    def _entry(row: tuple) -> LogEntry:
+        timestamp, level, logger, message, extra = row
+        return LogEntry(
+            timestamp=timestamp,
+            level=level,
+            logger=logger,
+            message=message,
+            extra=json.loads(extra) if extra else None
+        )
+
+    def query(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        level: Optional[str] = None,
+        logger: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: int = 1000,
+        offset: int = 0
+    ) -> List[LogEntry]:
+        """Return matching entries, newest first"""
+        sql, params = self._select(start_time, end_time, level, logger, search, limit, offset)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def iter_query(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        level: Optional[str] = None,
+        logger: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: int = 1000,
+        offset: int = 0,
+        batch_size: int = 500
+    ) -> Iterator[LogEntry]:
+        """
+        Yield matching entries, newest first, straight from the cursor.
+
+        Uses its own read-only connection (WAL readers don't block the
+        writer), so a slow consumer never holds up log writes.
+        """
+        sql, params = self._select(start_time, end_time, level, logger, search, limit, offset)
+        conn = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+        )
+        try:
+            cursor = conn.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._entry(row)
+        finally:
+            conn.close()
+
+    def count(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        level: Optional[str] = None,
+        logger: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> int:
+        """Count matching entries without materialising them"""
+        join, where, params = self._where(start_time, end_time, level, logger, search)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM logs{join}{where}", params).fetchone()[0]
+
+    def delete_before(self, cutoff: datetime) -> int:
+        """Drop indexed entries older than ``cutoff``"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM logs WHERE ts < ?", (_to_epoch(cutoff),))
+        return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
 class FileLogStorage(LogStorage):
     """
     File-based log storage with rotation and compression.
@@ -83,15 +453,20 @@ class FileLogStorage(LogStorage):
         live_trading.log.2.gz     # Compressed older file
         archive/
             2026-01-20.log.gz     # Daily archives
+        log_index.db              # SQLite query index (see SQLiteLogIndex)
     """
 
+    # Most queued entries the index writer inserts per transaction
+    INDEX_BATCH_SIZE = 500
+
     def __init__(
         self,
         log_dir: str = "logs",
         max_file_size_mb: int = 10,
         max_files: int = 5,
         compress_after: int = 2,
-        archive_daily: bool = True
+        archive_daily: bool = True,
+        use_index: bool = True
     ):
         self.log_dir = Path(log_dir)
         self.max_file_size = max_file_size_mb * 1024 * 1024  # Convert to bytes
@@ -103,11 +478,191 @@ class FileLogStorage(LogStorage):
         self.archive_dir = self.log_dir / "archive"
 
         self._write_lock = threading.Lock()
+        # Bumped on every rotation so callers caching file listings can
+        # tell when files have been renamed
+        self.rotation_count = 0
 
         # Create directories
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self.archive_dir.mkdir(parents=True, exist_ok=True)
 
+        # Query index; reads fall back to scanning the files until it is ready.
+        # Index writes are queued and applied by a background thread so the
+        # logging call itself only appends to the queue.
+        self.index: Optional[SQLiteLogIndex] = None
+        self._index_ready = threading.Event()
+        self._index_queue: Optional[queue.Queue] = None
+        self._index_lock_file = None
+        if use_index:
+            self._open_index()
+
+    def _open_index(self):
+        """Open the SQLite index, backfilling it from the files on first use"""
+        if not self._lock_index():
+            # Another process (e.g. the daemon while the CLI reads logs)
+            # maintains the index; only query it, and only once complete
+            try:
+                index = SQLiteLogIndex(self.log_dir / "log_index.db", read_only=True)
+                if index.is_backfilled():
+                    self.index = index
+                    self._index_ready.set()
+                else:
+                    index.close()
+            except sqlite3.Error:
+                pass
+            return
+
+        try:
+            index = SQLiteLogIndex(self.log_dir / "log_index.db")
+            if index.is_backfilled():
+                self._index_ready.set()
+                self._start_index_writer(index, None)
+                return
+            index.clear()
+        except sqlite3.Error:
+            return
+
+        # Open the existing files and start queueing new writes under the
+        # same lock, so every entry is indexed exactly once even if a rotation
+        # happens while the backfill is running.
+        with self._write_lock:
+            sources = []
+            for path in self._log_files():
+                try:
+                    size = path.stat().st_size if path == self.current_file else None
+                    sources.append((open(path, 'rb'), size, str(path).endswith('.gz')))
+                except OSError:
+                    continue
+            self._start_index_writer(index, sources)
+
+    def _lock_index(self) -> bool:
+        """
+        Take the advisory lock that makes this process the index writer.
+        Held until the process exits; False if another process holds it.
+        """
+        if not HAS_FCNTL:
+            return True
+        try:
+            lock_file = open(self.log_dir / "log_index.lock", 'a')
+        except OSError:
+            return False
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._index_lock_file = lock_file
+        return True
+
+    def _start_index_writer(self, index: 'SQLiteLogIndex', sources: Optional[list]):
+        """Start the thread that owns all writes to the index"""
+        self.index = index
+        self._index_queue = queue.Queue()
+        self._index_writer = threading.Thread(
+            target=self._run_index_writer,
+            args=(index, self._index_queue, sources),
+            name="log-index-writer",
+            daemon=True
+        )
+        self._index_writer.start()
+        # Index whatever is still queued when the process exits
+        atexit.register(self._stop_index_writer)
+
+    def _stop_index_writer(self, timeout: float = 5.0):
+        """Apply the queued index writes and stop the writer thread"""
+        index_queue = self._index_queue
+        if index_queue is None:
+            return
+        index_queue.put(None)
+        self._index_writer.join(timeout)
+
+    def _run_index_writer(self, index: 'SQLiteLogIndex', index_queue: queue.Queue, sources: Optional[list]):
+        """
+        Index writer thread: backfill first (if needed), then apply queued
+        entries in batches, in the order they were written. A queued datetime
+        prunes the rows older than it (a rotated-out file); None stops.
+        """
+        if sources is not None:
+            if not self._backfill_index(index, sources):
+                self._disable_index()
+                return
+            self._index_ready.set()
+
+        while True:
+            item = index_queue.get()
+            items = [item]
+            while item is not None and len(items) < self.INDEX_BATCH_SIZE:
+                try:
+                    item = index_queue.get_nowait()
+                except queue.Empty:
+                    break
+                items.append(item)
+
+            stop = items[-1] is None
+            try:
+                entries = []
+                for item in items:
+                    if isinstance(item, LogEntry):
+                        entries.append(item)
+                    elif item is not None:
+                        index.add_many(entries)
+                        entries = []
+                        index.delete_before(item)
+                index.add_many(entries)
+            except sqlite3.Error:
+                self._disable_index()
+                return
+            finally:
+                for _ in items:
+                    index_queue.task_done()
+            if stop:
+                return
+
+    def _disable_index(self):
+        """
+        Stop using the index in this process; reads go back to the files.
+
+        The shared index is left in place (other processes may be reading
+        it), only flagged so the next start rebuilds it from the files.
+        """
+        self._index_ready.clear()
+        self._index_queue = None
+        index, self.index = self.index, None
+        if index is not None:
+            try:
+                index.mark_stale()
+            except sqlite3.Error:
+                pass
+
+    def _backfill_index(self, index: 'SQLiteLogIndex', sources: list) -> bool:
+        """Import entries that were written before the index existed"""
+        try:
+            for handle, size, compressed in sources:
+                with handle:
+                    if compressed:
+                        stream = gzip.open(handle, 'rb')
+                    else:
+                        stream = io.BytesIO(handle.read(size))
+                    with stream:
+                        batch = []
+                        for line in stream:
+                            line = line.strip()
+                            if not line:
+                                continue
+                            try:
+                                batch.append(LogEntry.from_json_line(line.decode('utf-8')))
+                            except (ValueError, TypeError):
+                                continue
+                            if len(batch) >= 1000:
+                                index.add_many(batch)
+                                batch = []
+                        index.add_many(batch)
+            index.mark_backfilled()
+            return True
+        except (OSError, EOFError, sqlite3.Error):
+            # Leave the index unmarked; reads keep scanning the files
+            return False
+
     def write(self, entry: LogEntry):
         """Write a log entry to file with rotation"""
         with self._write_lock:
@@ -119,15 +674,23 @@ class FileLogStorage(LogStorage):
             with open(self.current_file, 'a', encoding='utf-8') as f:
                 f.write(entry.to_json_line() + '\n')
 
+            # Indexed by the writer thread; no SQLite work on the logging path
+            index_queue = self._index_queue
+            if index_queue is not None:
+                index_queue.put(entry)
+
     def _rotate(self):
         """Rotate log files"""
         # Remove oldest file if at limit
+        dropped = False
         oldest = self.log_dir / f"live_trading.log.{self.max_files}"
         if oldest.exists():
             oldest.unlink()
+            dropped = True
         oldest_gz = self.log_dir / f"live_trading.log.{self.max_files}.gz"
         if oldest_gz.exists():
             oldest_gz.unlink()
+            dropped = True
 
         # Shift existing files
         for i in range(self.max_files - 1, 0, -1):
@@ -152,6 +715,36 @@ class FileLogStorage(LogStorage):
         if self.current_file.exists():
             self.current_file.rename(self.log_dir / "live_trading.log.1")
 
+        self.rotation_count += 1
+
+        # Entries are written in time order, so everything the dropped file
+        # held is older than the first entry of the oldest file still kept
+        index_queue = self._index_queue
+        if dropped and index_queue is not None:
+            cutoff = self._oldest_kept_timestamp()
+            if cutoff is not None:
+                index_queue.put(cutoff)
+
+    def _oldest_kept_timestamp(self) -> Optional[datetime]:
+        """Timestamp of the first entry in the oldest rotated file"""
+        for i in range(self.max_files, 0, -1):
+            for path in (self.log_dir / f"live_trading.log.{i}",
+                         self.log_dir / f"live_trading.log.{i}.gz"):
+                if not path.exists():
+                    continue
+                try:
+                    opener = gzip.open if path.name.endswith('.gz') else open
+                    with opener(path, 'rt', encoding='utf-8') as f:
+                        for line in f:
+                            line = line.strip()
+                            if line:
+                                timestamp = LogEntry.from_json_line(line).timestamp
+                                return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+                except (OSError, EOFError, ValueError, TypeError):
+                    pass
+                return None
+        return None
+
     def read(
         self,
         start_time: Optional[datetime] = None,
@@ -163,7 +756,45 @@ class FileLogStorage(LogStorage):
         offset: int = 0
     ) -> List[LogEntry]:
         """Read log entries with filters"""
-        entries = []
+        index = self.index
+        if index is not None and self._index_ready.is_set():
+            try:
+                return index.query(start_time, end_time, level, logger, search, limit, offset)
+            except sqlite3.Error:
+                pass
+
+        return list(self._scan_files(start_time, end_time, level, logger, search, limit, offset))
+
+    def iter_entries(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        level: Optional[str] = None,
+        logger: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: int = 1000,
+        offset: int = 0
+    ) -> Iterator[LogEntry]:
+        """Like read(), but yields entries as they are fetched"""
+        index = self.index
+        if index is not None and self._index_ready.is_set():
+            return index.iter_query(start_time, end_time, level, logger, search, limit, offset)
+        return self._scan_files(start_time, end_time, level, logger, search, limit, offset)
+
+    def _scan_files(
+        self,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        level: Optional[str],
+        logger: Optional[str],
+        search: Optional[str],
+        limit: int,
+        offset: int
+    ) -> Generator[LogEntry, None, None]:
+        """Filter entries from the log files, newest first"""
+        if limit <= 0:
+            return
+        yielded = 0
         skipped = 0
 
         # Read from all log files (newest first)
@@ -177,15 +808,35 @@ class FileLogStorage(LogStorage):
                 skipped += 1
                 continue
 
-            entries.append(entry)
+            yield entry
+            yielded += 1
 
-            if len(entries) >= limit:
+            if yielded >= limit:
                 break
 
-        return entries
+    def count(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        level: Optional[str] = None,
+        logger: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> int:
+        """Count log entries matching filters"""
+        index = self.index
+        if index is not None and self._index_ready.is_set():
+            try:
+                return index.count(start_time, end_time, level, logger, search)
+            except sqlite3.Error:
+                pass
 
-    def _read_all_files(self) -> Generator[LogEntry, None, None]:
-        """Read entries from all log files, newest first"""
+        return sum(
+            1 for entry in self._read_all_files()
+            if self._matches_filters(entry, start_time, end_time, level, logger, search)
+        )
+
+    def _log_files(self) -> List[Path]:
+        """All log files, newest first"""
         files_to_read = []
 
         # Current file (newest)
@@ -208,9 +859,11 @@ class FileLogStorage(LogStorage):
             reverse=True  # Newest archives first (2026-01-23 before 2026-01-22)
         )
         files_to_read.extend(archive_files)
+        return files_to_read
 
-        # Read files
-        for file_path in files_to_read:
+    def _read_all_files(self) -> Generator[LogEntry, None, None]:
+        """Read entries from all log files, newest first"""
+        for file_path in self._log_files():
             try:
                 # Read file (handle gzip)
                 if str(file_path).endswith('.gz'):
@@ -256,9 +909,14 @@ class FileLogStorage(LogStorage):
             except ValueError:
                 pass
 
-        # Level filter
-        if level and entry.level.upper() != level.upper():
-            return False
+        # Level filter, resolving aliases (WARN/WARNING) like the index does
+        if level:
+            number = _level_number(level)
+            if number is not None:
+                if _level_number(entry.level) != number:
+                    return False
+            elif entry.level.upper() != level.upper():
+                return False
 
         # Logger filter
         if logger and logger.lower() not in entry.logger.lower():
@@ -331,7 +989,15 @@ class FileLogStorage(LogStorage):
                     file_path.unlink()
                     removed += 1
 
-        return {"removed_files": removed}
+        result = {"removed_files": removed}
+        if self.index is not None:
+            try:
+                result["removed_index_entries"] = self.index.delete_before(
+                    datetime.now(timezone.utc) - timedelta(days=older_than_days)
+                )
+            except sqlite3.Error:
+                pass
+        return result
 
     def archive_current_day(self):
         """Archive today's logs (called at midnight)"""
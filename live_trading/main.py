@@ -12,6 +12,20 @@ import uvicorn
 
 from live_trading.config import config
 
+# uvloop and httptools ship with uvicorn[standard] (uvloop is unavailable on
+# Windows); fall back to the asyncio loop and h11 parser when missing
+try:
+    import uvloop  # noqa: F401
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+try:
+    import httptools  # noqa: F401
+    HAS_HTTPTOOLS = True
+except ImportError:
+    HAS_HTTPTOOLS = False
+
 # Global state
 _shutdown_requested = False
 _daemon_mode = False
@@ -93,6 +107,10 @@ def main():
     logger.info(f"Broker Type (from env): {broker_type_env}")
     logger.info(f"Broker Type (configured): {config.BROKER_TYPE}")
     logger.info(f"API Server: {config.API_HOST}:{config.API_PORT}")
+    logger.info(
+        f"Event loop: {'uvloop' if HAS_UVLOOP else 'asyncio'}, "
+        f"HTTP parser: {'httptools' if HAS_HTTPTOOLS else 'h11'}"
+    )
     logger.info(f"Log Directory: {args.log_dir}")
     logger.info(f"PID: {os.getpid()}")
 
@@ -108,6 +126,8 @@ def main():
             port=config.API_PORT,
             log_level=config.LOG_LEVEL.lower(),
             reload=False,
+            loop="uvloop" if HAS_UVLOOP else "asyncio",
+            http="httptools" if HAS_HTTPTOOLS else "h11",
             access_log=not _daemon_mode  # Disable access log in daemon mode (handled by our logger)
         )
     except KeyboardInterrupt:
@@ -34,6 +34,8 @@ class MarketData(Document):
             "operation_id",
             [("operation_id", ASCENDING), ("bar_size", ASCENDING), ("timestamp", DESCENDING)],
             [("operation_id", ASCENDING), ("bar_size", ASCENDING), ("timestamp", ASCENDING)],
+            # Serves market data listings across all bar sizes, sorted by timestamp
+            [("operation_id", ASCENDING), ("timestamp", DESCENDING)],
             # Note: Unique constraint is handled at application level in data_manager.py
             # to avoid startup failures when duplicates exist. See _process_completed_bar()
         ]
@@ -0,0 +1,256 @@
+"""
+Tests for subscription tracking and tick batching in the broker base class.
+"""
+import asyncio
+import threading
+
+from live_trading.brokers.base_broker import BaseBroker, SubscriptionMap, TickBatcher
+
+
+class FakeBroker(BaseBroker):
+    """Broker that records subscriptions and lets tests push ticks"""
+
+    def __init__(self):
+        self.callbacks = {}
+
+    async def connect(self) -> bool:
+        return True
+
+    async def disconnect(self):
+        pass
+
+    async def subscribe_market_data(self, asset, callback, callback_id=None):
+        self.callbacks[(asset, callback_id)] = callback
+        return True
+
+    async def unsubscribe_market_data(self, asset, callback_id=None):
+        self.callbacks.pop((asset, callback_id), None)
+
+    async def place_order(self, *args, **kwargs):
+        return None
+
+    async def cancel_order(self, broker_order_id):
+        return True
+
+    async def get_positions(self):
+        return []
+
+    async def get_account_info(self):
+        return {}
+
+
+def _tick(i):
+    return {"price": 1.1 + i / 10000, "size": 1, "index": i}
+
+
+class TestSubscriptionMap:
+    """Tests for the SubscriptionMap class"""
+
+    def test_snapshot_is_cached_until_change(self):
+        """Test that repeated snapshots reuse the same tuple"""
+        subscriptions = SubscriptionMap({"EUR.USD": 1, "GBP.USD": 2})
+
+        snapshot = subscriptions.keys_snapshot()
+
+        assert snapshot == ("EUR.USD", "GBP.USD")
+        assert subscriptions.keys_snapshot() is snapshot
+
+    def test_setitem_new_key_invalidates_snapshot(self):
+        """Test that adding an asset shows up in the next snapshot"""
+        subscriptions = SubscriptionMap({"EUR.USD": 1})
+        subscriptions.keys_snapshot()
+
+        subscriptions["GBP.USD"] = 2
+
+        assert subscriptions.keys_snapshot() == ("EUR.USD", "GBP.USD")
+
+    def test_setitem_existing_key_keeps_snapshot(self):
+        """Test that replacing a handle doesn't rebuild the key snapshot"""
+        subscriptions = SubscriptionMap({"EUR.USD": 1})
+        snapshot = subscriptions.keys_snapshot()
+
+        subscriptions["EUR.USD"] = 2
+
+        assert subscriptions.keys_snapshot() is snapshot
+        assert subscriptions["EUR.USD"] == 2
+
+    def test_delitem_invalidates_snapshot(self):
+        """Test that deleting an asset removes it from the snapshot"""
+        subscriptions = SubscriptionMap({"EUR.USD": 1, "GBP.USD": 2})
+        subscriptions.keys_snapshot()
+
+        del subscriptions["EUR.USD"]
+
+        assert subscriptions.keys_snapshot() == ("GBP.USD",)
+
+    def test_pop_invalidates_snapshot(self):
+        """Test that pop and popitem remove assets from the snapshot"""
+        subscriptions = SubscriptionMap({"EUR.USD": 1, "GBP.USD": 2, "USD.JPY": 3})
+        subscriptions.keys_snapshot()
+
+        assert subscriptions.pop("EUR.USD") == 1
+        assert subscriptions.keys_snapshot() == ("GBP.USD", "USD.JPY")
+
+        assert subscriptions.popitem() == ("USD.JPY", 3)
+        assert subscriptions.keys_snapshot() == ("GBP.USD",)
+
+        # Missing key with a default leaves the map unchanged
+        assert subscriptions.pop("AUD.USD", None) is None
+        assert subscriptions.keys_snapshot() == ("GBP.USD",)
+
+    def test_update_and_setdefault_invalidate_snapshot(self):
+        """Test that bulk updates show up in the next snapshot"""
+        subscriptions = SubscriptionMap({"EUR.USD": 1})
+        subscriptions.keys_snapshot()
+
+        subscriptions.update({"GBP.USD": 2}, USDJPY=3)
+        assert subscriptions.keys_snapshot() == ("EUR.USD", "GBP.USD", "USDJPY")
+
+        subscriptions.setdefault("AUD.USD", 4)
+        assert subscriptions.keys_snapshot() == ("EUR.USD", "GBP.USD", "USDJPY", "AUD.USD")
+
+    def test_clear_invalidates_snapshot(self):
+        """Test that clearing the map empties the snapshot"""
+        subscriptions = SubscriptionMap({"EUR.USD": 1})
+        subscriptions.keys_snapshot()
+
+        subscriptions.clear()
+
+        assert subscriptions.keys_snapshot() == ()
+
+
+class TestTickBatcher:
+    """Tests for the TickBatcher class"""
+
+    def test_ticks_from_threads_are_batched(self):
+        """Test that ticks pushed from several threads arrive in few batches"""
+        batches = []
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            batcher = TickBatcher(batches.append, 0.05, loop)
+
+            def push(start):
+                for i in range(start, start + 100):
+                    batcher(_tick(i))
+
+            threads = [threading.Thread(target=push, args=(n * 100,)) for n in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            await asyncio.sleep(0.2)
+
+        asyncio.run(run())
+
+        delivered = [tick["index"] for batch in batches for tick in batch]
+        # Every tick arrives exactly once
+        assert sorted(delivered) == list(range(400))
+        # Ticks within one window are coalesced, not delivered one by one
+        assert len(batches) < 400
+
+    def test_flush_runs_on_the_event_loop_thread(self):
+        """Test that the callback runs on the loop thread, not the caller's"""
+        callback_threads = []
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            batcher = TickBatcher(
+                lambda ticks: callback_threads.append(threading.get_ident()), 0.01, loop
+            )
+            thread = threading.Thread(target=batcher, args=(_tick(0),))
+            thread.start()
+            thread.join()
+            await asyncio.sleep(0.1)
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(run())
+
+        assert callback_threads == [loop_thread]
+
+    def test_zero_window_flushes_on_next_loop_iteration(self):
+        """Test that a zero window still delivers pending ticks"""
+        batches = []
+
+        async def run():
+            batcher = TickBatcher(batches.append, 0, asyncio.get_running_loop())
+            batcher(_tick(0))
+            batcher(_tick(1))
+            # Nothing is delivered synchronously
+            assert batches == []
+            await asyncio.sleep(0.01)
+            batcher(_tick(2))
+            await asyncio.sleep(0.01)
+
+        asyncio.run(run())
+
+        assert [[tick["index"] for tick in batch] for batch in batches] == [[0, 1], [2]]
+
+    def test_flush_without_pending_ticks_skips_callback(self):
+        """Test that an empty flush does not call the callback"""
+        batches = []
+
+        async def run():
+            TickBatcher(batches.append, 0, asyncio.get_running_loop()).flush()
+
+        asyncio.run(run())
+
+        assert batches == []
+
+    def test_callback_error_does_not_stop_batching(self):
+        """Test that a failing callback doesn't block later batches"""
+        batches = []
+
+        def callback(ticks):
+            batches.append(ticks)
+            if len(batches) == 1:
+                raise ValueError("boom")
+
+        async def run():
+            batcher = TickBatcher(callback, 0, asyncio.get_running_loop())
+            batcher(_tick(0))
+            await asyncio.sleep(0.01)
+            batcher(_tick(1))
+            await asyncio.sleep(0.01)
+
+        asyncio.run(run())
+
+        assert len(batches) == 2
+
+
+class TestSubscribeMarketDataBatch:
+    """Tests for BaseBroker.subscribe_market_data_batch"""
+
+    def test_subscribes_batcher_with_window_in_seconds(self):
+        """Test that the broker receives a TickBatcher for the callback"""
+        broker = FakeBroker()
+        batches = []
+
+        async def run():
+            result = await broker.subscribe_market_data_batch(
+                "EUR.USD", batches.append, callback_id="strategy-1", batch_window_ms=20
+            )
+            batcher = broker.callbacks[("EUR.USD", "strategy-1")]
+            assert result is True
+            assert isinstance(batcher, TickBatcher)
+            assert batcher._window == 0.02
+
+            batcher(_tick(0))
+            batcher(_tick(1))
+            await asyncio.sleep(0.1)
+
+        asyncio.run(run())
+
+        assert [[tick["index"] for tick in batch] for batch in batches] == [[0, 1]]
+
+    def test_unsubscribe_with_same_callback_id(self):
+        """Test that the batched subscription is removed by callback_id"""
+        broker = FakeBroker()
+
+        async def run():
+            await broker.subscribe_market_data_batch("EUR.USD", list, callback_id="strategy-1")
+            await broker.unsubscribe_market_data("EUR.USD", "strategy-1")
+
+        asyncio.run(run())
+
+        assert broker.callbacks == {}
@@ -0,0 +1,80 @@
+"""
+Tests for filtered reads in the file log storage.
+"""
+import pytest
+from datetime import datetime, timedelta
+
+from live_trading.logging.log_storage import FileLogStorage, LogEntry
+
+
+ENTRIES = [
+    ("INFO", "Order filled EURUSD", None),
+    ("ERROR", "Connection error", None),
+    ("WARNING", "Slow tick", None),
+    ("WARNING", "Spread wide", None),
+    ("INFO", "Heartbeat ok", {"asset": "GBPUSD"}),
+]
+
+
+@pytest.fixture
+def storages(tmp_path):
+    """An indexed storage and a file-scan storage over the same log files"""
+    indexed = FileLogStorage(str(tmp_path))
+    assert indexed._index_ready.wait(5)
+
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    for i, (level, message, extra) in enumerate(ENTRIES):
+        indexed.write(LogEntry(
+            timestamp=(base + timedelta(minutes=i)).isoformat() + "Z",
+            level=level,
+            logger="live_trading.engine",
+            message=message,
+            extra=extra,
+        ))
+    indexed._index_queue.join()
+
+    scanning = FileLogStorage(str(tmp_path), use_index=False)
+    yield indexed, scanning
+    indexed._stop_index_writer()
+
+
+def _messages(storage, **filters):
+    return [entry.message for entry in storage.read(**filters)]
+
+
+class TestSearchFilter:
+    """Tests that search gives the same results with and without the index"""
+
+    @pytest.mark.parametrize("search, expected", [
+        ("USD", ["Heartbeat ok", "Order filled EURUSD"]),
+        ("rror", ["Connection error"]),
+        ("FILLED eur", ["Order filled EURUSD"]),
+        ("ok", ["Heartbeat ok"]),
+        ('"asset"', ["Heartbeat ok"]),
+        ("missing", []),
+    ])
+    def test_substring_search_matches_on_both_paths(self, storages, search, expected):
+        """Test that the index and the file scan agree on substring matches"""
+        indexed, scanning = storages
+
+        assert _messages(indexed, search=search) == expected
+        assert _messages(scanning, search=search) == expected
+        assert indexed.count(search=search) == scanning.count(search=search) == len(expected)
+
+
+class TestLevelFilter:
+    """Tests that level filters resolve aliases with and without the index"""
+
+    @pytest.mark.parametrize("level, expected", [
+        ("WARN", ["Spread wide", "Slow tick"]),
+        ("warning", ["Spread wide", "Slow tick"]),
+        ("error", ["Connection error"]),
+        ("CRITICAL", []),
+    ])
+    def test_level_matches_on_both_paths(self, storages, level, expected):
+        """Test that the index and the file scan agree on level filters"""
+        indexed, scanning = storages
+
+        assert _messages(indexed, level=level) == expected
+        assert _messages(scanning, level=level) == expected
+        assert indexed.count(level=level) == scanning.count(level=level) == len(expected)
@@ -0,0 +1,201 @@
+"""
+Tests for the market data API endpoints.
+"""
+import math
+import pytest
+from datetime import datetime
+from bson import ObjectId
+from fastapi.testclient import TestClient
+
+from live_trading.api import main
+from live_trading.models.market_data import MarketData
+
+
+class FakeDeleteResult:
+    def __init__(self, deleted_count):
+        self.deleted_count = deleted_count
+
+
+class FakeAggregation:
+    def __init__(self, docs):
+        self._docs = docs
+
+    async def to_list(self):
+        return list(self._docs)
+
+
+class FakeMarketDataQuery:
+    """Stands in for a Beanie FindMany over an in-memory bar list"""
+
+    def __init__(self, store, query):
+        self._store = store
+        self._query = query
+
+    def _matching(self):
+        if "_id" in self._query:
+            ids = set(self._query["_id"]["$in"])
+            return [bar for bar in self._store.bars if bar["_id"] in ids]
+        return [bar for bar in self._store.bars if bar["_id"] in self._store.invalid_ids]
+
+    async def count(self):
+        self._store.count_calls += 1
+        return len(self._store.bars)
+
+    def aggregate(self, pipeline, **kwargs):
+        return FakeAggregation(self._matching())
+
+    async def delete(self):
+        matching = self._matching()
+        self._store.bars = [bar for bar in self._store.bars if bar not in matching]
+        return FakeDeleteResult(len(matching))
+
+
+class FakeMarketDataStore:
+    def __init__(self, bars, invalid_ids=()):
+        self.bars = bars
+        self.invalid_ids = set(invalid_ids)
+        self.count_calls = 0
+
+    def find(self, *args):
+        # Beanie expressions (MarketData.operation_id == op_id) only occur in
+        # count queries here; the filter itself is not evaluated
+        query = args[0] if args and isinstance(args[0], dict) else {}
+        return FakeMarketDataQuery(self, query)
+
+
+def _bar(o, h, l, c, minute=0):
+    return {
+        "_id": ObjectId(),
+        "bar_size": "1 min",
+        "timestamp": datetime(2024, 1, 15, 14, minute),
+        "open": o,
+        "high": h,
+        "low": l,
+        "close": c,
+        "volume": 100.0,
+    }
+
+
+def _mongo_order(value):
+    """Sort key following MongoDB: NaN below every number, equal to itself"""
+    return (0, 0) if math.isnan(value) else (1, value)
+
+
+_MONGO_OPERATORS = {
+    "$lt": lambda a, b: _mongo_order(a) < _mongo_order(b),
+    "$gt": lambda a, b: _mongo_order(a) > _mongo_order(b),
+    "$ne": lambda a, b: _mongo_order(a) != _mongo_order(b),
+    "$subtract": lambda a, b: a - b,
+    "$divide": lambda a, b: a / b,
+    "$multiply": lambda a, b: a * b,
+}
+
+
+def _evaluate_expr(expr, doc):
+    """Evaluate the subset of aggregation $expr syntax used by the API"""
+    if isinstance(expr, str) and expr.startswith("$"):
+        return doc[expr[1:]]
+    if not isinstance(expr, dict):
+        return expr
+    (op, args), = expr.items()
+    if op == "$or":
+        return any(_evaluate_expr(arg, doc) for arg in args)
+    if op == "$and":
+        return all(_evaluate_expr(arg, doc) for arg in args)
+    return _MONGO_OPERATORS[op](*(_evaluate_expr(arg, doc) for arg in args))
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = FakeMarketDataStore([])
+    monkeypatch.setattr(MarketData, "find", store.find)
+    # Field expressions like MarketData.operation_id exist only after
+    # init_beanie; the fake store ignores them
+    monkeypatch.setattr(MarketData, "operation_id", "operation_id", raising=False)
+    main._market_data_counts.clear()
+    yield store
+    main._market_data_counts.clear()
+
+
+@pytest.fixture
+def client():
+    # No context manager: the lifespan (database, engine) is not started
+    return TestClient(main.app)
+
+
+class TestMarketDataCount:
+    """Tests for GET /market-data/count"""
+
+    def test_count_is_returned_and_cached(self, store, client):
+        """Test that the count is served and reused within the TTL"""
+        store.bars = [_bar(1.1, 1.2, 1.0, 1.15, minute=i) for i in range(3)]
+        op_id = str(ObjectId())
+
+        first = client.get(f"/api/operations/{op_id}/market-data/count")
+        second = client.get(f"/api/operations/{op_id}/market-data/count")
+
+        assert first.status_code == 200
+        assert first.json() == {"count": 3}
+        assert second.json() == {"count": 3}
+        assert store.count_calls == 1
+
+
+class TestCleanupInvalidMarketData:
+    """Tests for POST /market-data/cleanup-invalid"""
+
+    def test_delete_invalidates_cached_count(self, store, client):
+        """Test that deleting invalid bars drops the cached count"""
+        valid = _bar(1.1, 1.2, 1.0, 1.15, minute=0)
+        invalid = _bar(1.1, 1.0, 1.2, 1.15, minute=1)
+        store.bars = [valid, invalid]
+        store.invalid_ids = {invalid["_id"]}
+        op_id = str(ObjectId())
+
+        assert client.get(f"/api/operations/{op_id}/market-data/count").json() == {"count": 2}
+
+        response = client.post(
+            f"/api/operations/{op_id}/market-data/cleanup-invalid",
+            params={"dry_run": False}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["deleted_count"] == 1
+        assert body["invalid_bars_found"] == 1
+        assert body["invalid_bars"][0]["id"] == str(invalid["_id"])
+        assert body["invalid_bars"][0]["reasons"]
+        assert store.bars == [valid]
+
+        # The next count reflects the deletion instead of the cached value
+        assert client.get(f"/api/operations/{op_id}/market-data/count").json() == {"count": 1}
+        assert store.count_calls == 2
+
+
+class TestInvalidOhlcExpr:
+    """Tests that the MongoDB filter and the Python reasons agree"""
+
+    @pytest.mark.parametrize("ohlc", [
+        (1.10, 1.20, 1.00, 1.15),           # valid
+        (1.10, 1.00, 1.20, 1.15),           # high < low
+        (1.10, 1.12, 1.05, 1.13),           # close above high
+        (1.00, 2.00, 1.00, 1.50),           # range too large
+        (1.10, math.nan, 1.00, 1.15),       # NaN high
+        (1.10, 1.20, math.nan, 1.15),       # NaN low
+        (math.nan, 1.02, 1.00, math.nan),   # NaN open and close
+        (math.nan, 1.00, 1.20, 1.15),       # NaN open, high < low
+    ])
+    def test_filter_matches_only_bars_with_reasons(self, ohlc):
+        """Test that a bar is matched exactly when it has reasons"""
+        bar = _bar(*ohlc)
+
+        matched = _evaluate_expr(main._INVALID_OHLC_EXPR, bar)
+        reasons = main._invalid_ohlc_reasons(bar["open"], bar["high"], bar["low"], bar["close"])
+
+        assert matched == bool(reasons)
+
+    def test_nan_priced_bar_is_not_matched(self):
+        """Test that a NaN high is not treated as below the low"""
+        bar = _bar(1.10, math.nan, 1.00, 1.15)
+
+        assert not _evaluate_expr(main._INVALID_OHLC_EXPR, bar)
+        assert main._invalid_ohlc_reasons(bar["open"], bar["high"], bar["low"], bar["close"]) == []